@@ -2,16 +2,19 @@
 
 import logging
 import subprocess
-from functools import lru_cache
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import oci
 import requests
 from oci.container_engine.models import UpdateClusterDetails, UpdateNodePoolDetails
-from oci.pagination import list_call_get_all_results
+from oci.pagination import list_call_get_all_results, list_call_get_all_results_generator
 from rich.console import Console
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .auth import OCIAuthenticator
 from .models import (
@@ -30,6 +33,45 @@ from .models import (
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Single retry policy applied by every SDK client this module creates: throttles, 5xx and the
+# SDK's retryable 409s, with jittered backoff and a bounded budget. Do not add another retry
+# layer on top of SDK calls; attempts would multiply.
+_DEFAULT_RETRY_STRATEGY = oci.retry.RetryStrategyBuilder(
+    max_attempts_check=True,
+    max_attempts=3,
+    total_elapsed_time_check=True,
+    total_elapsed_time_seconds=30,
+    retry_max_wait_between_calls_seconds=10,
+    retry_base_sleep_time_seconds=1,
+    backoff_type=oci.retry.BACKOFF_FULL_JITTER_EQUAL_ON_THROTTLE_VALUE,
+).get_retry_strategy()
+
+
+def size_connection_pool(service_client: Any, size: int) -> None:
+    """Mount a ``size``-connection HTTPS pool on an SDK client so its workers reuse connections.
+
+    The SDK mounts a 10-connection adapter by default; wider fan-outs would otherwise
+    discard and re-handshake connections on every request. Keep-alive is already on. The
+    wider pool is built from the session's own adapter class, so it keeps the SDK's
+    vendored exception types and the adapter's retry settings.
+    """
+    session = getattr(getattr(service_client, "base_client", None), "session", None)
+    if session is None:
+        return
+
+    adapter = session.get_adapter("https://")
+    session.mount(
+        "https://",
+        type(adapter)(pool_connections=size, pool_maxsize=size, max_retries=adapter.max_retries),
+    )
+
+
+@lru_cache(maxsize=4)
+def _read_public_key(pub_key_path: str, mtime_ns: int) -> str:
+    """Read an SSH public key; cached per path and modification time."""
+    with open(pub_key_path, "r") as f:
+        return f.read().strip()
+
 
 def create_oci_session_token(
     profile_name: str,
@@ -136,6 +178,20 @@ def create_oci_session_token(
 class OCIClient:
     """Enhanced OCI client with session token support and optimizations."""
 
+    # Per-instance VNIC lookups are independent network round-trips, so they are resolved
+    # concurrently; kept below _http_pool_size so every worker has a warm connection.
+    _max_instance_workers = 10
+    # HTTPS connections kept per service client; at least as wide as any fan-out above so
+    # concurrent calls reuse warm TLS connections instead of re-handshaking.
+    _http_pool_size = 20
+    # Power actions accepted by ComputeClient.instance_action
+    _instance_actions = frozenset(
+        {"START", "STOP", "SOFTSTOP", "RESET", "SOFTRESET", "SENDDIAGNOSTICINTERRUPT"}
+    )
+    # Cluster lookups are repeated for the same OCID within one run (report entries, node
+    # pool passes); keep them briefly so lifecycle state stays fresh.
+    _cluster_cache_ttl_seconds = 30.0
+
     def __init__(
         self,
         region: str,
@@ -158,7 +214,7 @@ class OCIClient:
         self.signer: Optional[Any] = None
 
         # Setup retry strategy
-        self.retry_strategy = retry_strategy or oci.retry.DEFAULT_RETRY_STRATEGY
+        self.retry_strategy = retry_strategy or _DEFAULT_RETRY_STRATEGY
 
         # Service clients will be initialized lazily
         self._compute_client: Optional[oci.core.ComputeClient] = None
@@ -167,6 +223,9 @@ class OCIClient:
         self._network_client: Optional[oci.core.VirtualNetworkClient] = None
         self._object_storage_client: Optional[oci.object_storage.ObjectStorageClient] = None
         self._container_engine_client: Optional[oci.container_engine.ContainerEngineClient] = None
+        self._service_client_lock = threading.Lock()
+        self._object_storage_namespace: Optional[str] = None
+        self._cluster_cache: Dict[str, Tuple[float, OKEClusterInfo]] = {}
 
         # Authenticate
         self._authenticate()
@@ -179,61 +238,55 @@ class OCIClient:
             logger.error(f"Authentication failed: {e}")
             raise
 
+    def _service_client(self, attr: str, client_class: Any) -> Any:
+        """
+        Return the cached SDK service client stored in ``attr``, creating it on first use.
+
+        Creation is locked so concurrent callers (thread-pool fan-outs) share one client and
+        its connection pool. Each client gets this client's auth, retry policy and pool size.
+        """
+        service_client = getattr(self, attr)
+        if service_client is None:
+            with self._service_client_lock:
+                service_client = getattr(self, attr)
+                if service_client is None:
+                    service_client = client_class(
+                        self.oci_config, signer=self.signer, retry_strategy=self.retry_strategy
+                    )
+                    size_connection_pool(service_client, self._http_pool_size)
+                    setattr(self, attr, service_client)
+        return service_client
+
     @property
     def compute_client(self) -> oci.core.ComputeClient:
         """Lazy-load compute client."""
-        if not self._compute_client:
-            self._compute_client = oci.core.ComputeClient(
-                self.oci_config, signer=self.signer, retry_strategy=self.retry_strategy
-            )
-        return self._compute_client
+        return self._service_client("_compute_client", oci.core.ComputeClient)
 
     @property
     def identity_client(self) -> oci.identity.IdentityClient:
         """Lazy-load identity client."""
-        if not self._identity_client:
-            self._identity_client = oci.identity.IdentityClient(
-                self.oci_config, signer=self.signer, retry_strategy=self.retry_strategy
-            )
-        return self._identity_client
+        return self._service_client("_identity_client", oci.identity.IdentityClient)
 
     @property
     def bastion_client(self) -> oci.bastion.BastionClient:
         """Lazy-load bastion client."""
-        if not self._bastion_client:
-            self._bastion_client = oci.bastion.BastionClient(
-                self.oci_config, signer=self.signer, retry_strategy=self.retry_strategy
-            )
-        return self._bastion_client
+        return self._service_client("_bastion_client", oci.bastion.BastionClient)
 
     @property
     def network_client(self) -> oci.core.VirtualNetworkClient:
         """Lazy-load network client."""
-        if not self._network_client:
-            self._network_client = oci.core.VirtualNetworkClient(
-                self.oci_config, signer=self.signer, retry_strategy=self.retry_strategy
-            )
-        return self._network_client
+        return self._service_client("_network_client", oci.core.VirtualNetworkClient)
 
     @property
     def object_storage_client(self) -> oci.object_storage.ObjectStorageClient:
         """Lazy-load object storage client."""
-        if not self._object_storage_client:
-            self._object_storage_client = oci.object_storage.ObjectStorageClient(
-                self.oci_config, signer=self.signer, retry_strategy=self.retry_strategy
-            )
-        return self._object_storage_client
+        return self._service_client("_object_storage_client", oci.object_storage.ObjectStorageClient)
 
     @property
     def container_engine_client(self) -> oci.container_engine.ContainerEngineClient:
         """Lazy-load OKE container engine client."""
-        if not self._container_engine_client:
-            self._container_engine_client = oci.container_engine.ContainerEngineClient(
-                self.oci_config, signer=self.signer, retry_strategy=self.retry_strategy
-            )
-        return self._container_engine_client
+        return self._service_client("_container_engine_client", oci.container_engine.ContainerEngineClient)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     def test_connection(self) -> bool:
         """Test if the connection to OCI is working."""
         try:
@@ -271,6 +324,12 @@ class OCIClient:
             logger.error(f"Failed to get region info: {e}")
             raise RuntimeError(f"Failed to get region info: {e}")
 
+    def get_object_storage_namespace(self) -> str:
+        """Get the tenancy's Object Storage namespace, fetching it only once per client."""
+        if self._object_storage_namespace is None:
+            self._object_storage_namespace = self.object_storage_client.get_namespace().data
+        return self._object_storage_namespace
+
     def get_internal_domain(self) -> Optional[str]:
         """Get the internal domain for the region (Oracle-specific)."""
         try:
@@ -353,13 +412,11 @@ class OCIClient:
                 kwargs["availability_domain"] = availability_domain
 
             # List instances with pagination
+            raw_instances = []
             response = self.compute_client.list_instances(**kwargs)
 
             while response.data:
-                for instance in response.data:
-                    instance_info = self._parse_instance(compartment_id, instance)
-                    if instance_info:
-                        instances.append(instance_info)
+                raw_instances.extend(response.data)
 
                 # Check for next page
                 if response.has_next_page:
@@ -367,6 +424,16 @@ class OCIClient:
                 else:
                     break
 
+            # Resolve VNIC details for all instances side by side instead of one at a time
+            if raw_instances:
+                max_workers = min(self._max_instance_workers, len(raw_instances))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    parsed = executor.map(
+                        lambda instance: self._parse_instance(compartment_id, instance),
+                        raw_instances,
+                    )
+                    instances = [instance_info for instance_info in parsed if instance_info]
+
             return instances
 
         except Exception as e:
@@ -471,7 +538,23 @@ class OCIClient:
             raise RuntimeError(f"Failed to list node pools for cluster {cluster_id}: {e}") from e
 
     def get_oke_cluster(self, cluster_id: str) -> OKEClusterInfo:
-        """Retrieve detailed information for an OKE cluster."""
+        """Retrieve detailed information for an OKE cluster (cached for a short TTL)."""
+        cached = self._cluster_cache.get(cluster_id)
+        if cached and time.monotonic() - cached[0] < self._cluster_cache_ttl_seconds:
+            cluster_info = cached[1]
+        else:
+            cluster_info = self._fetch_oke_cluster(cluster_id)
+            self._cluster_cache[cluster_id] = (time.monotonic(), cluster_info)
+
+        # Hand out a copy so callers attaching node pools never mutate the cached entry
+        return replace(
+            cluster_info,
+            available_upgrades=list(cluster_info.available_upgrades),
+            node_pools=list(cluster_info.node_pools),
+        )
+
+    def _fetch_oke_cluster(self, cluster_id: str) -> OKEClusterInfo:
+        """Fetch cluster details from the Container Engine API."""
         ce_client = self.container_engine_client
         try:
             cluster = ce_client.get_cluster(cluster_id).data
@@ -489,7 +572,7 @@ class OCIClient:
             available_upgrades_attr = getattr(cluster, "available_upgrades", None)
         available_upgrades = list(available_upgrades_attr or [])
 
-        cluster_info = OKEClusterInfo(
+        return OKEClusterInfo(
             cluster_id=cluster_id,
             name=getattr(cluster, "name", cluster_id),
             kubernetes_version=getattr(cluster, "kubernetes_version", None),
@@ -498,8 +581,6 @@ class OCIClient:
             available_upgrades=available_upgrades,
         )
 
-        return cluster_info
-
     def upgrade_oke_cluster(self, cluster_id: str, target_version: str) -> str:
         """
         Initiate an upgrade of the specified OKE cluster to the target Kubernetes version.
@@ -508,6 +589,7 @@ class OCIClient:
             str: Work request ID for tracking the upgrade.
         """
         ce_client = self.container_engine_client
+        self._cluster_cache.pop(cluster_id, None)
         logger.info(
             "Initiating OKE cluster upgrade: cluster_id=%s target_version=%s region=%s",
             cluster_id,
@@ -735,83 +817,117 @@ class OCIClient:
 
         return odo_instances
 
+    def instance_action(self, instance_id: str, action: str) -> bool:
+        """
+        Request a power action (START, STOP, SOFTSTOP, RESET, SOFTRESET, ...) on an instance.
+
+        Returns:
+            bool: True if the action was accepted, False if the request failed.
+        """
+        action = self._validate_instance_action(action)
+        logger.info(
+            "Requesting instance action: instance_id=%s action=%s region=%s",
+            instance_id,
+            action,
+            self.config.region,
+        )
+        try:
+            self.compute_client.instance_action(instance_id, action)
+            return True
+        except Exception as exc:
+            logger.error(
+                "Instance action failed: instance_id=%s action=%s region=%s error=%s",
+                instance_id,
+                action,
+                self.config.region,
+                exc,
+            )
+            return False
+
+    def bulk_instance_action(
+        self, instance_ids: List[str], action: str, max_workers: Optional[int] = None
+    ) -> Dict[str, bool]:
+        """
+        Request the same power action on many instances concurrently.
+
+        Returns:
+            Dict[str, bool]: Whether the action was accepted, keyed by instance ID.
+        """
+        # Validate once up front instead of failing inside every worker
+        action = self._validate_instance_action(action)
+        if not instance_ids:
+            return {}
+
+        workers = min(max_workers or self._max_instance_workers, len(instance_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(partial(self.instance_action, action=action), instance_ids)
+            return dict(zip(instance_ids, results))
+
+    def _validate_instance_action(self, action: str) -> str:
+        """Normalize an instance action name, rejecting ones the Compute API does not support."""
+        action = action.upper()
+        if action not in self._instance_actions:
+            raise ValueError(
+                f"Unsupported instance action '{action}'. "
+                f"Expected one of: {', '.join(sorted(self._instance_actions))}"
+            )
+        return action
+
     def list_bastions(
         self, compartment_id: str, bastion_type: Optional[BastionType] = BastionType.INTERNAL
     ) -> List[BastionInfo]:
         """List bastions in a compartment."""
-        try:
-            bastions = []
+        return list(self.iter_bastions(compartment_id, bastion_type))
 
-            # Only pass valid parameters to the OCI API
-            kwargs = {"compartment_id": compartment_id}
-
-            response = self.bastion_client.list_bastions(**kwargs)
-
-            for bastion in response.data:
-                # Filter by lifecycle_state on the client side
-                if hasattr(bastion, "lifecycle_state"):
-                    try:
-                        bastion_lifecycle_state = LifecycleState(bastion.lifecycle_state)
-                        if bastion_lifecycle_state != LifecycleState.ACTIVE:
-                            continue  # Skip non-active bastions
-                    except (ValueError, AttributeError):
-                        # If we can't determine lifecycle state, include it
-                        pass
-
-                # Filter by bastion_type on the client side
-                if bastion_type and hasattr(bastion, "bastion_type"):
-                    try:
-                        bastion_bastion_type = BastionType(bastion.bastion_type)
-                        if bastion_bastion_type != bastion_type:
-                            continue  # Skip bastions that don't match the requested type
-                    except (ValueError, AttributeError):
-                        # If we can't determine bastion type, include it
-                        pass
-
-                # Get max session TTL - check multiple possible attribute names
-                max_session_ttl = None
-                for attr_name in ["max_session_ttl_in_seconds", "max_session_ttl", "session_ttl"]:
-                    if hasattr(bastion, attr_name):
-                        max_session_ttl = getattr(bastion, attr_name)
-                        break
+    def iter_bastions(
+        self, compartment_id: str, bastion_type: Optional[BastionType] = BastionType.INTERNAL
+    ) -> Iterator[BastionInfo]:
+        """Yield active bastions in a compartment page by page, fetching pages on demand."""
+        try:
+            # Walk every page; a single call only returns the first page of bastions
+            records = list_call_get_all_results_generator(
+                self.bastion_client.list_bastions, "record", compartment_id=compartment_id
+            )
 
-                target_subnet_id = getattr(bastion, "target_subnet_id", "")
-                if not target_subnet_id:
+            # Bound once; looked up for every bastion on every page otherwise
+            from_sdk = BastionInfo.from_sdk
+            active = LifecycleState.ACTIVE
+            for bastion in records:
+                info = from_sdk(bastion)
+                if info.lifecycle_state != active:
+                    continue  # Skip non-active bastions
+                if bastion_type and info.bastion_type != bastion_type:
+                    continue  # Skip bastions that don't match the requested type
+                if not info.target_subnet_id:
                     continue  # Skip bastions without target subnet
-
-                bastion_type = BastionType.INTERNAL  # default
-                if hasattr(bastion, "bastion_type"):
-                    try:
-                        bastion_type = BastionType(bastion.bastion_type)
-                    except (ValueError, TypeError):
-                        pass  # Keep default
-
-                lifecycle_state = LifecycleState.ACTIVE  # default
-                if hasattr(bastion, "lifecycle_state"):
-                    try:
-                        lifecycle_state = LifecycleState(bastion.lifecycle_state)
-                    except (ValueError, TypeError):
-                        pass  # Keep default
-
-                bastions.append(
-                    BastionInfo(
-                        bastion_id=bastion.id,
-                        target_subnet_id=target_subnet_id,
-                        bastion_name=getattr(bastion, "name", None),
-                        bastion_type=bastion_type,
-                        max_session_ttl=max_session_ttl or 10800,
-                        lifecycle_state=lifecycle_state,
-                    )
-                )
-
-            return bastions
+                yield info
 
         except Exception as e:
             logger.error(f"Failed to list bastions: {e}")
             raise RuntimeError(f"Failed to list bastions: {e}")
 
+    @staticmethod
+    def index_bastions_by_subnet(bastions: List[BastionInfo]) -> Dict[str, List[BastionInfo]]:
+        """
+        Group bastions by target subnet for repeated find_bastion_for_subnet lookups.
+
+        Each group is already in the deterministic order used to pick among several
+        bastions, so building the index once turns per-instance scans into dict lookups.
+        """
+        by_subnet: Dict[str, List[BastionInfo]] = {}
+        for bastion in bastions:
+            by_subnet.setdefault(bastion.target_subnet_id, []).append(bastion)
+        for group in by_subnet.values():
+            if len(group) > 1:
+                group.sort(key=lambda b: b.bastion_name or b.bastion_id)
+        return by_subnet
+
     def find_bastion_for_subnet(
-        self, bastions: List[BastionInfo], subnet_id: str, instance_id: Optional[str] = None
+        self,
+        bastions: List[BastionInfo],
+        subnet_id: str,
+        instance_id: Optional[str] = None,
+        bastions_by_subnet: Optional[Dict[str, List[BastionInfo]]] = None,
     ) -> Optional[BastionInfo]:
         """
         Find the best bastion that can access the given subnet.
@@ -823,14 +939,16 @@ class OCIClient:
             bastions: List of available bastions
             subnet_id: Target subnet ID to find bastion for
             instance_id: Optional instance ID for deterministic selection
+            bastions_by_subnet: Optional index from index_bastions_by_subnet(bastions);
+                when given, it replaces the scan over ``bastions``
 
         Returns:
             Best matching bastion or None if no match found
         """
         # Find all bastions that can access the target subnet
-        matching_bastions = [
-            bastion for bastion in bastions if bastion.target_subnet_id == subnet_id
-        ]
+        if bastions_by_subnet is None:
+            bastions_by_subnet = self.index_bastions_by_subnet(bastions)
+        matching_bastions = bastions_by_subnet.get(subnet_id, [])
 
         if not matching_bastions:
             return None
@@ -838,10 +956,8 @@ class OCIClient:
         if len(matching_bastions) == 1:
             return matching_bastions[0]
 
-        # Multiple bastions found - use intelligent selection
-        # Sort bastions by name for deterministic ordering
-        matching_bastions.sort(key=lambda b: b.bastion_name or b.bastion_id)
-
+        # Multiple bastions found - use intelligent selection; the group is sorted by name
+        # for deterministic ordering
         if instance_id:
             # Use hash-based selection for consistent instance-to-bastion pairing
             import hashlib
@@ -885,17 +1001,17 @@ class OCIClient:
                 session_ttl_in_seconds=session_ttl,
             )
 
+            logger.info(
+                "Creating bastion session: bastion_id=%s target_resource_id=%s",
+                bastion_id,
+                target_resource_id,
+            )
             response = self.bastion_client.create_session(details)
             session = response.data
 
-            return SessionInfo(
-                session_id=session.id,
-                bastion_id=session.bastion_id,
-                target_resource_id=target_resource_id,
-                target_resource_private_ip=target_private_ip,
-                ssh_metadata=session.ssh_metadata,
-                lifecycle_state=LifecycleState(session.lifecycle_state),
-            )
+            # The create response is used as-is; ssh_metadata may still be empty while the
+            # session is CREATING
+            return SessionInfo.from_sdk(session, target_resource_id, target_private_ip)
 
         except Exception as e:
             logger.error(f"Failed to create bastion session: {e}")
@@ -945,6 +1061,9 @@ class OCIClient:
                 compartment_id=compartment_id, instance_id=instance_id
             ).data
 
+            # Secondary VNICs are fetched one at a time: this already runs inside
+            # list_instances' per-instance pool, and a nested pool per instance would multiply
+            # the thread count. Walking in attachment order also stops at the first usable VNIC.
             for vnic_attachment in vnics:
                 if vnic_attachment.lifecycle_state == "ATTACHED":
                     # Get VNIC details
@@ -966,9 +1085,11 @@ class OCIClient:
         ssh_path = Path.home() / ".ssh"
         pub_key_path = ssh_path / "id_rsa.pub"
 
-        if pub_key_path.exists():
-            with open(pub_key_path, "r") as f:
-                return f.read().strip()
+        try:
+            # Keyed on mtime so a rotated key is re-read without re-reading it on every session
+            return _read_public_key(str(pub_key_path), pub_key_path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            pass
 
         # Generate new key pair if needed
         import subprocess
@@ -992,8 +1113,7 @@ class OCIClient:
                 check=True,
             )
 
-        with open(pub_key_path, "r") as f:
-            return f.read().strip()
+        return _read_public_key(str(pub_key_path), pub_key_path.stat().st_mtime_ns)
 
     def create_session_token(
         self,
@@ -1,5 +1,6 @@
 """Data models for OCI client."""
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -36,6 +37,11 @@ class BastionType(str, Enum):
     INTERNAL = "INTERNAL"
 
 
+# Value -> member maps; a dict lookup is much cheaper than Enum(value) in listing loops
+_LIFECYCLE_STATES: Dict[str, LifecycleState] = {state.value: state for state in LifecycleState}
+_BASTION_TYPES: Dict[str, BastionType] = {kind.value: kind for kind in BastionType}
+
+
 @dataclass
 class InstanceInfo:
     """Information about an OCI compute instance."""
@@ -53,7 +59,16 @@ class InstanceInfo:
     tags: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+# Keyword arguments for dataclasses that are created in bulk (bastion and session listings,
+# report rows); slots drop the per-instance __dict__ where the interpreter supports it
+# (dataclass(slots=True) needs Python 3.10+).
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Attribute names the SDK has used for a bastion's maximum session TTL
+_BASTION_TTL_ATTRS = ("max_session_ttl_in_seconds", "max_session_ttl", "session_ttl")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class BastionInfo:
     """Information about an OCI bastion."""
 
@@ -64,8 +79,28 @@ class BastionInfo:
     max_session_ttl: int = 10800  # 3 hours default
     lifecycle_state: LifecycleState = LifecycleState.ACTIVE
 
+    @classmethod
+    def from_sdk(cls, bastion: Any) -> "BastionInfo":
+        """Build from an OCI SDK Bastion or BastionSummary."""
+        return cls(
+            bastion_id=bastion.id,
+            target_subnet_id=getattr(bastion, "target_subnet_id", None) or "",
+            bastion_name=getattr(bastion, "name", None),
+            bastion_type=_BASTION_TYPES.get(
+                getattr(bastion, "bastion_type", None), BastionType.INTERNAL
+            ),
+            max_session_ttl=next(
+                (getattr(bastion, name) for name in _BASTION_TTL_ATTRS if hasattr(bastion, name)),
+                None,
+            )
+            or 10800,
+            lifecycle_state=_LIFECYCLE_STATES.get(
+                getattr(bastion, "lifecycle_state", None), LifecycleState.ACTIVE
+            ),
+        )
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SessionInfo:
     """Information about a bastion session."""
 
@@ -76,6 +111,43 @@ class SessionInfo:
     ssh_metadata: Dict[str, str] = field(default_factory=dict)
     lifecycle_state: LifecycleState = LifecycleState.ACTIVE
 
+    @classmethod
+    def from_sdk(
+        cls,
+        session: Any,
+        target_resource_id: str = "",
+        target_resource_private_ip: str = "",
+    ) -> "SessionInfo":
+        """Build from an OCI SDK Session, using the given target values when it lacks them."""
+        target_details = getattr(session, "target_resource_details", None)
+        return cls(
+            session_id=session.id,
+            bastion_id=session.bastion_id,
+            target_resource_id=getattr(target_details, "target_resource_id", None)
+            or target_resource_id,
+            target_resource_private_ip=getattr(
+                target_details, "target_resource_private_ip_address", None
+            )
+            or target_resource_private_ip,
+            ssh_metadata=getattr(session, "ssh_metadata", None) or {},
+            lifecycle_state=LifecycleState(session.lifecycle_state),
+        )
+
+
+@dataclass(**DATACLASS_SLOTS)
+class SSHConfigEntry:
+    """One generated SSH config Host entry and the instance it reaches."""
+
+    host: str
+    hostname: str
+    proxy_command: str
+    type: str  # "oke" or "odo"
+    instance_id: str
+    private_ip: str
+    region: str
+    cluster: Optional[str] = None
+    display_name: Optional[str] = None
+
 
 @dataclass
 class OKENodePoolInfo:
@@ -8,23 +8,148 @@ their own CLI arguments while sharing the common setup for OCI authentication.
 from __future__ import annotations
 
 import argparse
+import logging
+import queue
+import random
+import string
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Iterable, List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import repeat, zip_longest
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 import oci
 from oci.exceptions import ServiceError
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
 
-from .client import OCIClient
+from .client import OCIClient, size_connection_pool
+
+logger = logging.getLogger(__name__)
 
 
 class ResourceDeletionError(RuntimeError):
     """Raised when a resource cannot be deleted safely."""
 
 
+_T = TypeVar("_T")
+
+
+def _collect_errors(
+    fn: Callable[[_T], Optional[Iterable[str]]],
+    item: _T,
+    label: Callable[[_T], str],
+) -> Tuple[_T, List[str]]:
+    """Invoke ``fn`` for one item and convert any failure into error strings."""
+    try:
+        return item, list(fn(item) or [])
+    except ResourceDeletionError as exc:
+        return item, [str(exc)]
+    except ServiceError as exc:
+        return item, [f"{label(item)}: {exc.code} - {exc.message}"]
+    except Exception as exc:  # pragma: no cover - unexpected
+        return item, [f"{label(item)}: {exc}"]
+
+
+def _run_bounded(
+    items: Iterable[_T],
+    fn: Callable[[_T], Optional[Iterable[str]]],
+    *,
+    max_workers: int,
+    label: Callable[[_T], str],
+    on_complete: Optional[Callable[[_T], None]] = None,
+    max_errors: Optional[int] = None,
+) -> Tuple[List[str], int]:
+    """Apply ``fn`` to ``items`` keeping at most ``max_workers`` calls in flight.
+
+    Items are pulled lazily and every future is released as soon as it completes,
+    so memory stays proportional to ``max_workers`` instead of the batch size.
+    ``on_complete`` runs on the calling thread once per finished item.
+
+    Returns the collected error strings and the total number of errors. With
+    ``max_errors`` set, at most that many strings are kept and no new items are
+    started once the total reaches it; calls already in flight are allowed to finish.
+    """
+    errors: List[str] = []
+    error_count = 0
+    in_flight: Set[Future] = set()
+
+    def drain(done: Set[Future]) -> None:
+        nonlocal error_count
+        for future in done:
+            item, item_errors = future.result()
+            error_count += len(item_errors)
+            if max_errors is None:
+                errors.extend(item_errors)
+            else:
+                errors.extend(item_errors[: max(0, max_errors - len(errors))])
+            if on_complete is not None:
+                on_complete(item)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item in items:
+            if len(in_flight) >= max_workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                drain(done)
+            if max_errors is not None and error_count >= max_errors:
+                break
+            in_flight.add(executor.submit(_collect_errors, fn, item, label))
+
+        drain(wait(in_flight).done)
+
+    return errors, error_count
+
+
+# Throttling and transient server errors that are safe to retry for idempotent deletes.
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Delete calls made through _call_with_retry turn off the client-level retry strategy, so
+# that loop is the only retry layer and every HTTP attempt is seen by the worker tuner.
+_NO_RETRY_STRATEGY = oci.retry.NoneRetryStrategy()
+
+
+class _RateLimiter:
+    """Space calls evenly so that all workers together stay under ``rate`` calls per second."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self) -> None:
+        """Block until the caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _name_getter(summary: Any) -> Callable[[Any], str]:
+    """Pick the name accessor for a listing page once, based on one of its summaries."""
+    return attrgetter("name") if hasattr(summary, "name") else attrgetter("object_name")
+
+
+def _interleave_by_prefix(
+    items: Iterable[Tuple[str, Optional[str]]],
+) -> Iterator[Tuple[str, Optional[str]]]:
+    """Reorder ``(name, version_id)`` pairs round-robin across top-level name prefixes.
+
+    Listings come back sorted, so dispatching them in order keeps every in-flight request
+    on the same prefix, which is also the unit the service throttles on.
+    """
+    groups: Dict[str, List[Tuple[str, Optional[str]]]] = {}
+    for item in items:
+        groups.setdefault(item[0].split("/", 1)[0], []).append(item)
+
+    for round_items in zip_longest(*groups.values()):
+        yield from (item for item in round_items if item is not None)
+
+
 class BaseDeletionCommand(ABC):
     """Abstract base class for resource deletion implementations."""
 
@@ -52,6 +177,13 @@ class _DeletionCounts:
     deleted_versions: int = 0
 
 
+@dataclass
+class _RequestStats:
+    requests: int = 0
+    throttled: int = 0
+    latency_seconds: float = 0.0
+
+
 class BucketDeletionCommand(BaseDeletionCommand):
     """Delete Object Storage buckets, draining contents beforehand."""
 
@@ -59,7 +191,40 @@ class BucketDeletionCommand(BaseDeletionCommand):
     help_text = "Delete an Object Storage bucket (removing all objects and versions first)."
 
     _delete_batch_size = 1000
+    _bulk_delete_chunk_size = 1000
+    # Object Storage caps list_objects / list_object_versions at 1000 results per page.
+    # Listings start below the cap so the page size has room to adapt in both directions.
+    _list_page_size = 1000
+    _initial_list_page_size = 500
+    _min_list_page_size = 100
+    # Deletion only needs object names (version listings always carry versionId), so ask
+    # the service for nothing else and keep page payloads minimal.
+    _list_fields = "name"
+    # With --list-shards N the key space is split into N ranges listed concurrently.
+    _list_shards = 1
+    _list_shard_alphabet = string.digits + string.ascii_uppercase + string.ascii_lowercase
     _max_delete_workers = 8
+    # Per-object (version) deletes are bare HTTP round-trips and the SDK releases the
+    # GIL while waiting on the socket, so they get a wider fan-out than bulk chunks.
+    _max_object_delete_workers = 32
+    # The per-object fan-out starts at _max_object_delete_workers and is retuned after every
+    # batch: halved when more than 5% of requests were throttled, doubled when under 1% were
+    # and latency has not degraded.
+    _min_tuned_object_delete_workers = 1
+    _max_tuned_object_delete_workers = 64
+    _latency_smoothing = 0.3
+    # A batch stops dispatching new deletes once this many have failed (e.g. a missing
+    # permission), and only this many error messages are kept for reporting.
+    _max_delete_errors = 100
+    _max_transient_retries = 5
+    _max_retry_delay_seconds = 30.0
+    _rate_limiter: Optional[_RateLimiter] = None
+
+    def __init__(self) -> None:
+        self._object_delete_workers = self._max_object_delete_workers
+        self._latency_ema: Optional[float] = None
+        self._request_stats = _RequestStats()
+        self._request_stats_lock = threading.Lock()
 
     def add_arguments(self, parser: argparse.ArgumentParser) -> None:
         parser.add_argument(
@@ -72,23 +237,52 @@ class BucketDeletionCommand(BaseDeletionCommand):
             required=False,
             help="Optional Object Storage namespace override (defaults to tenancy namespace).",
         )
+        parser.add_argument(
+            "--delete-rate",
+            type=float,
+            default=None,
+            help="Maximum delete requests per second across all workers (default: unlimited).",
+        )
+        parser.add_argument(
+            "--list-shards",
+            type=int,
+            default=1,
+            help="Key ranges to list concurrently while emptying the bucket (default: 1).",
+        )
 
     def execute(self, client: OCIClient, args: argparse.Namespace, console: Console) -> None:
         bucket_name: str = args.bucket_name
         namespace: Optional[str] = args.namespace
+        delete_rate: Optional[float] = getattr(args, "delete_rate", None)
+
+        if delete_rate is not None and delete_rate <= 0:
+            raise ResourceDeletionError(
+                "--delete-rate must be a positive number of requests per second."
+            )
+        self._rate_limiter = _RateLimiter(delete_rate) if delete_rate else None
+
+        list_shards: int = getattr(args, "list_shards", 1) or 1
+        if list_shards < 1:
+            raise ResourceDeletionError("--list-shards must be at least 1.")
+        self._list_shards = list_shards
 
         object_storage = client.object_storage_client
+        size_connection_pool(
+            object_storage, max(self._max_delete_workers, self._max_tuned_object_delete_workers)
+        )
 
         # Resolve namespace if not provided explicitly.
         if not namespace:
-            namespace = object_storage.get_namespace().data
+            namespace = client.get_object_storage_namespace()
 
         console.print(
             f"[bold blue]Deleting bucket '{bucket_name}' in namespace '{namespace}'[/bold blue]"
         )
 
         try:
-            bucket = object_storage.get_bucket(namespace, bucket_name).data
+            bucket = object_storage.get_bucket(
+                namespace, bucket_name, fields=["approximateCount"]
+            ).data
         except ServiceError as exc:
             if exc.status == 404:
                 console.print(
@@ -101,6 +295,63 @@ class BucketDeletionCommand(BaseDeletionCommand):
 
         console.print(f"[dim]Bucket versioning state: {bucket.versioning or 'Disabled'}[/dim]")
 
+        versioning_state = str(bucket.versioning or "").lower()
+        # An unversioned bucket that reports no objects can be deleted straight away. The
+        # count is approximate, so a BucketNotEmpty response still falls back to a full drain.
+        skip_contents = (
+            getattr(bucket, "approximate_count", None) == 0
+            and versioning_state not in {"enabled", "suspended"}
+        )
+        if skip_contents:
+            console.print("[dim]Bucket reports no objects; skipping content cleanup.[/dim]")
+
+        while True:
+            if not skip_contents:
+                self._empty_bucket(
+                    object_storage=object_storage,
+                    namespace=namespace,
+                    bucket_name=bucket_name,
+                    versioning_state=versioning_state,
+                    console=console,
+                )
+
+            console.print(f"[dim]Deleting bucket resource '{bucket_name}'...[/dim]")
+            try:
+                object_storage.delete_bucket(namespace, bucket_name)
+            except ServiceError as exc:
+                if exc.status == 404:
+                    console.print(
+                        f"[yellow]Bucket '{bucket_name}' already deleted during cleanup.[/yellow]"
+                    )
+                    return
+                if exc.status == 409 and exc.code == "BucketNotEmpty":
+                    if skip_contents:
+                        console.print(
+                            "[yellow]Bucket is not empty despite its object count; emptying it first.[/yellow]"
+                        )
+                        skip_contents = False
+                        continue
+                    raise ResourceDeletionError(
+                        f"Bucket '{bucket_name}' is still reported as not empty. "
+                        "Verify no new objects were uploaded and retry."
+                    ) from exc
+                raise ResourceDeletionError(
+                    f"Failed to delete bucket '{bucket_name}': {exc.code} - {exc.message}"
+                ) from exc
+            break
+
+        console.print(f"[bold green]✓ Bucket '{bucket_name}' deleted successfully.[/bold green]")
+
+    def _empty_bucket(
+        self,
+        *,
+        object_storage: oci.object_storage.ObjectStorageClient,
+        namespace: str,
+        bucket_name: str,
+        versioning_state: str,
+        console: Console,
+    ) -> None:
+        """Drain every object and version from the bucket and report what was removed."""
         counts = _DeletionCounts()
 
         try:
@@ -108,7 +359,7 @@ class BucketDeletionCommand(BaseDeletionCommand):
                 object_storage=object_storage,
                 namespace=namespace,
                 bucket_name=bucket_name,
-                versioning_state=str(bucket.versioning or "").lower(),
+                versioning_state=versioning_state,
                 counts=counts,
                 console=console,
             )
@@ -121,26 +372,6 @@ class BucketDeletionCommand(BaseDeletionCommand):
             f"[green]Removed {counts.deleted_objects} objects and {counts.deleted_versions} versions.[/green]"
         )
 
-        console.print(f"[dim]Deleting bucket resource '{bucket_name}'...[/dim]")
-        try:
-            object_storage.delete_bucket(namespace, bucket_name)
-        except ServiceError as exc:
-            if exc.status == 404:
-                console.print(
-                    f"[yellow]Bucket '{bucket_name}' already deleted during cleanup.[/yellow]"
-                )
-                return
-            if exc.status == 409 and exc.code == "BucketNotEmpty":
-                raise ResourceDeletionError(
-                    f"Bucket '{bucket_name}' is still reported as not empty. "
-                    "Verify no new objects were uploaded and retry."
-                ) from exc
-            raise ResourceDeletionError(
-                f"Failed to delete bucket '{bucket_name}': {exc.code} - {exc.message}"
-            ) from exc
-
-        console.print(f"[bold green]✓ Bucket '{bucket_name}' deleted successfully.[/bold green]")
-
     def _remove_bucket_contents(
         self,
         *,
@@ -154,15 +385,7 @@ class BucketDeletionCommand(BaseDeletionCommand):
         """Iterate through bucket contents and delete them safely."""
         versioning_enabled = versioning_state in {"enabled", "suspended"}
 
-        if versioning_enabled:
-            self._delete_object_versions(
-                object_storage=object_storage,
-                namespace=namespace,
-                bucket_name=bucket_name,
-                counts=counts,
-                console=console,
-            )
-        else:
+        if not versioning_enabled:
             self._delete_current_objects(
                 object_storage=object_storage,
                 namespace=namespace,
@@ -170,9 +393,9 @@ class BucketDeletionCommand(BaseDeletionCommand):
                 counts=counts,
                 console=console,
             )
+            return
 
-        # Ensure no residual current objects remain (handles versioning buckets too).
-        self._delete_current_objects(
+        saw_live_versions = self._delete_object_versions(
             object_storage=object_storage,
             namespace=namespace,
             bucket_name=bucket_name,
@@ -180,6 +403,17 @@ class BucketDeletionCommand(BaseDeletionCommand):
             console=console,
         )
 
+        # Sweep for current objects written while versions were being removed. A bucket
+        # that only held delete markers had nothing live to race with, so skip the listing.
+        if saw_live_versions:
+            self._delete_current_objects(
+                object_storage=object_storage,
+                namespace=namespace,
+                bucket_name=bucket_name,
+                counts=counts,
+                console=console,
+            )
+
     def _delete_current_objects(
         self,
         *,
@@ -188,52 +422,34 @@ class BucketDeletionCommand(BaseDeletionCommand):
         bucket_name: str,
         counts: _DeletionCounts,
         console: Console,
-        start: Optional[str] = None,
     ) -> None:
         """Remove each current object version from the bucket."""
-        next_start = start
-        pending: List[Dict[str, Optional[str]]] = []
-
-        while True:
-            response = object_storage.list_objects(
-                namespace,
-                bucket_name,
-                start=next_start,
-                limit=1000,
-            )
-            object_collection = response.data
-            objects: Iterable = getattr(object_collection, "objects", [])
-
-            if not objects:
-                break
+        pending_names: List[str] = []
 
+        for objects in self._iter_listing_pages(
+            object_storage.list_objects, namespace, bucket_name
+        ):
+            get_name = _name_getter(objects[0])
             for obj in objects:
-                object_name = getattr(obj, "name", getattr(obj, "object_name", ""))
-                pending.append({"object_name": object_name})
+                pending_names.append(get_name(obj))
 
-                if len(pending) >= self._delete_batch_size:
+                if len(pending_names) >= self._delete_batch_size:
                     self._process_delete_batch(
                         object_storage=object_storage,
                         namespace=namespace,
                         bucket_name=bucket_name,
-                        items=pending,
+                        names=pending_names,
                         console=console,
                         counts=counts,
-                        is_version_batch=False,
                     )
 
-            next_start = getattr(object_collection, "next_start_with", None)
-            if not next_start:
-                break
-
         self._process_delete_batch(
             object_storage=object_storage,
             namespace=namespace,
             bucket_name=bucket_name,
-            items=pending,
+            names=pending_names,
             console=console,
             counts=counts,
-            is_version_batch=False,
         )
 
     def _delete_object_versions(
@@ -244,53 +460,201 @@ class BucketDeletionCommand(BaseDeletionCommand):
         bucket_name: str,
         counts: _DeletionCounts,
         console: Console,
-    ) -> None:
-        """Remove all versions from a versioned bucket."""
-        next_start: Optional[str] = None
-        pending: List[Dict[str, Optional[str]]] = []
-
-        while True:
-            response = object_storage.list_object_versions(
-                namespace,
-                bucket_name,
-                start=next_start,
-                limit=1000,
-            )
-            version_collection = response.data
-            versions: List = getattr(version_collection, "objects", []) or []
-
-            if not versions:
-                break
-
+    ) -> bool:
+        """Remove all versions from a versioned bucket.
+
+        Returns whether any listed version was a live object rather than a delete marker.
+        """
+        # Names and version IDs are buffered as parallel lists rather than one dict per
+        # version; large buckets would otherwise hold a full batch of dicts in memory.
+        pending_names: List[str] = []
+        pending_version_ids: List[Optional[str]] = []
+        saw_live_versions = False
+        get_version_id = attrgetter("version_id")
+        get_is_delete_marker = attrgetter("is_delete_marker")
+
+        for versions in self._iter_listing_pages(
+            object_storage.list_object_versions, namespace, bucket_name, versions=True
+        ):
+            get_name = _name_getter(versions[0])
             for version in versions:
-                object_name = getattr(version, "name", getattr(version, "object_name", ""))
-                version_id = getattr(version, "version_id", None)
-                pending.append({"object_name": object_name, "version_id": version_id})
+                pending_names.append(get_name(version))
+                pending_version_ids.append(get_version_id(version))
+                if not get_is_delete_marker(version):
+                    saw_live_versions = True
 
-                if len(pending) >= self._delete_batch_size:
+                if len(pending_names) >= self._delete_batch_size:
                     self._process_delete_batch(
                         object_storage=object_storage,
                         namespace=namespace,
                         bucket_name=bucket_name,
-                        items=pending,
+                        names=pending_names,
+                        version_ids=pending_version_ids,
                         console=console,
                         counts=counts,
-                        is_version_batch=True,
                     )
 
-            next_start = getattr(version_collection, "next_start_with", None)
-            if not next_start:
-                break
-
         self._process_delete_batch(
             object_storage=object_storage,
             namespace=namespace,
             bucket_name=bucket_name,
-            items=pending,
+            names=pending_names,
+            version_ids=pending_version_ids,
             console=console,
             counts=counts,
-            is_version_batch=True,
         )
+        return saw_live_versions
+
+    def _list_shard_bounds(self, shards: int) -> List[Tuple[Optional[str], Optional[str]]]:
+        """Split the object name key space into ``shards`` contiguous ``[start, end)`` ranges.
+
+        Split points are drawn from ``_list_shard_alphabet``; the first and last ranges are
+        open-ended, so every name falls into exactly one shard.
+        """
+        alphabet = self._list_shard_alphabet
+        shards = max(1, min(shards, len(alphabet)))
+        split_points: List[Optional[str]] = [
+            alphabet[len(alphabet) * index // shards] for index in range(1, shards)
+        ]
+        return list(zip([None] + split_points, split_points + [None]))
+
+    def _iter_listing_pages(
+        self,
+        list_call: Callable[..., Any],
+        namespace: str,
+        bucket_name: str,
+        *,
+        versions: bool = False,
+    ) -> Iterator[List[Any]]:
+        """Yield listing pages for the whole bucket, using ``_list_shards`` parallel listers.
+
+        Each shard pages through its own key range on a separate thread; pages are handed
+        to the caller through a bounded queue so deletion still happens on one thread.
+        """
+        if self._list_shards <= 1:
+            yield from self._iter_object_pages(
+                list_call, namespace, bucket_name, versions=versions
+            )
+            return
+
+        shard_bounds = self._list_shard_bounds(self._list_shards)
+        pages: "queue.Queue[Any]" = queue.Queue(maxsize=2 * len(shard_bounds))
+        stop = threading.Event()
+        shard_done = object()
+
+        def offer(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def list_shard(bounds: Tuple[Optional[str], Optional[str]]) -> None:
+            start, end = bounds
+            try:
+                for page in self._iter_object_pages(
+                    list_call, namespace, bucket_name, start, end, versions=versions
+                ):
+                    if not offer(page):
+                        return
+            except Exception as exc:
+                offer(exc)
+            finally:
+                offer(shard_done)
+
+        with ThreadPoolExecutor(max_workers=len(shard_bounds)) as listers:
+            for bounds in shard_bounds:
+                listers.submit(list_shard, bounds)
+
+            try:
+                remaining = len(shard_bounds)
+                while remaining:
+                    item = pages.get()
+                    if item is shard_done:
+                        remaining -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                # Unblock listers that are waiting on a full queue if we stop early.
+                stop.set()
+
+    def _iter_object_pages(
+        self,
+        list_call: Callable[..., Any],
+        namespace: str,
+        bucket_name: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        *,
+        versions: bool = False,
+    ) -> Iterator[List[Any]]:
+        """Yield listing pages, fetching the next page while the caller deletes the current one.
+
+        Object listings are keyset paginated (``start=next_start_with``); version listings
+        return their summaries in ``items`` and continue with the ``opc-next-page`` token.
+        The page size starts at half the service maximum and doubles towards the maximum
+        after every successful page. A throttled page request (429/503) is retried at half
+        the size after an exponential backoff; once the size is at its floor the error is
+        raised.
+        """
+        page_size = self._initial_list_page_size
+        throttled_attempts = 0
+        fetch_page = partial(
+            list_call, namespace, bucket_name, start=start, fields=self._list_fields
+        )
+        if end is not None:
+            fetch_page = partial(fetch_page, end=end)
+        cursor_kwarg = "page" if versions else "start"
+
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+
+            def submit(cursor: Optional[str]) -> Future:
+                cursor_kwargs = {cursor_kwarg: cursor} if cursor else {}
+                return prefetcher.submit(fetch_page, limit=page_size, **cursor_kwargs)
+
+            cursor: Optional[str] = None
+            future: Optional[Future] = submit(cursor)
+
+            while future is not None:
+                try:
+                    response = future.result()
+                except ServiceError as exc:
+                    if exc.status not in (429, 503) or page_size <= self._min_list_page_size:
+                        raise
+                    throttled_attempts += 1
+                    page_size = max(self._min_list_page_size, page_size // 2)
+                    delay = min(
+                        2**throttled_attempts + random.random(), self._max_retry_delay_seconds
+                    )
+                    logger.debug(
+                        "Listing throttled (%s); retrying with %d results per page in %.1fs",
+                        exc.status,
+                        page_size,
+                        delay,
+                    )
+                    time.sleep(delay)
+                    future = submit(cursor)
+                    continue
+
+                throttled_attempts = 0
+                page_size = min(self._list_page_size, page_size * 2)
+
+                if versions:
+                    summaries: List[Any] = response.data.items
+                    cursor = response.next_page
+                else:
+                    summaries = response.data.objects
+                    cursor = response.data.next_start_with
+                if not summaries:
+                    return
+
+                future = submit(cursor) if cursor else None
+
+                yield summaries
 
     def _process_delete_batch(
         self,
@@ -298,90 +662,225 @@ class BucketDeletionCommand(BaseDeletionCommand):
         object_storage: oci.object_storage.ObjectStorageClient,
         namespace: str,
         bucket_name: str,
-        items: List[Dict[str, Optional[str]]],
+        names: List[str],
         console: Console,
         counts: _DeletionCounts,
-        is_version_batch: bool,
+        version_ids: Optional[List[Optional[str]]] = None,
     ) -> None:
-        """Flush pending objects using concurrent delete requests."""
-        if not items:
+        """Flush pending objects using bulk or concurrent delete requests.
+
+        ``version_ids`` runs parallel to ``names`` for version batches; both lists are
+        cleared once the batch has been deleted.
+        """
+        if not names:
             return
 
+        is_version_batch = version_ids is not None
         action = "object versions" if is_version_batch else "objects"
         console.print(
-            f"[dim]Deleting batch of {len(items)} {action} from bucket '{bucket_name}'[/dim]"
+            f"[dim]Deleting batch of {len(names)} {action} from bucket '{bucket_name}'[/dim]"
         )
 
-        batch = list(items)
+        total = len(names)
 
-        errors: List[str] = []
-        max_workers = min(self._max_delete_workers, len(batch))
+        # Batch delete only addresses the current version of an object, so
+        # version batches keep using one DELETE per object.
+        use_bulk = not is_version_batch and hasattr(object_storage, "batch_delete_objects")
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_map = {
-                executor.submit(
-                    self._delete_single_object,
-                    object_storage,
-                    namespace,
-                    bucket_name,
-                    item,
-                    console,
-                ): item
-                for item in batch
-            }
-
-            for future in as_completed(future_map):
-                item = future_map[future]
-                try:
-                    future.result()
-                except ServiceError as exc:
-                    errors.append(
-                        f"{item['object_name']}: {exc.code} - {exc.message}"
-                    )
-                except Exception as exc:  # pragma: no cover - unexpected
-                    errors.append(f"{item['object_name']}: {exc}")
+        with Progress(
+            TextColumn("[dim]{task.description}[/dim]"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+            transient=True,
+        ) as progress:
+            task_id = progress.add_task(f"Deleting {action}", total=total)
+
+            if use_bulk:
+                chunk_size = self._bulk_delete_chunk_size
+                chunks = (
+                    names[offset : offset + chunk_size] for offset in range(0, total, chunk_size)
+                )
+                errors, error_count = _run_bounded(
+                    chunks,
+                    partial(
+                        self._bulk_delete, object_storage, namespace, bucket_name, console=console
+                    ),
+                    max_workers=self._max_delete_workers,
+                    max_errors=self._max_delete_errors,
+                    label=lambda chunk: f"batch starting at '{chunk[0]}'",
+                    on_complete=lambda chunk: progress.advance(task_id, len(chunk)),
+                )
+            else:
+                with self._request_stats_lock:
+                    self._request_stats = _RequestStats()
+                errors, error_count = _run_bounded(
+                    _interleave_by_prefix(
+                        zip(names, version_ids if version_ids is not None else repeat(None))
+                    ),
+                    partial(
+                        self._delete_single_object,
+                        partial(
+                            object_storage.delete_object,
+                            namespace_name=namespace,
+                            bucket_name=bucket_name,
+                        ),
+                    ),
+                    max_workers=self._object_delete_workers,
+                    max_errors=self._max_delete_errors,
+                    label=lambda item: item[0],
+                    on_complete=lambda item: progress.advance(task_id, 1),
+                )
+                self._tune_object_delete_workers()
 
-        if errors:
+        if error_count:
+            for error in errors:
+                logger.error("Delete failed: %s", error)
             raise ResourceDeletionError(
-                f"Failed to delete {len(errors)} {action}: {errors[0]}"
+                f"Failed to delete {error_count} {action}: {errors[0]}"
             )
 
         if is_version_batch:
-            counts.deleted_versions += len(batch)
+            counts.deleted_versions += total
         else:
-            counts.deleted_objects += len(batch)
+            counts.deleted_objects += total
 
-        items.clear()
+        names.clear()
+        if version_ids is not None:
+            version_ids.clear()
 
-    def _delete_single_object(
+    def _bulk_delete(
         self,
         object_storage: oci.object_storage.ObjectStorageClient,
         namespace: str,
         bucket_name: str,
-        item: Dict[str, Optional[str]],
+        names: List[str],
+        *,
         console: Console,
+    ) -> List[str]:
+        """Delete a chunk of current objects with one BatchDeleteObjects call.
+
+        Returns one error string per object the service reported as failed.
+        """
+        console.print(
+            f"[dim]Batch deleting {len(names)} objects ('{names[0]}' .. '{names[-1]}')[/dim]"
+        )
+        # Built once per chunk and reused as-is if the request is retried; the SDK owns
+        # request signing and JSON encoding, so the body is not pre-serialized here.
+        details = oci.object_storage.models.BatchDeleteObjectsDetails(
+            objects=[
+                oci.object_storage.models.BatchDeleteObjectIdentifier(object_name=name)
+                for name in names
+            ],
+            is_skip_deleted_result=True,
+        )
+        response = self._call_with_retry(
+            object_storage.batch_delete_objects,
+            namespace_name=namespace,
+            bucket_name=bucket_name,
+            batch_delete_objects_details=details,
+        )
+
+        failed = getattr(response.data, "failed", None) or []
+        return [
+            f"{failure.object_name}: {failure.status_code} - {failure.error_message}"
+            for failure in failed
+        ]
+
+    def _delete_single_object(
+        self,
+        delete_object: Callable[..., Any],
+        item: Tuple[str, Optional[str]],
     ) -> None:
-        """Delete a single object or object version."""
-        object_name = item["object_name"]
-        version_id = item.get("version_id")
+        """Delete a single object or object version.
 
+        ``delete_object`` is ``ObjectStorageClient.delete_object`` with the namespace and
+        bucket already bound once per batch.
+        """
+        object_name, version_id = item
+
+        # Per-object traces go to the debug log; printing them to the console from
+        # every worker serializes the fan-out on Rich's output lock.
         if version_id:
-            console.print(
-                f"[dim]Deleting object '{object_name}' (version '{version_id}')[/dim]"
-            )
-            object_storage.delete_object(
-                namespace_name=namespace,
-                bucket_name=bucket_name,
-                object_name=object_name,
-                version_id=version_id,
-            )
+            logger.debug("Deleting object '%s' (version '%s')", object_name, version_id)
+            self._call_with_retry(delete_object, object_name=object_name, version_id=version_id)
         else:
-            console.print(f"[dim]Deleting object '{object_name}'[/dim]")
-            object_storage.delete_object(
-                namespace_name=namespace,
-                bucket_name=bucket_name,
-                object_name=object_name,
+            logger.debug("Deleting object '%s'", object_name)
+            self._call_with_retry(delete_object, object_name=object_name)
+
+    def _call_with_retry(self, call: Callable[..., _T], **kwargs: Any) -> _T:
+        """Invoke a delete call, backing off on throttling and transient server errors.
+
+        The SDK's own retries are disabled for the call, so each attempt here is a single
+        HTTP request. Every attempt first waits for a slot from the ``--delete-rate``
+        limiter, if set.
+        """
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            started = time.monotonic()
+            try:
+                result = call(retry_strategy=_NO_RETRY_STRATEGY, **kwargs)
+            except ServiceError as exc:
+                self._record_request(time.monotonic() - started, throttled=exc.status in (429, 503))
+                attempt += 1
+                if exc.status not in _TRANSIENT_STATUSES or attempt > self._max_transient_retries:
+                    raise
+                delay = min(2**attempt + random.random(), self._max_retry_delay_seconds)
+                logger.debug(
+                    "Retrying after %s (attempt %d/%d) in %.1fs",
+                    exc.status,
+                    attempt,
+                    self._max_transient_retries,
+                    delay,
+                )
+                time.sleep(delay)
+            else:
+                self._record_request(time.monotonic() - started, throttled=False)
+                return result
+
+    def _record_request(self, latency_seconds: float, *, throttled: bool) -> None:
+        """Record one HTTP attempt; SDK retries are off, so throttled attempts are never hidden."""
+        with self._request_stats_lock:
+            self._request_stats.requests += 1
+            self._request_stats.latency_seconds += latency_seconds
+            if throttled:
+                self._request_stats.throttled += 1
+
+    def _tune_object_delete_workers(self) -> None:
+        """Adjust the per-object fan-out from the throttle rate and latency of the last batch."""
+        with self._request_stats_lock:
+            stats, self._request_stats = self._request_stats, _RequestStats()
+        if not stats.requests:
+            return
+
+        throttle_rate = stats.throttled / stats.requests
+        latency = stats.latency_seconds / stats.requests
+        previous_latency = self._latency_ema
+        self._latency_ema = (
+            latency
+            if previous_latency is None
+            else previous_latency + self._latency_smoothing * (latency - previous_latency)
+        )
+
+        workers = self._object_delete_workers
+        if throttle_rate > 0.05:
+            workers = max(workers // 2, self._min_tuned_object_delete_workers)
+        elif throttle_rate < 0.01 and (
+            previous_latency is None or latency <= previous_latency * 1.5
+        ):
+            workers = min(workers * 2, self._max_tuned_object_delete_workers)
+
+        if workers != self._object_delete_workers:
+            logger.debug(
+                "Adjusting delete workers %d -> %d (throttle rate %.1f%%, latency %.3fs)",
+                self._object_delete_workers,
+                workers,
+                throttle_rate * 100,
+                latency,
             )
+            self._object_delete_workers = workers
 
 
 class OKEDeletionCommand(BaseDeletionCommand):
@@ -390,8 +889,13 @@ class OKEDeletionCommand(BaseDeletionCommand):
     name = "oke-cluster"
     help_text = "Delete an OKE cluster (optionally deleting associated node pools first)."
 
-    _work_request_poll_seconds = 5
-    _work_request_max_attempts = 60
+    # Polling starts quickly so short work requests finish promptly, then backs off
+    # (with jitter so concurrent waiters spread out) to avoid hammering the API.
+    _work_request_poll_seconds = 1.0
+    _work_request_max_poll_seconds = 30.0
+    _work_request_backoff_factor = 1.7
+    _work_request_timeout_seconds = 300
+    _max_node_pool_workers = 8
 
     def add_arguments(self, parser: argparse.ArgumentParser) -> None:
         parser.add_argument(
@@ -476,13 +980,15 @@ class OKEDeletionCommand(BaseDeletionCommand):
         compartment_id: Optional[str],
         console: Console,
     ) -> None:
-        node_pools = list(
-            self._iter_node_pools(
+        node_pools = [
+            node_pool
+            for node_pool in self._iter_node_pools(
                 ce_client=ce_client,
                 cluster_id=cluster_id,
                 compartment_id=compartment_id,
             )
-        )
+            if getattr(node_pool, "id", None)
+        ]
 
         if not node_pools:
             console.print("[dim]No node pools found for cluster.[/dim]")
@@ -490,39 +996,85 @@ class OKEDeletionCommand(BaseDeletionCommand):
 
         console.print(f"[dim]Deleting {len(node_pools)} node pool(s) before cluster deletion.[/dim]")
 
-        for node_pool in node_pools:
-            node_pool_id = getattr(node_pool, "id", None)
-            node_pool_name = getattr(node_pool, "name", node_pool_id)
-            if not node_pool_id:
-                continue
-
-            console.print(
-                f"[dim]Deleting node pool '{node_pool_name}' ({node_pool_id})[/dim]"
+        # Node pool deletions are independent, so issue them all up front and then
+        # wait on the resulting work requests side by side.
+        max_workers = min(self._max_node_pool_workers, len(node_pools))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            work_requests = list(
+                executor.map(
+                    partial(self._start_node_pool_deletion, ce_client, console=console),
+                    node_pools,
+                )
             )
-            try:
-                response = ce_client.delete_node_pool(node_pool_id)
-            except ServiceError as exc:
-                if exc.status == 404:
-                    console.print(
-                        f"[yellow]Node pool '{node_pool_name}' already deleted.[/yellow]"
-                    )
-                    continue
-                raise ResourceDeletionError(
-                    f"Failed to delete node pool '{node_pool_name}': {exc.code} - {exc.message}"
-                ) from exc
 
-            work_request_id = getattr(response, "headers", {}).get("opc-work-request-id")
-            if work_request_id:
-                self._wait_for_work_request(
+        pending = [
+            (f"Node pool '{getattr(node_pool, 'name', node_pool.id)}'", work_request_id)
+            for node_pool, work_request_id in zip(node_pools, work_requests)
+            if work_request_id
+        ]
+        if not pending:
+            return
+
+        with Progress(
+            TextColumn("[dim]{task.description}[/dim]"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+            transient=True,
+        ) as progress:
+            task_id = progress.add_task("Waiting for node pool deletions", total=len(pending))
+            errors, _ = _run_bounded(
+                pending,
+                lambda request: self._wait_for_work_request(
                     ce_client=ce_client,
-                    work_request_id=work_request_id,
+                    work_request_id=request[1],
                     console=console,
-                    resource_label=f"Node pool '{node_pool_name}'",
-                )
-            else:
+                    resource_label=request[0],
+                ),
+                max_workers=self._max_node_pool_workers,
+                label=lambda request: request[0],
+                on_complete=lambda request: progress.update(
+                    task_id, advance=1, description=f"{request[0]} finished"
+                ),
+            )
+
+        if errors:
+            raise ResourceDeletionError(
+                f"Failed to delete {len(errors)} node pool(s): {errors[0]}"
+            )
+
+    def _start_node_pool_deletion(
+        self,
+        ce_client: oci.container_engine.ContainerEngineClient,
+        node_pool: Any,
+        *,
+        console: Console,
+    ) -> Optional[str]:
+        """Request deletion of one node pool and return its work request ID, if any."""
+        node_pool_id = node_pool.id
+        node_pool_name = getattr(node_pool, "name", node_pool_id)
+
+        console.print(
+            f"[dim]Deleting node pool '{node_pool_name}' ({node_pool_id})[/dim]"
+        )
+        try:
+            response = ce_client.delete_node_pool(node_pool_id)
+        except ServiceError as exc:
+            if exc.status == 404:
                 console.print(
-                    f"[yellow]No work request ID returned for node pool '{node_pool_name}'.[/yellow]"
+                    f"[yellow]Node pool '{node_pool_name}' already deleted.[/yellow]"
                 )
+                return None
+            raise ResourceDeletionError(
+                f"Failed to delete node pool '{node_pool_name}': {exc.code} - {exc.message}"
+            ) from exc
+
+        work_request_id = getattr(response, "headers", {}).get("opc-work-request-id")
+        if not work_request_id:
+            console.print(
+                f"[yellow]No work request ID returned for node pool '{node_pool_name}'.[/yellow]"
+            )
+        return work_request_id
 
     def _iter_node_pools(
         self,
@@ -538,10 +1090,9 @@ class OKEDeletionCommand(BaseDeletionCommand):
         response = ce_client.list_node_pools(**request_kwargs)
 
         while True:
-            for node_pool in getattr(response, "data", []) or []:
-                yield node_pool
+            yield from response.data or ()
 
-            next_page = getattr(response, "next_page", None)
+            next_page = response.next_page
             if not next_page:
                 break
 
@@ -560,9 +1111,9 @@ class OKEDeletionCommand(BaseDeletionCommand):
             f"[dim]Waiting for work request '{work_request_id}' ({resource_label})[/dim]"
         )
 
-        attempts = 0
-        while attempts < self._work_request_max_attempts:
-            attempts += 1
+        delay = float(self._work_request_poll_seconds)
+        started = time.monotonic()
+        while True:
             response = ce_client.get_work_request(work_request_id)
             status = getattr(getattr(response, "data", None), "status", None)
 
@@ -578,10 +1129,16 @@ class OKEDeletionCommand(BaseDeletionCommand):
                     f"Work request '{work_request_id}' for {resource_label} ended with status {status}: {error_message}"
                 )
 
+            remaining = self._work_request_timeout_seconds - (time.monotonic() - started)
+            if remaining <= 0:
+                break
+
+            sleep_seconds = min(delay + random.uniform(0, delay * 0.1), remaining)
             console.print(
-                f"[dim]Work request '{work_request_id}' status {status}. Polling again in {self._work_request_poll_seconds}s...[/dim]"
+                f"[dim]Work request '{work_request_id}' status {status}. Polling again in {sleep_seconds:.1f}s...[/dim]"
             )
-            time.sleep(self._work_request_poll_seconds)
+            time.sleep(sleep_seconds)
+            delay = min(delay * self._work_request_backoff_factor, self._work_request_max_poll_seconds)
 
         raise ResourceDeletionError(
             f"Timed out waiting for work request '{work_request_id}' to complete for {resource_label}."
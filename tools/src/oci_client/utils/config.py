@@ -3,13 +3,18 @@ Configuration utilities for loading and parsing YAML configurations.
 """
 
 import sys
+from functools import lru_cache
 from typing import Dict
 
 from rich.console import Console
 
 from .yamler import ConfigNotFoundError, get_region_compartment_pairs
 
-console = Console()
+
+@lru_cache(maxsize=None)
+def _console() -> Console:
+    """Create the error console on first use rather than at import time."""
+    return Console(stderr=True, highlight=False)
 
 
 def load_region_compartments(
@@ -42,12 +47,14 @@ def load_region_compartments(
         return region_compartments
 
     except ConfigNotFoundError as e:
-        console.print(f"[red]Configuration Error: {e}[/red]")
+        _console().print(f"[red]Configuration Error: {e}[/red]")
         sys.exit(1)
     except FileNotFoundError as e:
-        console.print(f"[red]File Error: {e}[/red]")
-        console.print(f"[yellow]Make sure the configuration file exists at: {config_file}[/yellow]")
+        _console().print(f"[red]File Error: {e}[/red]")
+        _console().print(
+            f"[yellow]Make sure the configuration file exists at: {config_file}[/yellow]"
+        )
         sys.exit(1)
     except Exception as e:
-        console.print(f"[red]Unexpected error loading configuration: {e}[/red]")
+        _console().print(f"[red]Unexpected error loading configuration: {e}[/red]")
         sys.exit(1)
@@ -2,29 +2,82 @@
 Display utilities for formatting and presenting OCI resources.
 """
 
-from typing import List
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, List, Tuple
 
 from rich.console import Console
-from rich.table import Table
 
 from ..models import BastionInfo, InstanceInfo
 
+if TYPE_CHECKING:
+    from rich.table import Table
+
 console = Console()
 
+# Column (header, style) layouts for the per-region resource tables
+_OKE_COLUMNS = (
+    ("Cluster", "cyan"),
+    ("Instance", "magenta"),
+    ("Private IP", "green"),
+    ("Shape", "yellow"),
+)
+_ODO_COLUMNS = (("Display Name", "cyan"), ("Private IP", "green"), ("Shape", "yellow"))
+_BASTION_COLUMNS = (
+    ("Bastion Name", "cyan"),
+    ("Type", "magenta"),
+    ("Max Session TTL", "yellow"),
+    ("Lifecycle State", "green"),
+    ("Target Subnet", "blue"),
+)
+
+
+def _resource_table(title: str, columns: Tuple[Tuple[str, str], ...]) -> "Table":
+    """
+    Create a table with the given column layout.
+
+    Rich keeps each table's cells on its Column objects, so columns cannot be shared
+    between tables; the layouts are shared as plain data instead. rich.table is only
+    imported once there is a table to draw.
+    """
+    from rich.table import Table
+
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+
+@contextmanager
+def buffered_output() -> Iterator[None]:
+    """
+    Hold console output for the duration of the block and write it out once on exit.
+
+    Uses Rich's own render buffer, so terminal detection, width and colors are unchanged;
+    nested blocks flush only when the outermost one exits.
+    """
+    with console:
+        yield
+
 
 def display_configuration_info(
     project_name: str, stage: str, config_file: str, region_count: int, region_compartments: dict
 ) -> None:
     """Display configuration information."""
-    console.print(f"[bold]Configuration:[/bold]")
-    console.print(f"  • Project: {project_name}")
-    console.print(f"  • Stage: {stage}")
-    console.print(f"  • Config File: {config_file}")
-    console.print(f"  • Regions Found: {region_count}")
-
-    console.print("\n[bold]Region:Compartment Pairs:[/bold]")
-    for region, compartment_id in region_compartments.items():
-        console.print(f"  • [cyan]{region}[/cyan]: {compartment_id[:50]}...")
+    lines = [
+        "[bold]Configuration:[/bold]",
+        f"  • Project: {project_name}",
+        f"  • Stage: {stage}",
+        f"  • Config File: {config_file}",
+        f"  • Regions Found: {region_count}",
+        "",
+        "[bold]Region:Compartment Pairs:[/bold]",
+    ]
+    lines.extend(
+        f"  • [cyan]{region}[/cyan]: {compartment_id:.50s}..."
+        for region, compartment_id in region_compartments.items()
+    )
+    # One render and write for the whole block instead of one per line
+    console.print("\n".join(lines))
 
 
 def display_region_header(region: str) -> None:
@@ -55,18 +108,19 @@ def display_oke_instances(region: str, instances: List[InstanceInfo]) -> None:
     console.print(f"[green]Found {len(instances)} OKE instances in {region}[/green]")
 
     # Display in table format
-    table = Table(title=f"OKE Instances - {region}")
-    table.add_column("Cluster", style="cyan")
-    table.add_column("Instance", style="magenta")
-    table.add_column("Private IP", style="green")
-    table.add_column("Shape", style="yellow")
-
-    for instance in instances[:5]:  # Show first 5 per region
-        cluster_name = instance.cluster_name or "N/A"
-        display_name = instance.display_name or instance.instance_id[:20] + "..."
-        private_ip = instance.private_ip or "N/A"
-        shape = instance.shape or "N/A"
-        table.add_row(cluster_name, display_name, private_ip, shape)
+    table = _resource_table(f"OKE Instances - {region}", _OKE_COLUMNS)
+
+    rows = [
+        (
+            instance.cluster_name or "N/A",
+            instance.display_name or f"{instance.instance_id:.20s}...",
+            instance.private_ip or "N/A",
+            instance.shape or "N/A",
+        )
+        for instance in instances[:5]  # Show first 5 per region
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -82,16 +136,14 @@ def display_odo_instances(region: str, instances: List[InstanceInfo]) -> None:
     console.print(f"[green]Found {len(instances)} ODO instances in {region}[/green]")
 
     # Display in table format
-    table = Table(title=f"ODO Instances - {region}")
-    table.add_column("Display Name", style="cyan")
-    table.add_column("Private IP", style="green")
-    table.add_column("Shape", style="yellow")
+    table = _resource_table(f"ODO Instances - {region}", _ODO_COLUMNS)
 
-    for instance in instances[:5]:  # Show first 5 per region
-        display_name = instance.display_name or "N/A"
-        private_ip = instance.private_ip or "N/A"
-        shape = instance.shape or "N/A"
-        table.add_row(display_name, private_ip, shape)
+    rows = [
+        (instance.display_name or "N/A", instance.private_ip or "N/A", instance.shape or "N/A")
+        for instance in instances[:5]  # Show first 5 per region
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -107,48 +159,57 @@ def display_bastions(region: str, bastions: List[BastionInfo]) -> None:
     console.print(f"[green]Found {len(bastions)} bastions in {region}[/green]")
 
     # Display in table format
-    table = Table(title=f"Bastions - {region}")
-    table.add_column("Bastion Name", style="cyan")
-    table.add_column("Type", style="magenta")
-    table.add_column("Max Session TTL", style="yellow")
-    table.add_column("Lifecycle State", style="green")
-    table.add_column("Target Subnet", style="blue")
-
-    for bastion in bastions[:5]:  # Show first 5 per region
-        bastion_name = bastion.bastion_name or "N/A"
-        bastion_type = bastion.bastion_type.value if bastion.bastion_type else "N/A"
-        max_ttl = f"{bastion.max_session_ttl // 3600}h" if bastion.max_session_ttl else "N/A"
-        lifecycle_state = bastion.lifecycle_state.value if bastion.lifecycle_state else "N/A"
-        target_subnet = bastion.target_subnet_id[:20] + "..." if bastion.target_subnet_id else "N/A"
-
-        table.add_row(bastion_name, bastion_type, max_ttl, lifecycle_state, target_subnet)
+    table = _resource_table(f"Bastions - {region}", _BASTION_COLUMNS)
+
+    rows = [
+        (
+            bastion.bastion_name or "N/A",
+            bastion.bastion_type.value if bastion.bastion_type else "N/A",
+            f"{bastion.max_session_ttl // 3600}h" if bastion.max_session_ttl else "N/A",
+            bastion.lifecycle_state.value if bastion.lifecycle_state else "N/A",
+            f"{bastion.target_subnet_id:.20s}..." if bastion.target_subnet_id else "N/A",
+        )
+        for bastion in bastions[:5]  # Show first 5 per region
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
 
 def display_summary(region_count: int, oke_count: int, odo_count: int, bastion_count: int) -> None:
     """Display final summary statistics."""
-    console.print(f"\n[bold green]📊 Summary:[/bold green]")
-    console.print(f"  • Total regions processed: {region_count}")
-    console.print(f"  • Total OKE instances found: {oke_count}")
-    console.print(f"  • Total ODO instances found: {odo_count}")
-    console.print(f"  • Total bastions found: {bastion_count}")
+    console.print(
+        "\n".join(
+            [
+                "\n[bold green]📊 Summary:[/bold green]",
+                f"  • Total regions processed: {region_count}",
+                f"  • Total OKE instances found: {oke_count}",
+                f"  • Total ODO instances found: {odo_count}",
+                f"  • Total bastions found: {bastion_count}",
+            ]
+        )
+    )
 
 
 def display_session_token_examples() -> None:
     """Display session token management examples."""
-    console.print("\n[bold blue]🔐 Session Token Management Examples:[/bold blue]")
-    console.print("[dim]# Create session token for specific region and profile[/dim]")
-    console.print(
-        "[cyan]client.create_session_token('my_profile', 'us-phoenix-1', 'bmc_operator_access')[/cyan]"
-    )
-    console.print()
-    console.print("[dim]# Create session token and switch client to use it[/dim]")
-    console.print("[cyan]client.create_and_use_session_token('my_profile', 'us-phoenix-1')[/cyan]")
-    console.print()
-    console.print("[dim]# Equivalent OCI CLI command[/dim]")
     console.print(
-        "[yellow]oci session authenticate --profile-name my_profile --region us-phoenix-1 --tenancy-name bmc_operator_access[/yellow]"
+        "\n".join(
+            [
+                "\n[bold blue]🔐 Session Token Management Examples:[/bold blue]",
+                "[dim]# Create session token for specific region and profile[/dim]",
+                "[cyan]client.create_session_token("
+                "'my_profile', 'us-phoenix-1', 'bmc_operator_access')[/cyan]",
+                "",
+                "[dim]# Create session token and switch client to use it[/dim]",
+                "[cyan]client.create_and_use_session_token('my_profile', 'us-phoenix-1')[/cyan]",
+                "",
+                "[dim]# Equivalent OCI CLI command[/dim]",
+                "[yellow]oci session authenticate --profile-name my_profile "
+                "--region us-phoenix-1 --tenancy-name bmc_operator_access[/yellow]",
+            ]
+        )
     )
 
 
@@ -2,63 +2,50 @@
 Resource collection utilities for OCI services.
 """
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, TypeVar
 
 from ..client import OCIClient
 from ..models import BastionInfo, InstanceInfo
 from .display import display_error
 
+T = TypeVar("T")
 
-def collect_oke_instances(
-    client: OCIClient, compartment_id: str, region: str
-) -> List[InstanceInfo]:
+
+def _collect(
+    list_resources: Callable[..., List[T]], compartment_id: str, region: str, label: str
+) -> List[T]:
     """
-    Collect OKE instances for a specific compartment and region.
+    List one resource type for a compartment, reporting failures instead of raising.
 
     Returns:
-        List of OKE instances or empty list if collection fails
+        The listed resources or empty list if collection fails
     """
     try:
-        oke_instances = client.list_oke_instances(compartment_id=compartment_id)
-        return oke_instances
+        return list_resources(compartment_id=compartment_id)
 
     except Exception as e:
-        display_error(f"Error listing OKE instances in {region}: {e}")
+        display_error(f"Error listing {label} in {region}: {e}")
         return []
 
 
-def collect_odo_instances(
+def collect_oke_instances(
     client: OCIClient, compartment_id: str, region: str
 ) -> List[InstanceInfo]:
-    """
-    Collect ODO instances for a specific compartment and region.
+    """Collect OKE instances for a specific compartment and region, or [] on failure."""
+    return _collect(client.list_oke_instances, compartment_id, region, "OKE instances")
 
-    Returns:
-        List of ODO instances or empty list if collection fails
-    """
-    try:
-        odo_instances = client.list_odo_instances(compartment_id=compartment_id)
-        return odo_instances
 
-    except Exception as e:
-        display_error(f"Error listing ODO instances in {region}: {e}")
-        return []
+def collect_odo_instances(
+    client: OCIClient, compartment_id: str, region: str
+) -> List[InstanceInfo]:
+    """Collect ODO instances for a specific compartment and region, or [] on failure."""
+    return _collect(client.list_odo_instances, compartment_id, region, "ODO instances")
 
 
 def collect_bastions(client: OCIClient, compartment_id: str, region: str) -> List[BastionInfo]:
-    """
-    Collect bastions for a specific compartment and region.
-
-    Returns:
-        List of bastions or empty list if collection fails
-    """
-    try:
-        bastions = client.list_bastions(compartment_id=compartment_id)
-        return bastions
-
-    except Exception as e:
-        display_error(f"Error listing bastions in {region}: {e}")
-        return []
+    """Collect bastions for a specific compartment and region, or [] on failure."""
+    return _collect(client.list_bastions, compartment_id, region, "bastions")
 
 
 def collect_all_resources(
@@ -70,8 +57,41 @@ def collect_all_resources(
     Returns:
         Tuple of (oke_instances, odo_instances, bastions)
     """
-    oke_instances = collect_oke_instances(client, compartment_id, region)
-    odo_instances = collect_odo_instances(client, compartment_id, region)
-    bastions = collect_bastions(client, compartment_id, region)
+    # The three listings are independent network calls; run them side by side so the
+    # region costs the slowest of them rather than their sum.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        oke_future = executor.submit(
+            _collect, client.list_oke_instances, compartment_id, region, "OKE instances"
+        )
+        odo_future = executor.submit(
+            _collect, client.list_odo_instances, compartment_id, region, "ODO instances"
+        )
+        bastion_future = executor.submit(
+            _collect, client.list_bastions, compartment_id, region, "bastions"
+        )
+
+        return oke_future.result(), odo_future.result(), bastion_future.result()
+
+
+def collect_all_regions(
+    region_task: Callable[[str, str], T],
+    region_compartments: Dict[str, str],
+    max_workers: int = 8,
+) -> Dict[str, T]:
+    """
+    Run ``region_task(region, compartment_id)`` for every region concurrently.
 
-    return oke_instances, odo_instances, bastions
+    Regions are independent, so wall time tracks the slowest region instead of the sum.
+
+    Returns:
+        Dict of region to task result, in the same order as ``region_compartments``
+    """
+    if not region_compartments:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(region_compartments))) as executor:
+        futures = {
+            region: executor.submit(region_task, region, compartment_id)
+            for region, compartment_id in region_compartments.items()
+        }
+        return {region: future.result() for region, future in futures.items()}
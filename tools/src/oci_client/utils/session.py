@@ -4,10 +4,9 @@ Session management utilities for OCI authentication.
 
 import os
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from rich.console import Console
+from typing import Any, Dict, Optional, Tuple
 
 try:
     import oci
@@ -15,9 +14,13 @@ except ImportError:
     oci = None
 
 from ..client import OCIClient, create_oci_session_token
-from .display import display_error, display_session_token_header, display_success, display_warning
-
-console = Console()
+from .display import (
+    console,
+    display_error,
+    display_session_token_header,
+    display_success,
+    display_warning,
+)
 
 
 def create_profile_for_region(project_name: str, stage: str, region: str) -> str:
@@ -25,6 +28,82 @@ def create_profile_for_region(project_name: str, stage: str, region: str) -> str
     return f"ssh_sync_{project_name}_{stage}_{region.replace('-', '_')}"
 
 
+# Session tokens typically expire after 1 hour; older than this is treated as expired to
+# leave a buffer
+_MAX_TOKEN_AGE_SECONDS = 50 * 60
+# Tokens issued this recently are trusted without a live probe
+_FRESH_TOKEN_AGE_SECONDS = 5 * 60
+# How long a live probe result is reused for the same token file
+_TOKEN_VALIDITY_TTL_SECONDS = 60.0
+_token_validity_cache: Dict[Tuple[str, float], Tuple[float, bool]] = {}
+
+
+@lru_cache(maxsize=64)
+def _read_profile_config(config_path: str, profile_name: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse one profile from an OCI config file; cached per file modification time."""
+    return oci.config.from_file(file_location=config_path, profile_name=profile_name)
+
+
+def _session_token_state(
+    profile_name: str, config_file_path: Optional[str] = None
+) -> Optional[Tuple[Dict[str, Any], Path, float]]:
+    """
+    Resolve a session-token profile to its config, token file and token modification time.
+
+    Returns:
+        Tuple of (config, token_file_path, token_mtime), or None when the config file
+        is missing, the profile has no session token, or its token file does not exist
+    """
+    config_path = config_file_path or str(Path.home() / ".oci" / "config")
+    try:
+        config_mtime_ns = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    config = _read_profile_config(config_path, profile_name, config_mtime_ns)
+    if "security_token_file" not in config:
+        return None
+
+    token_file_path = Path(config["security_token_file"])
+    try:
+        token_mtime = token_file_path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+    return dict(config), token_file_path, token_mtime
+
+
+def _is_session_token_valid(
+    config: Dict[str, Any], token_file_path: Path, token_mtime: float
+) -> bool:
+    """Check a resolved session token's age, confirming older tokens with a live API call."""
+    token_age_seconds = time.time() - token_mtime
+    if token_age_seconds > _MAX_TOKEN_AGE_SECONDS:
+        return False
+
+    # A token written in the last few minutes was just issued; no need to probe it
+    if token_age_seconds < _FRESH_TOKEN_AGE_SECONDS:
+        return True
+
+    # Regions sharing a profile reuse one probe result until the token file changes
+    cache_key = (str(token_file_path), token_mtime)
+    cached = _token_validity_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _TOKEN_VALIDITY_TTL_SECONDS:
+        return cached[1]
+
+    # Try to use the config to make a simple API call to verify it works
+    try:
+        identity_client = oci.identity.IdentityClient(config)
+        identity_client.get_tenancy(config["tenancy"])
+        is_valid = True
+    except Exception:
+        # If the API call fails, the token is probably expired or invalid
+        is_valid = False
+
+    _token_validity_cache[cache_key] = (time.monotonic(), is_valid)
+    return is_valid
+
+
 def check_session_token_validity(profile_name: str, config_file_path: Optional[str] = None) -> bool:
     """
     Check if a session token for the given profile is still valid.
@@ -40,42 +119,10 @@ def check_session_token_validity(profile_name: str, config_file_path: Optional[s
         return False
 
     try:
-        # Try to load the config for this profile
-        config_path = config_file_path or str(Path.home() / ".oci" / "config")
-
-        if not Path(config_path).exists():
-            return False
-
-        # Try to load the profile configuration
-        config = oci.config.from_file(file_location=config_path, profile_name=profile_name)
-
-        # Check if this is a session token profile (has security_token_file)
-        if "security_token_file" not in config:
-            return False
-
-        token_file_path = Path(config["security_token_file"])
-
-        # Check if the token file exists
-        if not token_file_path.exists():
-            return False
-
-        # Check if the token file is not too old (session tokens typically expire after 1 hour)
-        # We'll consider it valid if it's less than 50 minutes old to provide a buffer
-        token_age_seconds = time.time() - token_file_path.stat().st_mtime
-        max_age_seconds = 50 * 60  # 50 minutes
-
-        if token_age_seconds > max_age_seconds:
-            return False
-
-        # Try to use the config to make a simple API call to verify it works
-        try:
-            identity_client = oci.identity.IdentityClient(config)
-            # Make a simple API call to verify the token works
-            identity_client.get_tenancy(config["tenancy"])
-            return True
-        except Exception:
-            # If the API call fails, the token is probably expired or invalid
+        state = _session_token_state(profile_name, config_file_path)
+        if state is None:
             return False
+        return _is_session_token_valid(*state)
 
     except Exception:
         # If any step fails, assume the session token is not valid
@@ -95,26 +142,14 @@ def get_session_token_info(
         return None
 
     try:
-        config_path = config_file_path or str(Path.home() / ".oci" / "config")
-        if not Path(config_path).exists():
-            return None
-
-        config = oci.config.from_file(file_location=config_path, profile_name=profile_name)
-
-        if "security_token_file" not in config:
+        state = _session_token_state(profile_name, config_file_path)
+        if state is None:
             return None
-
-        token_file_path = Path(config["security_token_file"])
-        if not token_file_path.exists():
-            return None
-
-        token_age_seconds = time.time() - token_file_path.stat().st_mtime
-        token_age_minutes = token_age_seconds / 60
-
+        config, token_file_path, token_mtime = state
         return {
             "profile_name": profile_name,
             "token_file": str(token_file_path),
-            "age_minutes": token_age_minutes,
+            "age_minutes": (time.time() - token_mtime) / 60,
             "region": config.get("region", "unknown"),
         }
 
@@ -132,11 +167,15 @@ def setup_session_token(project_name: str, stage: str, region: str) -> str:
     """
     target_profile = create_profile_for_region(project_name, stage, region)
 
-    # Check if we already have a valid session token for this profile
-    if check_session_token_validity(target_profile):
-        token_info = get_session_token_info(target_profile)
-        if token_info:
-            age_minutes = token_info["age_minutes"]
+    # Check if we already have a valid session token for this profile; the profile and
+    # token file are resolved once and shared by the validity check and the age report
+    try:
+        state = _session_token_state(target_profile) if oci else None
+    except Exception:
+        state = None
+    if state is not None:
+        if _is_session_token_valid(*state):
+            age_minutes = (time.time() - state[2]) / 60
             display_success(
                 f"✓ Using existing valid session token for profile '{target_profile}' (age: {age_minutes:.1f} minutes)"
             )
@@ -2,16 +2,125 @@
 SSH Config generation utilities for OCI SSH Sync tool.
 """
 
+import os
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from rich.console import Console
+from rich.table import Table
 
 from ..client import OCIClient
-from ..models import BastionInfo, InstanceInfo
+from ..models import BastionInfo, InstanceInfo, SSHConfigEntry
 
 console = Console()
 
+# Text of one Host block including its trailing blank line, rendered in a single format call
+# per entry
+_ENTRY_TEMPLATE = (
+    "Host {entry.host}\n"
+    "  HostName {entry.hostname}\n"
+    "  ProxyCommand {entry.proxy_command}\n"
+    "  # Type: {type_label}\n"
+    "  # Private IP: {entry.private_ip}\n"
+    "  # Region: {entry.region}\n"
+    "{cluster_line}"
+    "\n"
+)
+
+# (header, style) for each column of the generated entries summary table
+_SUMMARY_COLUMNS = (
+    ("Host", "cyan"),
+    ("Type", "magenta"),
+    ("Private IP", "green"),
+    ("Region", "yellow"),
+    ("Cluster/Name", "blue"),
+)
+
+# Region keys of public OCI regions as reported by IdentityClient.list_regions (lower-cased).
+# Keys never change for a region, so known regions need no identity API call at all.
+_KNOWN_REGION_KEYS: Dict[str, str] = {
+    "af-johannesburg-1": "jnb",
+    "ap-chuncheon-1": "yny",
+    "ap-hyderabad-1": "hyd",
+    "ap-melbourne-1": "mel",
+    "ap-mumbai-1": "bom",
+    "ap-osaka-1": "kix",
+    "ap-seoul-1": "icn",
+    "ap-singapore-1": "sin",
+    "ap-sydney-1": "syd",
+    "ap-tokyo-1": "nrt",
+    "ca-montreal-1": "yul",
+    "ca-toronto-1": "yyz",
+    "eu-amsterdam-1": "ams",
+    "eu-frankfurt-1": "fra",
+    "eu-madrid-1": "mad",
+    "eu-marseille-1": "mrs",
+    "eu-milan-1": "lin",
+    "eu-paris-1": "cdg",
+    "eu-stockholm-1": "arn",
+    "eu-zurich-1": "zrh",
+    "il-jerusalem-1": "mtz",
+    "me-abudhabi-1": "auh",
+    "me-dubai-1": "dxb",
+    "me-jeddah-1": "jed",
+    "mx-monterrey-1": "mty",
+    "mx-queretaro-1": "qro",
+    "sa-bogota-1": "bog",
+    "sa-santiago-1": "scl",
+    "sa-saopaulo-1": "gru",
+    "sa-valparaiso-1": "vap",
+    "sa-vinhedo-1": "vcp",
+    "uk-cardiff-1": "cwl",
+    "uk-london-1": "lhr",
+    "us-ashburn-1": "iad",
+    "us-chicago-1": "ord",
+    "us-phoenix-1": "phx",
+    "us-sanjose-1": "sjc",
+}
+
+# Region key and internal domain by region name. Both are fixed for a region, so clients
+# created later for the same region skip the identity and storekeeper round-trips.
+_region_key_cache: Dict[str, str] = {}
+_internal_domain_cache: Dict[str, str] = {}
+
+
+def _region_key(client: OCIClient, region: str) -> str:
+    """Return the short region key (e.g. ``phx``) used in host names."""
+    region_key = _KNOWN_REGION_KEYS.get(region) or _region_key_cache.get(region)
+    if region_key is None:
+        try:
+            region_key = client.get_region_info().key
+        except Exception:
+            # Fallback to extracting region key from region name
+            return region.split("-")[1][:3]  # e.g., us-phoenix-1 -> pho
+        _region_key_cache[region] = region_key
+    return region_key
+
+
+def _internal_domain(client: OCIClient, region: str) -> Optional[str]:
+    """Return the region's internal domain for the bastion ProxyCommand."""
+    internal_domain = _internal_domain_cache.get(region)
+    if internal_domain is None:
+        try:
+            internal_domain = client.get_internal_domain()
+        except Exception:
+            return "oraclecloud.com"  # Fallback
+        if internal_domain is not None:
+            _internal_domain_cache[region] = internal_domain
+    return internal_domain
+
+
+@lru_cache(maxsize=32)
+def _proxy_command(region: str, compartment_id: str, internal_domain: Optional[str]) -> str:
+    """Build the bastion ProxyCommand, sharing one string per region/compartment."""
+    return (
+        f"ossh proxy -u %r --overlay-bastion --region {region} "
+        f"--compartment {compartment_id} -- ssh -A -p 22 "
+        f"ztb-internal.bastion.{region}.oci.{internal_domain} -s proxy:%h:%p"
+    )
+
 
 def generate_ssh_config_entries(
     client: OCIClient,
@@ -22,7 +131,7 @@ def generate_ssh_config_entries(
     project_name: str,
     stage: str,
     region: str,
-) -> List[Dict[str, str]]:
+) -> List[SSHConfigEntry]:
     """
     Generate SSH config entries for OKE and ODO instances.
 
@@ -37,42 +146,36 @@ def generate_ssh_config_entries(
         region: Region name
 
     Returns:
-        List of SSH config entry dictionaries
+        List of SSH config entries
     """
-    config_entries = []
+    config_entries: List[SSHConfigEntry] = []
 
-    # Get region info for naming
-    try:
-        region_info = client.get_region_info()
-        region_key = region_info.key
-    except:
-        # Fallback to extracting region key from region name
-        region_key = region.split("-")[1][:3]  # e.g., us-phoenix-1 -> pho
-
-    # Get internal domain for proxy command
-    try:
-        internal_domain = client.get_internal_domain()
-    except:
-        internal_domain = "oraclecloud.com"  # Fallback
+    # Get region info for naming and internal domain for proxy command
+    region_key = _region_key(client, region)
+    internal_domain = _internal_domain(client, region)
 
     # Generate proxy command template
-    proxy_command_template = (
-        f"ossh proxy -u %r --overlay-bastion --region {region} "
-        f"--compartment {compartment_id} -- ssh -A -p 22 "
-        f"ztb-internal.bastion.{region}.oci.{internal_domain} -s proxy:%h:%p"
-    )
+    proxy_command_template = _proxy_command(region, compartment_id, internal_domain)
+
+    find_bastion = client.find_bastion_for_subnet
+    # Index bastions by subnet once; each instance lookup is then a dict hit, not a scan
+    bastions_by_subnet = client.index_bastions_by_subnet(bastions)
+
+    # Host names differ only in their trailing counter
+    oke_host_prefix = f"{project_name}-{stage}-{region_key}-oc1-"
+    odo_host_prefix = f"odo-{oke_host_prefix}"
 
     # Process OKE instances
     if oke_instances:
         console.print(
             f"[bold cyan]Generating SSH config for {len(oke_instances)} OKE instances[/bold cyan]"
         )
-        cluster_counts = {}
+        cluster_counts: Counter[str] = Counter()
 
         for instance in oke_instances:
             # Find matching bastion using intelligent selection
-            bastion = client.find_bastion_for_subnet(
-                bastions, instance.subnet_id, instance.instance_id
+            bastion = find_bastion(
+                bastions, instance.subnet_id, instance.instance_id, bastions_by_subnet
             )
             if not bastion:
                 console.print(
@@ -82,25 +185,23 @@ def generate_ssh_config_entries(
 
             # Track instance count per cluster
             cluster = instance.cluster_name or "default"
-            if cluster not in cluster_counts:
-                cluster_counts[cluster] = 0
             cluster_counts[cluster] += 1
 
             # Generate host entry
-            host_name = f"{project_name}-{stage}-{region_key}-oc1-{cluster_counts[cluster]}"
+            host_name = f"{oke_host_prefix}{cluster_counts[cluster]}"
             hostname = f"{bastion.bastion_id}-{instance.private_ip}"
 
             config_entries.append(
-                {
-                    "host": host_name,
-                    "hostname": hostname,
-                    "proxy_command": proxy_command_template,
-                    "type": "oke",
-                    "cluster": cluster,
-                    "instance_id": instance.instance_id,
-                    "private_ip": instance.private_ip,
-                    "region": region,
-                }
+                SSHConfigEntry(
+                    host=host_name,
+                    hostname=hostname,
+                    proxy_command=proxy_command_template,
+                    type="oke",
+                    instance_id=instance.instance_id,
+                    private_ip=instance.private_ip,
+                    region=region,
+                    cluster=cluster,
+                )
             )
 
     # Process ODO instances
@@ -111,8 +212,8 @@ def generate_ssh_config_entries(
 
         for i, instance in enumerate(odo_instances, 1):
             # Find matching bastion using intelligent selection
-            bastion = client.find_bastion_for_subnet(
-                bastions, instance.subnet_id, instance.instance_id
+            bastion = find_bastion(
+                bastions, instance.subnet_id, instance.instance_id, bastions_by_subnet
             )
             if not bastion:
                 console.print(
@@ -121,27 +222,27 @@ def generate_ssh_config_entries(
                 continue
 
             # Generate host entry
-            host_name = f"odo-{project_name}-{stage}-{region_key}-oc1-{i}"
+            host_name = f"{odo_host_prefix}{i}"
             hostname = f"{bastion.bastion_id}-{instance.private_ip}"
 
             config_entries.append(
-                {
-                    "host": host_name,
-                    "hostname": hostname,
-                    "proxy_command": proxy_command_template,
-                    "type": "odo",
-                    "instance_id": instance.instance_id,
-                    "display_name": instance.display_name or "N/A",
-                    "private_ip": instance.private_ip,
-                    "region": region,
-                }
+                SSHConfigEntry(
+                    host=host_name,
+                    hostname=hostname,
+                    proxy_command=proxy_command_template,
+                    type="odo",
+                    instance_id=instance.instance_id,
+                    private_ip=instance.private_ip,
+                    region=region,
+                    display_name=instance.display_name or "N/A",
+                )
             )
 
     return config_entries
 
 
 def write_ssh_config_file(
-    config_entries: List[Dict[str, str]],
+    config_entries: List[SSHConfigEntry],
     output_file: str = "ssh_config_output.txt",
     project_name: str = "",
     stage: str = "",
@@ -150,7 +251,7 @@ def write_ssh_config_file(
     Write SSH config entries to file.
 
     Args:
-        config_entries: List of config entry dictionaries
+        config_entries: List of SSH config entries
         output_file: Output file path
         project_name: Project name for header
         stage: Stage for header
@@ -164,62 +265,64 @@ def write_ssh_config_file(
     # Create parent directory if it doesn't exist
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w") as f:
-        # Write header
-        f.write(f"# SSH Config for {project_name} ({stage})\n")
-        f.write(f"# Generated by OCI SSH Sync\n")
-        f.write(f"# Total entries: {len(config_entries)}\n\n")
-
-        # Write entries
-        for entry in config_entries:
-            f.write(f"Host {entry['host']}\n")
-            f.write(f"  HostName {entry['hostname']}\n")
-            f.write(f"  ProxyCommand {entry['proxy_command']}\n")
-            f.write(f"  # Type: {entry['type'].upper()}\n")
-            f.write(f"  # Private IP: {entry['private_ip']}\n")
-            f.write(f"  # Region: {entry['region']}\n")
-            if entry["type"] == "oke" and "cluster" in entry:
-                f.write(f"  # Cluster: {entry['cluster']}\n")
-            f.write("\n")
+    # Assemble the whole file in memory and write it once
+    lines = [
+        f"# SSH Config for {project_name} ({stage})\n",
+        "# Generated by OCI SSH Sync\n",
+        f"# Total entries: {len(config_entries)}\n\n",
+    ]
+    for entry in config_entries:
+        cluster_line = (
+            f"  # Cluster: {entry.cluster}\n"
+            if entry.type == "oke" and entry.cluster is not None
+            else ""
+        )
+        lines.append(
+            _ENTRY_TEMPLATE.format(
+                entry=entry, type_label=entry.type.upper(), cluster_line=cluster_line
+            )
+        )
+
+    # Replace the previous config atomically so an interrupted run never leaves it truncated
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        tmp_path.write_text("".join(lines), encoding="utf-8")
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     console.print(f"\n[bold green]✅ SSH config written to {output_file}[/bold green]")
     console.print(f"[green]Generated {len(config_entries)} SSH config entries[/green]")
 
     # Show summary by type
-    oke_count = sum(1 for entry in config_entries if entry["type"] == "oke")
-    odo_count = sum(1 for entry in config_entries if entry["type"] == "odo")
+    type_counts = Counter(entry.type for entry in config_entries)
 
-    console.print(f"[dim]  • OKE entries: {oke_count}[/dim]")
-    console.print(f"[dim]  • ODO entries: {odo_count}[/dim]")
+    console.print(f"[dim]  • OKE entries: {type_counts['oke']}[/dim]")
+    console.print(f"[dim]  • ODO entries: {type_counts['odo']}[/dim]")
 
 
-def display_ssh_config_summary(config_entries: List[Dict[str, str]]) -> None:
+def display_ssh_config_summary(config_entries: List[SSHConfigEntry]) -> None:
     """Display a summary table of SSH config entries."""
     if not config_entries:
         return
 
-    from rich.table import Table
-
     table = Table(title="Generated SSH Config Entries")
-    table.add_column("Host", style="cyan")
-    table.add_column("Type", style="magenta")
-    table.add_column("Private IP", style="green")
-    table.add_column("Region", style="yellow")
-    table.add_column("Cluster/Name", style="blue")
-
-    for entry in config_entries:
-        cluster_or_name = ""
-        if entry["type"] == "oke" and "cluster" in entry:
-            cluster_or_name = entry["cluster"]
-        elif entry["type"] == "odo" and "display_name" in entry:
-            cluster_or_name = entry["display_name"]
-
-        table.add_row(
-            entry["host"],
-            entry["type"].upper(),
-            entry["private_ip"],
-            entry["region"],
-            cluster_or_name,
+    for header, style in _SUMMARY_COLUMNS:
+        table.add_column(header, style=style)
+
+    # OKE entries only carry a cluster and ODO entries only a display name
+    rows = [
+        (
+            entry.host,
+            entry.type.upper(),
+            entry.private_ip,
+            entry.region,
+            entry.cluster or entry.display_name or "",
         )
+        for entry in config_entries
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print("\n", table)
@@ -1,14 +1,45 @@
+import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import yaml
 
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics, much faster
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 class ConfigNotFoundError(Exception):
     """Custom exception for configuration not found errors."""
 
     pass
 
 
+def _load_yaml(yaml_file_path: str) -> Any:
+    """
+    Load a YAML file, reusing the parsed document until the file changes on disk.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    try:
+        mtime_ns = os.stat(yaml_file_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"YAML file not found at path: {yaml_file_path}")
+    try:
+        return _parse_yaml(os.path.abspath(yaml_file_path), mtime_ns)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"YAML file not found at path: {yaml_file_path}")
+    except yaml.YAMLError as e:
+        raise yaml.YAMLError(f"Error parsing YAML file: {e}")
+
+
+@lru_cache(maxsize=16)
+def _parse_yaml(yaml_file_path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; cached per absolute path and modification time."""
+    with open(yaml_file_path, "r") as file:
+        return yaml.load(file, Loader=_SafeLoader)
+
+
 def get_compartment_id(
     yaml_file_path: str, project_name: str, stage: str, realm: str, region: str
 ) -> str:
@@ -30,14 +61,7 @@ def get_compartment_id(
         FileNotFoundError: If the YAML file cannot be found
         yaml.YAMLError: If the YAML file is malformed
     """
-    try:
-        # Load the YAML file
-        with open(yaml_file_path, "r") as file:
-            config = yaml.safe_load(file)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"YAML file not found at path: {yaml_file_path}")
-    except yaml.YAMLError as e:
-        raise yaml.YAMLError(f"Error parsing YAML file: {e}")
+    config = _load_yaml(yaml_file_path)
 
     # Navigate through the configuration structure
     error_path = []
@@ -139,14 +163,7 @@ def get_region_compartment_pairs(
         FileNotFoundError: If the YAML file cannot be found
         yaml.YAMLError: If the YAML file is malformed
     """
-    try:
-        # Load the YAML file
-        with open(yaml_file_path, "r") as file:
-            config = yaml.safe_load(file)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"YAML file not found at path: {yaml_file_path}")
-    except yaml.YAMLError as e:
-        raise yaml.YAMLError(f"Error parsing YAML file: {e}")
+    config = _load_yaml(yaml_file_path)
 
     # Check if 'projects' exists
     if "projects" not in config:
@@ -193,8 +210,7 @@ def list_available_configs(yaml_file_path: str) -> Dict[str, Any]:
         Dict containing the structure of available configurations
     """
     try:
-        with open(yaml_file_path, "r") as file:
-            config = yaml.safe_load(file)
+        config = _load_yaml(yaml_file_path)
 
         from typing import List
 
@@ -6,16 +6,19 @@ Upgrade OKE node pools based on the generated HTML report.
 import argparse
 import logging
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import AbstractSet, Any, Dict, List, Optional, Sequence, Tuple
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.logging import RichHandler
+from rich.text import Text
 
 from oci.container_engine.models import UpdateNodePoolDetails
 
-from oci_client.models import OKENodePoolInfo, OKEClusterInfo
+from oci_client.models import DATACLASS_SLOTS, OKEClusterInfo, OKENodePoolInfo
 from oci_client.utils.display import display_warning
 from oci_client.utils.session import create_oci_client, setup_session_token
 from oke_upgrade import ReportCluster, load_clusters_from_report
@@ -23,8 +26,15 @@ from oke_upgrade import ReportCluster, load_clusters_from_report
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Clusters processed at once; bounds concurrent OKE API load and open connections
+MAX_CLUSTER_WORKERS = 8
+# Node pool upgrade requests in flight per cluster; multiplies with MAX_CLUSTER_WORKERS
+MAX_NODE_POOL_WORKERS = 4
 
-@dataclass
+_VERSION_DIGITS = re.compile(r"\d+")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class NodePoolUpgradeResult:
     """Outcome for a node pool upgrade attempt."""
 
@@ -36,23 +46,58 @@ class NodePoolUpgradeResult:
     skipped: bool = False
     error: Optional[str] = None
 
-
-def _build_filters(args: argparse.Namespace) -> Dict[str, List[str]]:
-    filters: Dict[str, List[str]] = {}
+    @classmethod
+    def failure(
+        cls,
+        entry: ReportCluster,
+        error: str,
+        *,
+        node_pool: Optional[OKENodePoolInfo] = None,
+        target_version: Optional[str] = None,
+    ) -> "NodePoolUpgradeResult":
+        """Result for a cluster or node pool that could not be upgraded."""
+        return cls(entry, node_pool, target_version, None, success=False, error=error)
+
+    @classmethod
+    def skipped_ok(
+        cls, entry: ReportCluster, node_pool: OKENodePoolInfo, target_version: str
+    ) -> "NodePoolUpgradeResult":
+        """Result for a node pool already on the target version."""
+        return cls(entry, node_pool, target_version, None, success=True, skipped=True)
+
+    @classmethod
+    def triggered(
+        cls,
+        entry: ReportCluster,
+        node_pool: OKENodePoolInfo,
+        target_version: str,
+        work_request_id: Optional[str] = None,
+    ) -> "NodePoolUpgradeResult":
+        """Result for a node pool upgrade that was started, or planned during a dry run."""
+        return cls(entry, node_pool, target_version, work_request_id, success=True)
+
+
+def _warning_text(message: str) -> Text:
+    """Render a warning the way display_warning prints it, for buffered cluster output."""
+    return Text.from_markup(f"[yellow]{message}[/yellow]")
+
+
+def _build_filters(args: argparse.Namespace) -> Dict[str, AbstractSet[str]]:
+    filters: Dict[str, AbstractSet[str]] = {}
     if args.project:
-        filters["project"] = [args.project]
+        filters["project"] = frozenset((args.project,))
     if args.stage:
-        filters["stage"] = [args.stage]
+        filters["stage"] = frozenset((args.stage,))
     if args.region:
-        filters["region"] = [args.region]
+        filters["region"] = frozenset((args.region,))
     if args.cluster:
-        filters["cluster"] = [args.cluster]
+        filters["cluster"] = frozenset((args.cluster,))
     if args.node_pool:
-        filters["node_pool"] = args.node_pool
+        filters["node_pool"] = frozenset(args.node_pool)
     return filters
 
 
-def _entry_matches_filters(entry: ReportCluster, filters: Dict[str, List[str]]) -> bool:
+def _entry_matches_filters(entry: ReportCluster, filters: Dict[str, AbstractSet[str]]) -> bool:
     project_filter = filters.get("project")
     stage_filter = filters.get("stage")
     region_filter = filters.get("region")
@@ -69,17 +114,18 @@ def _entry_matches_filters(entry: ReportCluster, filters: Dict[str, List[str]])
     return True
 
 
-def _node_pool_matches_filters(node_pool: OKENodePoolInfo, filters: Dict[str, List[str]]) -> bool:
+def _node_pool_matches_filters(node_pool: OKENodePoolInfo, filters: Dict[str, AbstractSet[str]]) -> bool:
     node_pool_filter = filters.get("node_pool")
     if not node_pool_filter:
         return True
     return node_pool.node_pool_id in node_pool_filter or node_pool.name in node_pool_filter
 
 
+@lru_cache(maxsize=256)
 def _version_key(version: Optional[str]) -> Tuple[int, ...]:
     if not version:
         return (0,)
-    digits = re.findall(r"\d+", version)
+    digits = _VERSION_DIGITS.findall(version)
     if not digits:
         return (0,)
     return tuple(int(value) for value in digits)
@@ -196,222 +242,254 @@ def _upgrade_node_pool(client: Any, node_pool_id: str, target_version: str) -> s
     return response.headers.get("opc-work-request-id", "")
 
 
-def perform_node_pool_upgrades(
-    entries: Sequence[ReportCluster],
+def _upgrade_cluster_node_pools(
+    entry: ReportCluster,
+    client: Any,
     *,
     requested_version: Optional[str],
-    filters: Dict[str, List[str]],
+    filters: Dict[str, AbstractSet[str]],
     dry_run: bool,
 ) -> List[NodePoolUpgradeResult]:
-    results: List[NodePoolUpgradeResult] = []
-    clients: Dict[Tuple[str, str, str], Any] = {}
+    """
+    Check one cluster's control plane and upgrade (or plan) its matching node pools.
 
-    for entry in entries:
-        if filters and not _entry_matches_filters(entry, filters):
-            logger.debug(
-                "Skipping cluster %s due to filters project=%s stage=%s region=%s cluster_filter=%s node_pool_filter=%s",
-                entry.cluster_name,
-                filters.get("project"),
-                filters.get("stage"),
-                filters.get("region"),
-                filters.get("cluster"),
-                filters.get("node_pool"),
-            )
-            continue
+    Console output is collected while the cluster is processed and printed as one group,
+    so clusters handled concurrently do not interleave their lines.
+    """
+    messages: List[RenderableType] = []
+    try:
+        return _collect_cluster_node_pool_upgrades(
+            entry,
+            client,
+            messages,
+            requested_version=requested_version,
+            filters=filters,
+            dry_run=dry_run,
+        )
+    finally:
+        if messages:
+            console.print(Group(*messages))
 
-        cache_key = (entry.project, entry.stage, entry.region)
-        client = clients.get(cache_key)
-        if client is None:
-            profile_name = setup_session_token(entry.project, entry.stage, entry.region)
-            client = create_oci_client(entry.region, profile_name)
-            if not client:
-                message = (
-                    f"Unable to initialize OCI client for {entry.region} "
-                    f"(project={entry.project}, stage={entry.stage})."
-                )
-                display_warning(message)
-                results.append(
-                    NodePoolUpgradeResult(
-                        entry=entry,
-                        node_pool=None,
-                        target_version=None,
-                        work_request_id=None,
-                        success=False,
-                        error=message,
-                    )
-                )
-                continue
-            clients[cache_key] = client
 
-        try:
-            cluster_info = _resolve_cluster_details(client, entry.cluster_ocid)
-        except Exception as exc:  # pragma: no cover - defensive guard
-            message = (
-                f"Failed to fetch cluster details for {entry.cluster_name} "
-                f"({entry.cluster_ocid}): {exc}"
-            )
-            display_warning(message)
-            results.append(
-                NodePoolUpgradeResult(
-                    entry=entry,
-                    node_pool=None,
-                    target_version=None,
-                    work_request_id=None,
-                    success=False,
-                    error=str(exc),
-                )
-            )
-            continue
+def _collect_cluster_node_pool_upgrades(
+    entry: ReportCluster,
+    client: Any,
+    messages: List[RenderableType],
+    *,
+    requested_version: Optional[str],
+    filters: Dict[str, AbstractSet[str]],
+    dry_run: bool,
+) -> List[NodePoolUpgradeResult]:
+    """Upgrade (or plan) one cluster's node pools, appending console output to ``messages``."""
+    results: List[NodePoolUpgradeResult] = []
 
-        target_version = requested_version or cluster_info.kubernetes_version
-
-        readiness_error = _control_plane_ready(entry, cluster_info, requested_version)
-        if readiness_error:
-            display_warning(readiness_error)
-            results.append(
-                NodePoolUpgradeResult(
-                    entry=entry,
-                    node_pool=None,
-                    target_version=target_version,
-                    work_request_id=None,
-                    success=False,
-                    error=readiness_error,
-                )
-            )
-            continue
+    try:
+        cluster_info = _resolve_cluster_details(client, entry.cluster_ocid)
+    except Exception as exc:  # pragma: no cover - defensive guard
+        message = (
+            f"Failed to fetch cluster details for {entry.cluster_name} "
+            f"({entry.cluster_ocid}): {exc}"
+        )
+        messages.append(_warning_text(message))
+        results.append(NodePoolUpgradeResult.failure(entry, str(exc)))
+        return results
 
-        try:
-            node_pools = _list_node_pools(client, entry.cluster_ocid, entry.compartment_ocid)
-        except Exception as exc:  # pragma: no cover - defensive guard
-            message = (
-                f"Failed to list node pools for cluster {entry.cluster_name} "
-                f"({entry.cluster_ocid}): {exc}"
-            )
-            display_warning(message)
-            results.append(
-                NodePoolUpgradeResult(
-                    entry=entry,
-                    node_pool=None,
-                    target_version=target_version,
-                    work_request_id=None,
-                    success=False,
-                    error=str(exc),
-                )
-            )
-            continue
+    target_version = requested_version or cluster_info.kubernetes_version
 
-        filtered_node_pools = [
-            node_pool for node_pool in node_pools if _node_pool_matches_filters(node_pool, filters)
-        ]
+    readiness_error = _control_plane_ready(entry, cluster_info, requested_version)
+    if readiness_error:
+        messages.append(_warning_text(readiness_error))
+        results.append(
+            NodePoolUpgradeResult.failure(entry, readiness_error, target_version=target_version)
+        )
+        return results
 
-        if not filtered_node_pools:
-            display_warning(
-                f"No node pools matched the filters for cluster {entry.cluster_name} ({entry.cluster_ocid})."
+    try:
+        node_pools = _list_node_pools(client, entry.cluster_ocid, entry.compartment_ocid)
+    except Exception as exc:  # pragma: no cover - defensive guard
+        message = (
+            f"Failed to list node pools for cluster {entry.cluster_name} "
+            f"({entry.cluster_ocid}): {exc}"
+        )
+        messages.append(_warning_text(message))
+        results.append(
+            NodePoolUpgradeResult.failure(entry, str(exc), target_version=target_version)
+        )
+        return results
+
+    filtered_node_pools = [
+        node_pool for node_pool in node_pools if _node_pool_matches_filters(node_pool, filters)
+    ]
+
+    if not filtered_node_pools:
+        messages.append(
+            _warning_text(
+                f"No node pools matched the filters for cluster {entry.cluster_name} "
+                f"({entry.cluster_ocid})."
             )
-            results.append(
-                NodePoolUpgradeResult(
-                    entry=entry,
-                    node_pool=None,
-                    target_version=target_version,
-                    work_request_id=None,
-                    success=False,
-                    error="No node pools matched filters.",
-                )
+        )
+        results.append(
+            NodePoolUpgradeResult.failure(
+                entry, "No node pools matched filters.", target_version=target_version
             )
-            continue
+        )
+        return results
 
-        assert target_version is not None  # for mypy; control plane readiness ensures this
+    assert target_version is not None  # for mypy; control plane readiness ensures this
 
-        cluster_version_key = _version_key(cluster_info.kubernetes_version)
+    cluster_version_key = _version_key(cluster_info.kubernetes_version)
+    target_version_key = _version_key(target_version)
 
+    # Upgrade requests are independent per node pool, so they are sent concurrently; each
+    # outcome is slotted back into node pool order once every request has returned.
+    pending: List[Tuple[int, OKENodePoolInfo, "Future[str]"]] = []
+    with ThreadPoolExecutor(max_workers=MAX_NODE_POOL_WORKERS) as executor:
         for node_pool in filtered_node_pools:
             current_version = node_pool.kubernetes_version
-            if current_version and _version_key(current_version) == _version_key(target_version):
-                console.print(
-                    f"[dim]Node pool [cyan]{node_pool.name}[/cyan] ({node_pool.node_pool_id}) "
-                    f"already on {target_version}. Skipping.[/dim]"
-                )
-                results.append(
-                    NodePoolUpgradeResult(
-                        entry=entry,
-                        node_pool=node_pool,
-                        target_version=target_version,
-                        work_request_id=None,
-                        success=True,
-                        skipped=True,
+            current_version_key = _version_key(current_version)
+            if current_version and current_version_key == target_version_key:
+                messages.append(
+                    Text.from_markup(
+                        f"[dim]Node pool [cyan]{node_pool.name}[/cyan] ({node_pool.node_pool_id}) "
+                        f"already on {target_version}. Skipping.[/dim]"
                     )
                 )
+                results.append(NodePoolUpgradeResult.skipped_ok(entry, node_pool, target_version))
                 continue
 
-            if current_version and cluster_version_key < _version_key(current_version):
+            if current_version and cluster_version_key < current_version_key:
                 message = (
                     f"Node pool {node_pool.name} ({node_pool.node_pool_id}) reports "
                     f"version {current_version}, which is ahead of the cluster control plane "
                     f"{cluster_info.kubernetes_version}. Skipping."
                 )
-                display_warning(message)
+                messages.append(_warning_text(message))
                 results.append(
-                    NodePoolUpgradeResult(
-                        entry=entry,
-                        node_pool=node_pool,
-                        target_version=target_version,
-                        work_request_id=None,
-                        success=False,
-                        error=message,
+                    NodePoolUpgradeResult.failure(
+                        entry, message, node_pool=node_pool, target_version=target_version
                     )
                 )
                 continue
 
             if dry_run:
-                console.print(
-                    f"[yellow]DRY RUN[/yellow] Would upgrade node pool [cyan]{node_pool.name}[/cyan] "
-                    f"({node_pool.node_pool_id}) to [green]{target_version}[/green]."
-                )
-                results.append(
-                    NodePoolUpgradeResult(
-                        entry=entry,
-                        node_pool=node_pool,
-                        target_version=target_version,
-                        work_request_id=None,
-                        success=True,
+                messages.append(
+                    Text.from_markup(
+                        f"[yellow]DRY RUN[/yellow] Would upgrade node pool "
+                        f"[cyan]{node_pool.name}[/cyan] ({node_pool.node_pool_id}) to "
+                        f"[green]{target_version}[/green]."
                     )
                 )
+                results.append(NodePoolUpgradeResult.triggered(entry, node_pool, target_version))
                 continue
 
-            try:
-                work_request_id = _upgrade_node_pool(client, node_pool.node_pool_id, target_version)
-                console.print(
-                    f"[bold green]✓[/bold green] Upgrade triggered for node pool [cyan]{node_pool.name}[/cyan] "
-                    f"({node_pool.node_pool_id}) to [green]{target_version}[/green]. "
-                    f"Work request: [magenta]{work_request_id or 'N/A'}[/magenta]"
+            pending.append(
+                (
+                    len(results) + len(pending),
+                    node_pool,
+                    executor.submit(
+                        _upgrade_node_pool, client, node_pool.node_pool_id, target_version
+                    ),
                 )
-                results.append(
-                    NodePoolUpgradeResult(
-                        entry=entry,
-                        node_pool=node_pool,
-                        target_version=target_version,
-                        work_request_id=work_request_id or None,
-                        success=True,
-                    )
+            )
+
+    for position, node_pool, future in pending:
+        try:
+            work_request_id = future.result()
+            messages.append(
+                Text.from_markup(
+                    f"[bold green]✓[/bold green] Upgrade triggered for node pool "
+                    f"[cyan]{node_pool.name}[/cyan] ({node_pool.node_pool_id}) to "
+                    f"[green]{target_version}[/green]. "
+                    f"Work request: [magenta]{work_request_id or 'N/A'}[/magenta]"
                 )
-            except Exception as exc:  # pragma: no cover - defensive guard
+            )
+            result = NodePoolUpgradeResult.triggered(
+                entry, node_pool, target_version, work_request_id or None
+            )
+        except Exception as exc:  # pragma: no cover - defensive guard
+            message = (
+                f"Failed to trigger upgrade for node pool {node_pool.name} "
+                f"({node_pool.node_pool_id}): {exc}"
+            )
+            messages.append(_warning_text(message))
+            result = NodePoolUpgradeResult.failure(
+                entry, str(exc), node_pool=node_pool, target_version=target_version
+            )
+        results.insert(position, result)
+
+    return results
+
+
+def perform_node_pool_upgrades(
+    entries: Sequence[ReportCluster],
+    *,
+    requested_version: Optional[str],
+    filters: Dict[str, AbstractSet[str]],
+    dry_run: bool,
+) -> List[NodePoolUpgradeResult]:
+    # Results are gathered per entry so they come back in report order regardless of which
+    # cluster finishes first
+    entry_results: List[List[NodePoolUpgradeResult]] = []
+    pending: List[Tuple[int, ReportCluster, Any]] = []
+    clients: Dict[Tuple[str, str, str], Any] = {}
+
+    matched_entries = list(entries)
+    if filters:
+        matched_entries = [entry for entry in entries if _entry_matches_filters(entry, filters)]
+        if len(matched_entries) < len(entries):
+            matched_ids = {id(entry) for entry in matched_entries}
+            logger.debug(
+                "Skipping %d cluster(s) due to filters project=%s stage=%s region=%s cluster_filter=%s node_pool_filter=%s: %s",
+                len(entries) - len(matched_entries),
+                filters.get("project"),
+                filters.get("stage"),
+                filters.get("region"),
+                filters.get("cluster"),
+                filters.get("node_pool"),
+                ", ".join(entry.cluster_name for entry in entries if id(entry) not in matched_ids),
+            )
+
+    # Session token setup may need an interactive login, so clients are resolved serially;
+    # the per-cluster OCI round-trips then run concurrently below.
+    for entry in matched_entries:
+        cache_key = (entry.project, entry.stage, entry.region)
+        client = clients.get(cache_key)
+        if client is None:
+            profile_name = setup_session_token(entry.project, entry.stage, entry.region)
+            client = create_oci_client(entry.region, profile_name)
+            if not client:
                 message = (
-                    f"Failed to trigger upgrade for node pool {node_pool.name} "
-                    f"({node_pool.node_pool_id}): {exc}"
+                    f"Unable to initialize OCI client for {entry.region} "
+                    f"(project={entry.project}, stage={entry.stage})."
                 )
-                logger.error(message)
-                results.append(
-                    NodePoolUpgradeResult(
-                        entry=entry,
-                        node_pool=node_pool,
-                        target_version=target_version,
-                        work_request_id=None,
-                        success=False,
-                        error=str(exc),
-                    )
+                display_warning(message)
+                entry_results.append([NodePoolUpgradeResult.failure(entry, message)])
+                continue
+            clients[cache_key] = client
+
+        pending.append((len(entry_results), entry, client))
+        entry_results.append([])
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(MAX_CLUSTER_WORKERS, len(pending))) as executor:
+            futures = [
+                (
+                    index,
+                    executor.submit(
+                        _upgrade_cluster_node_pools,
+                        entry,
+                        client,
+                        requested_version=requested_version,
+                        filters=filters,
+                        dry_run=dry_run,
+                    ),
                 )
+                for index, entry, client in pending
+            ]
+            for index, future in futures:
+                entry_results[index] = future.result()
 
-    return results
+    return [result for results in entry_results for result in results]
 
 
 def configure_logging(verbose: bool = False) -> None:
@@ -483,12 +561,17 @@ def main() -> int:
         dry_run=args.dry_run,
     )
 
-    initiated = sum(
-        1 for result in results if result.success and not result.skipped and not args.dry_run
-    )
-    planned = sum(1 for result in results if result.success and not result.skipped and args.dry_run)
-    skipped = sum(1 for result in results if result.skipped)
-    failures = sum(1 for result in results if not result.success)
+    triggered = skipped = failures = 0
+    for result in results:
+        if result.skipped:
+            skipped += 1
+        elif not result.success:
+            failures += 1
+        else:
+            triggered += 1
+    # Successful non-skipped results are planned upgrades in a dry run, initiated ones otherwise
+    initiated = 0 if args.dry_run else triggered
+    planned = triggered if args.dry_run else 0
 
     if args.dry_run:
         console.print(
@@ -6,25 +6,40 @@ Initiate OKE cluster upgrades based on the generated HTML report.
 import argparse
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from rich.console import Console
+try:
+    import lxml.html as lxml_html
+except ImportError:  # optional speed-up; the html.parser fallback below is used instead
+    lxml_html = None
+
+from rich.console import Console, Group, RenderableType
 from rich.logging import RichHandler
+from rich.text import Text
 
-from oci_client.models import OKEClusterInfo
+from oci_client.models import DATACLASS_SLOTS, OKEClusterInfo
 from oci_client.utils.display import display_warning
 from oci_client.utils.session import create_oci_client, setup_session_token
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Cluster upgrade requests in flight at once; bounds concurrent OKE API load
+MAX_CLUSTER_WORKERS = 8
 
-@dataclass
+# Version strings repeat across clusters and regions, so parsing them is cached below
+_VERSION_DIGITS = re.compile(r"\d+")
+_VERSION_PATTERN = re.compile(r"\d+(?:\.\d+)*")
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ReportCluster:
-    """Cluster entry parsed from the HTML report."""
+    """Cluster entry parsed from the HTML report; fields follow the report's column order."""
 
     project: str
     stage: str
@@ -61,7 +76,8 @@ class _ReportHTMLParser(HTMLParser):
             self._current_row = []
         elif tag == "td" and self._in_tr:
             self._in_td = True
-            self._cell_buffer = []
+            # One buffer is reused for every cell; it is joined into a new string on </td>
+            self._cell_buffer.clear()
 
     def handle_endtag(self, tag: str) -> None:
         if tag == "tbody":
@@ -85,6 +101,11 @@ class _ReportHTMLParser(HTMLParser):
             self._cell_buffer.append(data)
 
 
+def _warning_text(message: str) -> Text:
+    """Render a warning the way display_warning prints it, for buffered cluster output."""
+    return Text.from_markup(f"[yellow]{message}[/yellow]")
+
+
 def _parse_available_upgrades(raw_value: str) -> List[str]:
     if not raw_value or raw_value.lower() == "none":
         return []
@@ -102,68 +123,98 @@ def _parse_available_upgrades(raw_value: str) -> List[str]:
     return versions
 
 
-def _parse_report_rows(rows: Iterable[Sequence[str]]) -> List[ReportCluster]:
-    parsed_rows: List[ReportCluster] = []
+def _parse_report_rows(
+    rows: Iterable[Sequence[str]],
+    filters: Optional[Dict[str, AbstractSet[str]]] = None,
+) -> List[ReportCluster]:
+    # Columns: project, stage, region, cluster name, cluster version, available upgrades,
+    # node pools (unused), compartment OCID, cluster OCID. Shorter rows are summary rows
+    # (e.g. "no clusters discovered"), and filtered-out rows are dropped before their
+    # upgrade lists are parsed.
+    return [
+        ReportCluster(
+            row[0],
+            row[1],
+            row[2],
+            row[3],
+            row[4],
+            _parse_available_upgrades(row[5]),
+            row[7],
+            row[8],
+        )
+        for row in rows
+        if len(row) >= 9
+        and (not filters or _fields_match_filters(row[0], row[1], row[2], row[3], row[8], filters))
+    ]
 
-    for raw_row in rows:
-        if len(raw_row) < 9:
-            # Skip summary rows (e.g., "no clusters discovered").
-            continue
 
-        project, stage, region, cluster_name, cluster_version, upgrades_raw, _, compartment_ocid, cluster_ocid = (
-            raw_row[0],
-            raw_row[1],
-            raw_row[2],
-            raw_row[3],
-            raw_row[4],
-            raw_row[5],
-            raw_row[6],
-            raw_row[7],
-            raw_row[8],
-        )
+def _extract_report_rows(html_content: str) -> List[List[str]]:
+    """
+    Return the stripped cell text of every non-empty ``<tbody>`` row in the report.
 
-        parsed_rows.append(
-            ReportCluster(
-                project=project,
-                stage=stage,
-                region=region,
-                cluster_name=cluster_name,
-                cluster_version=cluster_version,
-                available_upgrades=_parse_available_upgrades(upgrades_raw),
-                compartment_ocid=compartment_ocid,
-                cluster_ocid=cluster_ocid,
-            )
-        )
+    Uses lxml's C parser when it is installed and falls back to ``_ReportHTMLParser``.
+    """
+    if lxml_html is None:
+        parser = _ReportHTMLParser()
+        parser.feed(html_content)
+        return parser.rows
 
-    return parsed_rows
+    if not html_content.strip():
+        return []
+    tree = lxml_html.fromstring(html_content)
+    rows = (
+        [cell.text_content().strip() for cell in row.iterfind("td")]
+        for row in tree.iterfind(".//tbody/tr")
+    )
+    return [row for row in rows if row]
 
 
-def load_clusters_from_report(report_path: Path) -> List[ReportCluster]:
-    """Read and parse the HTML report file."""
-    parser = _ReportHTMLParser()
-    html_content = report_path.read_text(encoding="utf-8")
-    parser.feed(html_content)
-    return _parse_report_rows(parser.rows)
+def load_clusters_from_report(
+    report_path: Path,
+    filters: Optional[Dict[str, AbstractSet[str]]] = None,
+) -> List[ReportCluster]:
+    """Read and parse the HTML report file, keeping only rows that match ``filters``."""
+    # The report is read whole, so decode the bytes directly instead of going through a
+    # text wrapper; it is still decoded here (not by lxml) since reports may lack a charset
+    html_content = report_path.read_bytes().decode("utf-8")
+    return _parse_report_rows(_extract_report_rows(html_content), filters)
 
 
+@lru_cache(maxsize=256)
 def _version_key(version: str) -> Tuple[int, ...]:
-    digits = re.findall(r"\d+", version)
+    # Plain dotted versions ("1.34.1", "v1.34.1") split directly; anything else is scanned
+    # for digit runs, which gives the same key for the plain forms
+    core = version[1:] if version[:1] in ("v", "V") else version
+    parts = core.split(".")
+    if all(parts) and core.replace(".", "").isdecimal():
+        return tuple(map(int, parts))
+
+    digits = _VERSION_DIGITS.findall(version)
     if not digits:
         return (0,)
     return tuple(int(value) for value in digits)
 
 
+@lru_cache(maxsize=256)
 def _extract_version(value: str) -> Optional[str]:
     """Normalize version strings such as 'v1.34.1 (control plane)' -> '1.34.1'."""
     if not value:
         return None
-    match = re.search(r"\d+(?:\.\d+)*", value)
+    match = _VERSION_PATTERN.search(value)
     if match:
         return match.group(0)
     stripped = value.strip()
     return stripped or None
 
 
+def _index_by_version(versions: Sequence[str]) -> Dict[Optional[str], str]:
+    """Map each normalized version to the first original string that normalizes to it."""
+    by_version: Dict[Optional[str], str] = {}
+    for version in versions:
+        by_version.setdefault(_extract_version(version), version)
+    return by_version
+
+
 def choose_target_version(
     available: Sequence[str],
     requested_version: Optional[str] = None,
@@ -180,45 +231,60 @@ def choose_target_version(
     normalized_requested = _extract_version(requested_version) if requested_version else None
 
     if normalized_requested:
-        normalized_available = [_extract_version(version) for version in available]
-        if normalized_requested in normalized_available:
-            index = normalized_available.index(normalized_requested)
-            return available[index]
-        return None
+        return _index_by_version(available).get(normalized_requested)
 
     return max(available, key=_version_key)
 
 
-def _build_filters(args: argparse.Namespace) -> Dict[str, List[str]]:
-    filters: Dict[str, List[str]] = {}
+def _build_filters(args: argparse.Namespace) -> Dict[str, AbstractSet[str]]:
+    filters: Dict[str, AbstractSet[str]] = {}
     if args.project:
-        filters["project"] = [args.project]
+        filters["project"] = frozenset((args.project,))
     if args.stage:
-        filters["stage"] = [args.stage]
+        filters["stage"] = frozenset((args.stage,))
     if args.region:
-        filters["region"] = [args.region]
+        filters["region"] = frozenset((args.region,))
     if args.cluster:
-        filters["cluster"] = [args.cluster]
+        filters["cluster"] = frozenset((args.cluster,))
     return filters
 
 
-def _entry_matches_filters(entry: ReportCluster, filters: Dict[str, List[str]]) -> bool:
+def _fields_match_filters(
+    project: str,
+    stage: str,
+    region: str,
+    cluster_name: str,
+    cluster_ocid: str,
+    filters: Dict[str, AbstractSet[str]],
+) -> bool:
     project_filter = filters.get("project")
     stage_filter = filters.get("stage")
     region_filter = filters.get("region")
     cluster_filter = filters.get("cluster")
 
-    if project_filter and entry.project not in project_filter:
+    # Most selective filter first, so non-matching entries are rejected after one check
+    if cluster_filter and cluster_ocid not in cluster_filter and cluster_name not in cluster_filter:
         return False
-    if stage_filter and entry.stage not in stage_filter:
+    if region_filter and region not in region_filter:
         return False
-    if region_filter and entry.region not in region_filter:
+    if stage_filter and stage not in stage_filter:
         return False
-    if cluster_filter and entry.cluster_ocid not in cluster_filter and entry.cluster_name not in cluster_filter:
+    if project_filter and project not in project_filter:
         return False
     return True
 
 
+def _entry_matches_filters(entry: ReportCluster, filters: Dict[str, AbstractSet[str]]) -> bool:
+    return _fields_match_filters(
+        entry.project,
+        entry.stage,
+        entry.region,
+        entry.cluster_name,
+        entry.cluster_ocid,
+        filters,
+    )
+
+
 @dataclass
 class UpgradeResult:
     """Outcome of an attempted upgrade."""
@@ -231,20 +297,169 @@ class UpgradeResult:
     error: Optional[str] = None
 
 
+def _upgrade_cluster(
+    entry: ReportCluster,
+    client: Any,
+    *,
+    requested_version: Optional[str],
+    normalized_request: Optional[str],
+    report_target_version: Optional[str],
+) -> UpgradeResult:
+    """
+    Re-check a cluster's available upgrades with OCI and trigger the upgrade.
+
+    Console output is collected and printed as one group once the cluster is handled, so
+    clusters upgraded concurrently do not interleave their lines.
+    """
+    messages: List[RenderableType] = []
+    try:
+        return _trigger_cluster_upgrade(
+            entry,
+            client,
+            messages,
+            requested_version=requested_version,
+            normalized_request=normalized_request,
+            report_target_version=report_target_version,
+        )
+    finally:
+        if messages:
+            console.print(Group(*messages))
+
+
+def _trigger_cluster_upgrade(
+    entry: ReportCluster,
+    client: Any,
+    messages: List[RenderableType],
+    *,
+    requested_version: Optional[str],
+    normalized_request: Optional[str],
+    report_target_version: Optional[str],
+) -> UpgradeResult:
+    """Resolve the upgrade target for one cluster, appending console output to ``messages``."""
+    try:
+        cluster_details = _resolve_cluster_details(client, entry.cluster_ocid)
+    except Exception as exc:  # pragma: no cover - defensive handling
+        error_message = (
+            f"Failed to fetch cluster details for {entry.cluster_name} "
+            f"({entry.cluster_ocid}) in {entry.region}: {exc}"
+        )
+        messages.append(_warning_text(error_message))
+        return UpgradeResult(
+            entry=entry,
+            target_version=report_target_version,
+            work_request_id=None,
+            success=False,
+            skipped=False,
+            error=str(exc),
+        )
+
+    api_available = cluster_details.available_upgrades
+    api_by_version = _index_by_version(api_available)
+    # Newest version OCI offers; every fallback below resolves to it
+    latest_api_version = max(api_available, key=_version_key) if api_available else None
+
+    fallback_message: Optional[str] = None
+
+    api_target_version: Optional[str] = None
+
+    if normalized_request:
+        if normalized_request in api_by_version:
+            api_target_version = api_by_version[normalized_request]
+        elif latest_api_version:
+            api_target_version = latest_api_version
+            fallback_message = (
+                f"Requested target version {requested_version} not available for cluster "
+                f"{entry.cluster_name} ({entry.cluster_ocid}). Falling back to {api_target_version}."
+            )
+    elif report_target_version:
+        normalized_report = _extract_version(report_target_version)
+        if normalized_report and normalized_report in api_by_version:
+            api_target_version = api_by_version[normalized_report]
+        elif latest_api_version:
+            api_target_version = latest_api_version
+            fallback_message = (
+                f"Report suggested version {report_target_version} for cluster "
+                f"{entry.cluster_name} ({entry.cluster_ocid}), but OCI now offers "
+                f"{', '.join(api_available)}. Using {api_target_version} instead."
+            )
+    else:
+        api_target_version = latest_api_version
+
+    if fallback_message:
+        messages.append(_warning_text(fallback_message))
+
+    if not api_target_version:
+        available_text = ", ".join(api_available) or "None"
+        requested_text = requested_version or report_target_version
+        message = (
+            f"OCI reports no matching upgrade for cluster {entry.cluster_name} "
+            f"({entry.cluster_ocid}) in {entry.region}. "
+            f"Available (fresh): {available_text}. Requested: {requested_text or 'latest'}."
+        )
+        messages.append(_warning_text(message))
+        return UpgradeResult(
+            entry=entry,
+            target_version=None,
+            work_request_id=None,
+            success=True,
+            skipped=True,
+            error=message,
+        )
+
+    target_version = api_target_version
+
+    try:
+        work_request_id = client.upgrade_oke_cluster(entry.cluster_ocid, target_version)  # type: ignore[attr-defined]
+        messages.append(
+            Text.from_markup(
+                f"[bold green]✓[/bold green] Upgrade triggered for [cyan]{entry.cluster_name}[/cyan] "
+                f"({entry.cluster_ocid}) to [green]{target_version}[/green]. "
+                f"Work request: [magenta]{work_request_id or 'N/A'}[/magenta]"
+            )
+        )
+        return UpgradeResult(
+            entry=entry,
+            target_version=target_version,
+            work_request_id=work_request_id or None,
+            success=True,
+            skipped=False,
+        )
+    except Exception as exc:  # pragma: no cover - defensive handling
+        error_message = (
+            f"Failed to trigger upgrade for cluster {entry.cluster_name} "
+            f"({entry.cluster_ocid}) in {entry.region}: {exc}"
+        )
+        messages.append(_warning_text(error_message))
+        return UpgradeResult(
+            entry=entry,
+            target_version=target_version,
+            work_request_id=None,
+            success=False,
+            skipped=False,
+            error=str(exc),
+        )
+
+
 def perform_cluster_upgrades(
     entries: Sequence[ReportCluster],
     *,
     requested_version: Optional[str],
     dry_run: bool,
-    filters: Optional[Dict[str, List[str]]] = None,
+    filters: Optional[Dict[str, AbstractSet[str]]] = None,
 ) -> List[UpgradeResult]:
     entries = list(entries)
     filters = filters or {}
-    results: List[UpgradeResult] = []
+    # Results are slotted by entry so they come back in report order regardless of which
+    # cluster upgrade returns first
+    results: List[Optional[UpgradeResult]] = []
+    pending: List[Tuple[int, ReportCluster, Any, Optional[str]]] = []
     clients: Dict[Tuple[str, str, str], Any] = {}
 
     total = len(entries)
+    normalized_request = _extract_version(requested_version) if requested_version else None
 
+    # Dry runs and session token setup (which may need an interactive login) stay on this
+    # thread; only the OCI round-trips of real upgrades run concurrently below.
     for index, entry in enumerate(entries, start=1):
         if filters and not _entry_matches_filters(entry, filters):
             logger.debug(
@@ -263,7 +478,6 @@ def perform_cluster_upgrades(
             f"[{index}/{total}]..."
         )
 
-        normalized_request = _extract_version(requested_version) if requested_version else None
         report_target_version = choose_target_version(entry.available_upgrades, requested_version)
 
         if not entry.available_upgrades and not requested_version:
@@ -339,117 +553,29 @@ def perform_cluster_upgrades(
                 continue
             clients[cache_key] = client
 
-        try:
-            cluster_details = _resolve_cluster_details(client, entry.cluster_ocid)
-        except Exception as exc:  # pragma: no cover - defensive handling
-            error_message = (
-                f"Failed to fetch cluster details for {entry.cluster_name} "
-                f"({entry.cluster_ocid}) in {entry.region}: {exc}"
-            )
-            logger.error(error_message)
-            results.append(
-                UpgradeResult(
-                    entry=entry,
-                    target_version=report_target_version,
-                    work_request_id=None,
-                    success=False,
-                     skipped=False,
-                    error=str(exc),
-                )
-            )
-            continue
-
-        api_available = cluster_details.available_upgrades
-        api_normalized = [_extract_version(value) for value in api_available]
-
-        fallback_message: Optional[str] = None
-
-        api_target_version: Optional[str] = None
-
-        if normalized_request:
-            if normalized_request in api_normalized:
-                api_target_version = api_available[api_normalized.index(normalized_request)]
-            elif api_available:
-                api_target_version = max(api_available, key=_version_key)
-                fallback_message = (
-                    f"Requested target version {requested_version} not available for cluster "
-                    f"{entry.cluster_name} ({entry.cluster_ocid}). Falling back to {api_target_version}."
-                )
-        elif report_target_version:
-            normalized_report = _extract_version(report_target_version)
-            if normalized_report and normalized_report in api_normalized:
-                api_target_version = api_available[api_normalized.index(normalized_report)]
-            elif api_available:
-                api_target_version = max(api_available, key=_version_key)
-                fallback_message = (
-                    f"Report suggested version {report_target_version} for cluster "
-                    f"{entry.cluster_name} ({entry.cluster_ocid}), but OCI now offers "
-                    f"{', '.join(api_available)}. Using {api_target_version} instead."
-                )
-        else:
-            if api_available:
-                api_target_version = max(api_available, key=_version_key)
-
-        if fallback_message:
-            console.print(f"[yellow]{fallback_message}[/yellow]")
-
-        if not api_target_version:
-            available_text = ", ".join(api_available) or "None"
-            requested_text = requested_version or report_target_version
-            message = (
-                f"OCI reports no matching upgrade for cluster {entry.cluster_name} "
-                f"({entry.cluster_ocid}) in {entry.region}. "
-                f"Available (fresh): {available_text}. Requested: {requested_text or 'latest'}."
-            )
-            display_warning(message)
-            results.append(
-                UpgradeResult(
-                    entry=entry,
-                    target_version=None,
-                    work_request_id=None,
-                    success=True,
-                    skipped=True,
-                    error=message,
-                )
-            )
-            continue
-
-        target_version = api_target_version
-
-        try:
-            work_request_id = client.upgrade_oke_cluster(entry.cluster_ocid, target_version)  # type: ignore[attr-defined]
-            console.print(
-                f"[bold green]✓[/bold green] Upgrade triggered for [cyan]{entry.cluster_name}[/cyan] "
-                f"({entry.cluster_ocid}) to [green]{target_version}[/green]. "
-                f"Work request: [magenta]{work_request_id or 'N/A'}[/magenta]"
-            )
-            results.append(
-                UpgradeResult(
-                    entry=entry,
-                    target_version=target_version,
-                    work_request_id=work_request_id or None,
-                    success=True,
-                    skipped=False,
+        pending.append((len(results), entry, client, report_target_version))
+        results.append(None)
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(MAX_CLUSTER_WORKERS, len(pending))) as executor:
+            futures = [
+                (
+                    position,
+                    executor.submit(
+                        _upgrade_cluster,
+                        entry,
+                        client,
+                        requested_version=requested_version,
+                        normalized_request=normalized_request,
+                        report_target_version=report_target_version,
+                    ),
                 )
-            )
-        except Exception as exc:  # pragma: no cover - defensive handling
-            error_message = (
-                f"Failed to trigger upgrade for cluster {entry.cluster_name} "
-                f"({entry.cluster_ocid}) in {entry.region}: {exc}"
-            )
-            logger.error(error_message)
-            results.append(
-                UpgradeResult(
-                    entry=entry,
-                    target_version=target_version,
-                    work_request_id=None,
-                    success=False,
-                    skipped=False,
-                    error=str(exc),
-                )
-            )
+                for position, entry, client, report_target_version in pending
+            ]
+            for position, future in futures:
+                results[position] = future.result()
 
-    return results
+    return [result for result in results if result is not None]
 
 
 def _resolve_cluster_details(client: Any, cluster_id: str) -> OKEClusterInfo:
@@ -532,19 +658,22 @@ def main() -> int:
         f"[bold blue]🚀 Starting OKE upgrades using report:[/bold blue] [cyan]{report_path}[/cyan]"
     )
 
-    entries = load_clusters_from_report(report_path)
+    filters = _build_filters(args)
+    entries = load_clusters_from_report(report_path, filters)
 
     if not entries:
-        console.print("[yellow]No clusters found in the report. Nothing to do.[/yellow]")
+        if filters:
+            console.print(
+                "[yellow]No clusters in the report match the filters. Nothing to do.[/yellow]"
+            )
+        else:
+            console.print("[yellow]No clusters found in the report. Nothing to do.[/yellow]")
         return 0
 
-    filters = _build_filters(args)
-
     results = perform_cluster_upgrades(
         entries,
         requested_version=args.target_version,
         dry_run=args.dry_run,
-        filters=filters,
     )
 
     initiated = sum(
@@ -555,11 +684,12 @@ def main() -> int:
     )
     failures = sum(1 for result in results if not result.success)
     processed = len(results)
-    total_entries = len(entries)
     skipped = sum(1 for result in results if result.skipped)
 
+    # Rows outside the filters are dropped while parsing, so every loaded entry is processed
+    scope = " matching the filters" if filters else ""
     console.print(
-        f"[cyan]Processed {processed} of {total_entries} cluster entr{'y' if total_entries == 1 else 'ies'} from the report.[/cyan]"
+        f"[cyan]Processed {processed} cluster entr{'y' if processed == 1 else 'ies'} from the report{scope}.[/cyan]"
     )
     if args.dry_run:
         console.print(
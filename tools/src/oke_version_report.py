@@ -4,12 +4,15 @@ Generate HTML reports detailing OKE cluster and node pool Kubernetes versions.
 """
 
 import argparse
+import io
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from html import escape
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import List, Optional, Sequence, TextIO
 
 from rich.console import Console
 from rich.logging import RichHandler
@@ -17,16 +20,23 @@ from rich.logging import RichHandler
 from oci_client.models import OKEClusterInfo
 from oci_client.utils.config import load_region_compartments
 from oci_client.utils.display import (
+    buffered_output,
     display_configuration_info,
     display_region_header,
     display_success,
     display_warning,
 )
+from oci_client.utils.resources import collect_all_regions
 from oci_client.utils.session import create_oci_client, setup_session_token
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Regions listed at once; bounds concurrent API load and open connections
+MAX_REGION_WORKERS = 8
+# Node pool listings in flight per region; multiplies with MAX_REGION_WORKERS
+MAX_NODE_POOL_WORKERS = 8
+
 
 @dataclass
 class ClusterReportEntry:
@@ -68,28 +78,23 @@ def parse_arguments() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def collect_cluster_entries(
+def _collect_region_entries(
     *,
     project_name: str,
     stage: str,
-    config_file: str,
+    region: str,
+    compartment_id: str,
+    profile_name: str,
 ) -> List[ClusterReportEntry]:
-    """Collect OKE cluster information for the configured regions."""
-    region_compartments = load_region_compartments(project_name, stage, config_file)
-    display_configuration_info(
-        project_name, stage, config_file, len(region_compartments), region_compartments
-    )
-
-    entries: List[ClusterReportEntry] = []
-
-    for region, compartment_id in region_compartments.items():
+    """List one region's OKE clusters together with their node pools."""
+    # Regions run concurrently; hold this region's output and write it as one block
+    with buffered_output():
         display_region_header(region)
 
-        profile_name = setup_session_token(project_name, stage, region)
         client = create_oci_client(region, profile_name)
         if not client:
             display_warning(f"Skipping region {region}: failed to initialize OCI client.")
-            continue
+            return []
 
         try:
             clusters = client.list_oke_clusters(compartment_id)
@@ -97,17 +102,25 @@ def collect_cluster_entries(
             display_warning(
                 f"Unable to list OKE clusters in {region} (compartment {compartment_id}): {exc}"
             )
-            continue
+            return []
 
         if not clusters:
             display_warning(f"No OKE clusters found in {region}.")
-            continue
+            return []
 
         display_success(f"Found {len(clusters)} OKE cluster(s) in {region}.")
 
-        for cluster in clusters:
+        # Node pool listings are independent per cluster, so they are fetched concurrently
+        with ThreadPoolExecutor(max_workers=min(MAX_NODE_POOL_WORKERS, len(clusters))) as executor:
+            futures = [
+                executor.submit(client.list_node_pools, cluster.cluster_id, compartment_id)
+                for cluster in clusters
+            ]
+
+        entries: List[ClusterReportEntry] = []
+        for cluster, future in zip(clusters, futures):
             try:
-                node_pools = client.list_node_pools(cluster.cluster_id, compartment_id)
+                node_pools = future.result()
             except Exception as exc:  # pragma: no cover - defensive user feedback
                 display_warning(
                     f"Failed to list node pools for cluster {cluster.name} ({cluster.cluster_id}): {exc}"
@@ -128,6 +141,38 @@ def collect_cluster_entries(
     return entries
 
 
+def collect_cluster_entries(
+    *,
+    project_name: str,
+    stage: str,
+    config_file: str,
+) -> List[ClusterReportEntry]:
+    """Collect OKE cluster information for the configured regions."""
+    region_compartments = load_region_compartments(project_name, stage, config_file)
+    display_configuration_info(
+        project_name, stage, config_file, len(region_compartments), region_compartments
+    )
+
+    # Session token creation can need an interactive login and rewrites ~/.oci/config, so
+    # it runs one region at a time; the API-bound listing then runs regions concurrently.
+    profiles = {
+        region: setup_session_token(project_name, stage, region) for region in region_compartments
+    }
+    region_entries = collect_all_regions(
+        lambda region, compartment_id: _collect_region_entries(
+            project_name=project_name,
+            stage=stage,
+            region=region,
+            compartment_id=compartment_id,
+            profile_name=profiles[region],
+        ),
+        region_compartments,
+        max_workers=MAX_REGION_WORKERS,
+    )
+
+    return [entry for entries in region_entries.values() for entry in entries]
+
+
 def _format_node_pools(node_pools: Sequence, default_text: str = "No node pools discovered.") -> str:
     """Render node pool information as HTML."""
     if not node_pools:
@@ -146,43 +191,7 @@ def _format_node_pools(node_pools: Sequence, default_text: str = "No node pools
     return "<ul>" + "".join(items) + "</ul>"
 
 
-def generate_html_report(
-    *,
-    entries: Sequence[ClusterReportEntry],
-    project_name: str,
-    stage: str,
-    generated_at: datetime,
-) -> str:
-    """Generate the HTML report string."""
-    timestamp = generated_at.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
-
-    rows = []
-    for entry in entries:
-        cluster = entry.cluster
-        node_pools_html = _format_node_pools(cluster.node_pools)
-        upgrades = ", ".join(cluster.available_upgrades) if cluster.available_upgrades else "None"
-
-        rows.append(
-            "<tr>"
-            f"<td>{escape(entry.project)}</td>"
-            f"<td>{escape(entry.stage)}</td>"
-            f"<td>{escape(entry.region)}</td>"
-            f"<td>{escape(cluster.name)}</td>"
-            f"<td>{escape(cluster.kubernetes_version or 'Unknown')}</td>"
-            f"<td>{escape(upgrades)}</td>"
-            f"<td>{node_pools_html}</td>"
-            f"<td class='mono'>{escape(entry.compartment_id)}</td>"
-            f"<td class='mono'>{escape(cluster.cluster_id)}</td>"
-            "</tr>"
-        )
-
-    if not rows:
-        rows.append(
-            "<tr><td colspan='9'><em>No OKE clusters were discovered for the provided "
-            "project and stage.</em></td></tr>"
-        )
-
-    styles = """
+_REPORT_STYLES = """
     body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif; margin: 2rem; }
     h1 { margin-bottom: 0.25rem; }
     h2 { margin-top: 0; color: #555; }
@@ -195,12 +204,39 @@ def generate_html_report(
     footer { margin-top: 2rem; font-size: 0.85rem; color: #666; }
     """
 
-    html = f"""<!DOCTYPE html>
+# One cluster row; every value except the pre-rendered node pool list is escaped by the caller
+_REPORT_ROW = (
+    "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td>"
+    "<td class='mono'>{}</td><td class='mono'>{}</td></tr>"
+)
+
+_REPORT_FOOTER = """
+    </tbody>
+  </table>
+  <footer>Report generated by oracle-sdk-client tools.</footer>
+</body>
+</html>
+"""
+
+
+def _render_html_report(
+    out: TextIO,
+    *,
+    entries: Sequence[ClusterReportEntry],
+    project_name: str,
+    stage: str,
+    generated_at: datetime,
+) -> None:
+    """Write the HTML report to ``out`` one table row at a time."""
+    timestamp = generated_at.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+
+    out.write(
+        f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
   <title>OKE Version Report - {escape(project_name)} - {escape(stage)}</title>
-  <style>{styles}</style>
+  <style>{_REPORT_STYLES}</style>
 </head>
 <body>
   <h1>OKE Version Report</h1>
@@ -221,21 +257,83 @@ def generate_html_report(
       </tr>
     </thead>
     <tbody>
-      {''.join(rows)}
-    </tbody>
-  </table>
-  <footer>Report generated by oracle-sdk-client tools.</footer>
-</body>
-</html>
-"""
+      """
+    )
+
+    esc = escape
+    write = out.write
+    for entry in entries:
+        cluster = entry.cluster
+        upgrades = ", ".join(cluster.available_upgrades) if cluster.available_upgrades else "None"
+
+        write(
+            _REPORT_ROW.format(
+                esc(entry.project),
+                esc(entry.stage),
+                esc(entry.region),
+                esc(cluster.name),
+                esc(cluster.kubernetes_version or "Unknown"),
+                esc(upgrades),
+                _format_node_pools(cluster.node_pools),
+                esc(entry.compartment_id),
+                esc(cluster.cluster_id),
+            )
+        )
 
-    return html
+    if not entries:
+        out.write(
+            "<tr><td colspan='9'><em>No OKE clusters were discovered for the provided "
+            "project and stage.</em></td></tr>"
+        )
+
+    out.write(_REPORT_FOOTER)
 
 
-def write_report(output_path: Path, content: str) -> None:
-    """Persist the rendered HTML report to disk."""
+def generate_html_report(
+    *,
+    entries: Sequence[ClusterReportEntry],
+    project_name: str,
+    stage: str,
+    generated_at: datetime,
+) -> str:
+    """Generate the HTML report string."""
+    buffer = io.StringIO()
+    _render_html_report(
+        buffer,
+        entries=entries,
+        project_name=project_name,
+        stage=stage,
+        generated_at=generated_at,
+    )
+    return buffer.getvalue()
+
+
+def write_html_report(
+    output_path: Path,
+    *,
+    entries: Sequence[ClusterReportEntry],
+    project_name: str,
+    stage: str,
+    generated_at: datetime,
+) -> None:
+    """Render the HTML report straight to disk without holding the whole document in memory."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content, encoding="utf-8")
+    # Stream into a sibling temp file and swap it in so a failed render never leaves a
+    # truncated report behind
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            _render_html_report(
+                handle,
+                entries=entries,
+                project_name=project_name,
+                stage=stage,
+                generated_at=generated_at,
+            )
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     logger.info("HTML report written to %s", output_path)
 
 
@@ -252,19 +350,17 @@ def main() -> int:
         config_file=args.config_file,
     )
 
-    generated_at = datetime.now(timezone.utc)
-    html = generate_html_report(
+    output_dir = Path(args.output_dir)
+    output_filename = f"oke_versions_{args.project_name}_{args.stage}.html"
+    output_path = output_dir / output_filename
+    write_html_report(
+        output_path,
         entries=entries,
         project_name=args.project_name,
         stage=args.stage,
-        generated_at=generated_at,
+        generated_at=datetime.now(timezone.utc),
     )
 
-    output_dir = Path(args.output_dir)
-    output_filename = f"oke_versions_{args.project_name}_{args.stage}.html"
-    output_path = output_dir / output_filename
-    write_report(output_path, html)
-
     console.print(
         f"[bold green]✅ Report complete.[/bold green] Saved to [cyan]{output_path}[/cyan]"
     )
@@ -16,6 +16,7 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import Optional
 
 from rich.logging import RichHandler
 
@@ -24,6 +25,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from oci_client.utils.config import load_region_compartments
 from oci_client.utils.display import (
+    buffered_output,
     display_bastions,
     display_client_initialization,
     display_configuration_info,
@@ -32,7 +34,7 @@ from oci_client.utils.display import (
     display_region_header,
     display_summary,
 )
-from oci_client.utils.resources import collect_all_resources
+from oci_client.utils.resources import collect_all_regions, collect_all_resources
 from oci_client.utils.session import create_oci_client, display_connection_info, setup_session_token
 from oci_client.utils.ssh_config_generator import (
     display_ssh_config_summary,
@@ -47,6 +49,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Regions processed at once; bounds concurrent API load and open connections
+MAX_REGION_WORKERS = 8
+
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -86,35 +91,49 @@ def display_ssh_sync_header() -> None:
     )
 
 
-def process_region(project_name: str, stage: str, region: str, compartment_id: str) -> tuple:
+def process_region(
+    project_name: str,
+    stage: str,
+    region: str,
+    compartment_id: str,
+    profile_name: Optional[str] = None,
+) -> tuple:
     """
     Process a single region and collect all resources.
 
+    Args:
+        profile_name: Profile with a ready session token; set up here when not given
+
     Returns:
         Tuple of (oke_instances, odo_instances, bastions) or ([], [], []) on failure
     """
-    display_region_header(region)
-
     # Setup session token
-    profile_name = setup_session_token(project_name, stage, region)
+    if profile_name is None:
+        profile_name = setup_session_token(project_name, stage, region)
+
+    # Regions may run concurrently; hold this region's output and write it as one block
+    with buffered_output():
+        display_region_header(region)
 
-    # Create OCI client
-    display_client_initialization(region)
-    client = create_oci_client(region, profile_name)
+        # Create OCI client
+        display_client_initialization(region)
+        client = create_oci_client(region, profile_name)
 
-    if not client:
-        return [], [], []
+        if not client:
+            return [], [], []
 
-    # Display connection info
-    display_connection_info(client)
+        # Display connection info
+        display_connection_info(client)
 
-    # Collect all resources
-    oke_instances, odo_instances, bastions = collect_all_resources(client, compartment_id, region)
+        # Collect all resources
+        oke_instances, odo_instances, bastions = collect_all_resources(
+            client, compartment_id, region
+        )
 
-    # Display resources
-    display_oke_instances(region, oke_instances)
-    display_odo_instances(region, odo_instances)
-    display_bastions(region, bastions)
+        # Display resources
+        display_oke_instances(region, oke_instances)
+        display_odo_instances(region, odo_instances)
+        display_bastions(region, bastions)
 
     return oke_instances, odo_instances, bastions
 
@@ -147,10 +166,21 @@ def main() -> int:
     all_bastions = []
     region_data = []  # For SSH config generation
 
-    for region, compartment_id in region_compartments.items():
-        oke_instances, odo_instances, bastions = process_region(
-            project_name, stage, region, compartment_id
-        )
+    # Session token creation can need an interactive login and rewrites ~/.oci/config, so
+    # it runs one region at a time; the API-bound discovery then runs regions concurrently.
+    profiles = {
+        region: setup_session_token(project_name, stage, region) for region in region_compartments
+    }
+    region_results = collect_all_regions(
+        lambda region, compartment_id: process_region(
+            project_name, stage, region, compartment_id, profile_name=profiles[region]
+        ),
+        region_compartments,
+        max_workers=MAX_REGION_WORKERS,
+    )
+
+    for region, (oke_instances, odo_instances, bastions) in region_results.items():
+        compartment_id = region_compartments[region]
 
         # Aggregate results
         all_oke_instances.extend(oke_instances)
@@ -180,9 +210,9 @@ def main() -> int:
         all_ssh_entries = []
 
         for data in region_data:
-            # Create a client for this region to generate SSH config
-            profile_name = setup_session_token(project_name, stage, data["region"])
-            client = create_oci_client(data["region"], profile_name)
+            # Create a client for this region to generate SSH config, reusing the profile
+            # whose session token was prepared before discovery
+            client = create_oci_client(data["region"], profiles[data["region"]])
 
             if client:
                 ssh_entries = generate_ssh_config_entries(
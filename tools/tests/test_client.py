@@ -1,10 +1,13 @@
 """Tests for main client module."""
 
+import sys
 from unittest.mock import Mock, patch
 
 import pytest
+from oci.exceptions import ServiceError
+from oci.retry.retry import ExponentialBackoffWithFullJitterEqualForThrottlesRetryStrategy
 
-from src.oci_client.client import OCIClient
+from src.oci_client.client import OCIClient, _read_public_key
 from src.oci_client.models import (
     AuthType,
     BastionInfo,
@@ -12,6 +15,7 @@ from src.oci_client.models import (
     InstanceInfo,
     LifecycleState,
     RegionInfo,
+    SessionInfo,
 )
 
 
@@ -111,6 +115,64 @@ class TestOCIClient:
             _ = mock_client.container_engine_client
             mock_ce.assert_called_once()
 
+    def test_service_clients_get_a_wider_connection_pool(self, mock_client):
+        """Test lazily created service clients mount a larger HTTPS pool."""
+        from oci._vendor.requests import Session
+        from oci.base_client import OCIHTTPAdapter
+
+        session = Session()
+        session.mount("https://", OCIHTTPAdapter())
+        with patch("src.oci_client.client.oci.core.ComputeClient") as mock_compute:
+            mock_compute.return_value.base_client.session = session
+            _ = mock_client.compute_client
+
+        assert session.get_adapter("https://")._pool_maxsize == OCIClient._http_pool_size
+
+    def test_concurrent_access_creates_one_service_client(self, mock_client):
+        """Test threads racing on a lazy property share a single SDK client."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with patch("src.oci_client.client.oci.core.ComputeClient") as mock_compute:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                clients = list(executor.map(lambda _: mock_client.compute_client, range(8)))
+
+        assert mock_compute.call_count == 1
+        assert all(client is clients[0] for client in clients)
+
+    def test_get_object_storage_namespace_is_cached(self, mock_client):
+        """Test namespace lookup is only issued once per client."""
+        with patch("src.oci_client.client.oci.object_storage.ObjectStorageClient") as mock_os:
+            mock_os.return_value.get_namespace.return_value = Mock(data="tenancy-namespace")
+
+            assert mock_client.get_object_storage_namespace() == "tenancy-namespace"
+            assert mock_client.get_object_storage_namespace() == "tenancy-namespace"
+            mock_os.return_value.get_namespace.assert_called_once()
+
+    def test_get_oke_cluster_is_cached_until_upgrade(self, mock_client):
+        """Test cluster lookups are reused and invalidated by an upgrade."""
+        ce_client = Mock()
+        ce_client.get_cluster.return_value = Mock(
+            data=Mock(
+                kubernetes_version="v1.30.1",
+                lifecycle_state="ACTIVE",
+                compartment_id="ocid1.compartment.oc1..xxxxx",
+                available_kubernetes_upgrades=["v1.31.1"],
+            )
+        )
+        ce_client.update_cluster.return_value = Mock(headers={"opc-work-request-id": "wr"})
+        mock_client._container_engine_client = ce_client
+
+        first = mock_client.get_oke_cluster("ocid1.cluster.oc1..xxxxx")
+        first.available_upgrades.append("mutated")
+        second = mock_client.get_oke_cluster("ocid1.cluster.oc1..xxxxx")
+
+        assert second.available_upgrades == ["v1.31.1"]
+        ce_client.get_cluster.assert_called_once()
+
+        mock_client.upgrade_oke_cluster("ocid1.cluster.oc1..xxxxx", "v1.31.1")
+        mock_client.get_oke_cluster("ocid1.cluster.oc1..xxxxx")
+        assert ce_client.get_cluster.call_count == 2
+
     @patch("src.oci_client.client.console")
     def test_test_connection_success(self, mock_console, mock_client):
         """Test successful connection test."""
@@ -137,6 +199,27 @@ class TestOCIClient:
 
         assert result is False
 
+    @patch("src.oci_client.client.console")
+    def test_test_connection_does_not_retry_auth_errors(self, mock_console, mock_client):
+        """Test deterministic service errors fail on the first attempt."""
+        mock_identity = Mock()
+        mock_identity.list_regions.side_effect = ServiceError(401, "NotAuthenticated", {}, "denied")
+        mock_client._identity_client = mock_identity
+
+        assert mock_client.test_connection() is False
+        mock_identity.list_regions.assert_called_once()
+
+    def test_default_retry_strategy_is_shared_and_bounded(self, mock_client):
+        """Test service clients get one jittered SDK retry policy with a small budget."""
+        strategy = mock_client.retry_strategy
+
+        assert isinstance(strategy, ExponentialBackoffWithFullJitterEqualForThrottlesRetryStrategy)
+        assert strategy.max_wait_between_calls_seconds == 10
+
+        with patch("src.oci_client.client.oci.identity.IdentityClient") as mock_identity:
+            _ = mock_client.identity_client
+            assert mock_identity.call_args.kwargs["retry_strategy"] is strategy
+
     @patch("src.oci_client.client.logger")
     def test_get_region_info(self, mock_logger, mock_client):
         """Test getting region information."""
@@ -243,6 +326,93 @@ class TestOCIClient:
             assert instances[0].display_name == "test-instance"
             assert instances[0].private_ip == "10.0.0.1"
 
+    def test_list_instances_parses_all_pages_and_keeps_order(self, mock_client):
+        """Test instances from every page are parsed concurrently without reordering."""
+        first_page = Mock(data=[Mock(id="i-1"), Mock(id="i-2")], has_next_page=True, next_page="p2")
+        second_page = Mock(data=[Mock(id="i-3")], has_next_page=False)
+
+        mock_compute = Mock()
+        mock_compute.list_instances.side_effect = [first_page, second_page]
+        mock_client._compute_client = mock_compute
+
+        def parse(compartment_id, instance):
+            if instance.id == "i-2":
+                return None
+            return InstanceInfo(
+                instance_id=instance.id,
+                display_name=instance.id,
+                private_ip="10.0.0.1",
+                subnet_id="ocid1.subnet.oc1..xxxxx",
+            )
+
+        with patch.object(mock_client, "_parse_instance", side_effect=parse):
+            instances = mock_client.list_instances(compartment_id="ocid1.compartment.oc1..xxxxx")
+
+        assert [instance.instance_id for instance in instances] == ["i-1", "i-3"]
+        mock_compute.list_instances.assert_called_with(
+            compartment_id="ocid1.compartment.oc1..xxxxx", page="p2"
+        )
+
+    def test_get_instance_vnic_skips_service_vnics(self, mock_client):
+        """Test the primary VNIC is chosen among all attached VNICs."""
+        mock_compute = Mock()
+        mock_compute.list_vnic_attachments.return_value.data = [
+            Mock(vnic_id="vnic-detached", lifecycle_state="DETACHED"),
+            Mock(vnic_id="vnic-service", lifecycle_state="ATTACHED"),
+            Mock(vnic_id="vnic-primary", lifecycle_state="ATTACHED"),
+        ]
+        vnics = {
+            "vnic-service": Mock(
+                lifecycle_state="AVAILABLE",
+                private_ip="10.0.0.9",
+                freeform_tags={"CreatedBy": "oke"},
+            ),
+            "vnic-primary": Mock(
+                lifecycle_state="AVAILABLE",
+                private_ip="10.0.0.1",
+                public_ip=None,
+                subnet_id="ocid1.subnet.oc1..xxxxx",
+                freeform_tags={},
+            ),
+        }
+        mock_network = Mock()
+        mock_network.get_vnic.side_effect = lambda vnic_id: Mock(data=vnics[vnic_id])
+        mock_client._compute_client = mock_compute
+        mock_client._network_client = mock_network
+
+        result = mock_client._get_instance_vnic("ocid1.compartment.oc1..xxxxx", "i-1")
+
+        assert result == ("10.0.0.1", None, "ocid1.subnet.oc1..xxxxx")
+        assert mock_network.get_vnic.call_count == 2
+
+    def test_bulk_instance_action_reports_per_instance_result(self, mock_client):
+        """Test a fleet action runs every instance and records failures individually."""
+
+        def instance_action(instance_id, action):
+            if instance_id == "bad":
+                raise Exception("conflict")
+
+        mock_compute = Mock()
+        mock_compute.instance_action.side_effect = instance_action
+        mock_client._compute_client = mock_compute
+
+        results = mock_client.bulk_instance_action(["a", "bad", "c"], "softreset")
+
+        assert results == {"a": True, "bad": False, "c": True}
+        assert {c.args for c in mock_compute.instance_action.call_args_list} == {
+            ("a", "SOFTRESET"),
+            ("bad", "SOFTRESET"),
+            ("c", "SOFTRESET"),
+        }
+
+    def test_bulk_instance_action_rejects_unknown_action(self, mock_client):
+        """Test an unsupported action fails before any API call."""
+        mock_client._compute_client = Mock()
+
+        with pytest.raises(ValueError):
+            mock_client.bulk_instance_action(["a"], "explode")
+        mock_client._compute_client.instance_action.assert_not_called()
+
     def test_list_oke_instances(self, mock_client):
         """Test listing OKE instances."""
         oke_instance = InstanceInfo(
@@ -313,6 +483,7 @@ class TestOCIClient:
         mock_bastion_client = Mock()
         mock_bastion_client.list_bastions.return_value.data = [mock_bastion]
         mock_bastion_client.list_bastions.return_value.has_next_page = False
+        mock_bastion_client.list_bastions.__name__ = "list_bastions"
         mock_client._bastion_client = mock_bastion_client
 
         bastions = mock_client.list_bastions(
@@ -323,6 +494,85 @@ class TestOCIClient:
         assert bastions[0].bastion_name == "test-bastion"
         assert bastions[0].bastion_type == BastionType.INTERNAL
 
+    def test_list_bastions_follows_pagination(self, mock_client):
+        """Test bastions on later pages are included."""
+
+        def make_bastion(index):
+            bastion = Mock()
+            bastion.id = f"ocid1.bastion.oc1..b{index}"
+            bastion.name = f"bastion-{index}"
+            bastion.target_subnet_id = f"ocid1.subnet.oc1..s{index}"
+            bastion.bastion_type = "INTERNAL"
+            bastion.max_session_ttl_in_seconds = 10800
+            bastion.lifecycle_state = "ACTIVE"
+            return bastion
+
+        mock_bastion_client = Mock()
+        mock_bastion_client.list_bastions.side_effect = [
+            Mock(data=[make_bastion(1)], has_next_page=True, next_page="p2"),
+            Mock(data=[make_bastion(2)], has_next_page=False, next_page=None),
+        ]
+        mock_bastion_client.list_bastions.__name__ = "list_bastions"
+        mock_client._bastion_client = mock_bastion_client
+
+        bastions = mock_client.list_bastions(compartment_id="ocid1.compartment.oc1..xxxxx")
+
+        assert [bastion.bastion_name for bastion in bastions] == ["bastion-1", "bastion-2"]
+        assert mock_bastion_client.list_bastions.call_args.kwargs["page"] == "p2"
+
+    def test_iter_bastions_fetches_pages_lazily(self, mock_client):
+        """Test stopping after the first bastion never requests the next page."""
+        bastion = Mock(
+            id="ocid1.bastion.oc1..b1",
+            target_subnet_id="ocid1.subnet.oc1..s1",
+            bastion_type="INTERNAL",
+            lifecycle_state="ACTIVE",
+        )
+        mock_bastion_client = Mock()
+        mock_bastion_client.list_bastions.side_effect = [
+            Mock(data=[bastion], has_next_page=True, next_page="p2"),
+            AssertionError("second page should not be fetched"),
+        ]
+        mock_bastion_client.list_bastions.__name__ = "list_bastions"
+        mock_client._bastion_client = mock_bastion_client
+
+        first = next(mock_client.iter_bastions("ocid1.compartment.oc1..xxxxx"))
+
+        assert first.bastion_id == "ocid1.bastion.oc1..b1"
+        mock_bastion_client.list_bastions.assert_called_once()
+
+    def test_list_bastions_filters_state_type_and_subnet(self, mock_client):
+        """Test inactive, mismatched and subnet-less bastions are skipped."""
+
+        def make_bastion(name, bastion_type="INTERNAL", state="ACTIVE", subnet="ocid1.subnet"):
+            bastion = Mock(
+                id=f"ocid1.bastion.oc1..{name}",
+                target_subnet_id=subnet,
+                bastion_type=bastion_type,
+                max_session_ttl_in_seconds=3600,
+                lifecycle_state=state,
+            )
+            bastion.name = name
+            return bastion
+
+        mock_bastion_client = Mock()
+        mock_bastion_client.list_bastions.return_value = Mock(
+            data=[
+                make_bastion("keep"),
+                make_bastion("creating", state="CREATING"),
+                make_bastion("standard", bastion_type="STANDARD"),
+                make_bastion("no-subnet", subnet=None),
+            ],
+            has_next_page=False,
+        )
+        mock_bastion_client.list_bastions.__name__ = "list_bastions"
+        mock_client._bastion_client = mock_bastion_client
+
+        bastions = mock_client.list_bastions(compartment_id="ocid1.compartment.oc1..xxxxx")
+
+        assert [bastion.bastion_name for bastion in bastions] == ["keep"]
+        assert bastions[0].max_session_ttl == 3600
+
     def test_find_bastion_for_subnet(self, mock_client):
         """Test finding bastion for subnet."""
         bastion1 = BastionInfo(
@@ -349,6 +599,80 @@ class TestOCIClient:
 
         assert result is None
 
+    def test_find_bastion_for_subnet_uses_subnet_index(self, mock_client):
+        """Test lookups through a prebuilt subnet index match the list scan."""
+        bastions = [
+            BastionInfo(
+                bastion_id=f"ocid1.bastion.oc1..{name}",
+                target_subnet_id=f"ocid1.subnet.oc1..{subnet}",
+                bastion_name=name,
+            )
+            for name, subnet in [("zeta", "a"), ("alpha", "a"), ("solo", "b")]
+        ]
+
+        index = OCIClient.index_bastions_by_subnet(bastions)
+
+        assert [b.bastion_name for b in index["ocid1.subnet.oc1..a"]] == ["alpha", "zeta"]
+        for instance_id in ["ocid1.instance.oc1..1", "ocid1.instance.oc1..2", None]:
+            for subnet_id in ["ocid1.subnet.oc1..a", "ocid1.subnet.oc1..b", "missing"]:
+                assert mock_client.find_bastion_for_subnet(
+                    [], subnet_id, instance_id, bastions_by_subnet=index
+                ) == mock_client.find_bastion_for_subnet(bastions, subnet_id, instance_id)
+
+    def test_create_bastion_session_uses_create_response(self, mock_client):
+        """Test session creation does not re-fetch the session it just created."""
+        mock_bastion_client = Mock()
+        mock_bastion_client.create_session.return_value = Mock(
+            data=Mock(
+                id="ocid1.bastionsession.oc1..xxxxx",
+                bastion_id="ocid1.bastion.oc1..xxxxx",
+                ssh_metadata=None,
+                lifecycle_state="CREATING",
+            )
+        )
+        mock_client._bastion_client = mock_bastion_client
+
+        with patch.object(mock_client, "_get_or_generate_ssh_key", return_value="ssh-rsa AAA"):
+            session = mock_client.create_bastion_session(
+                "ocid1.bastion.oc1..xxxxx", "ocid1.instance.oc1..xxxxx", "10.0.0.5"
+            )
+
+        assert session.ssh_metadata == {}
+        assert session.lifecycle_state == LifecycleState.CREATING
+        mock_bastion_client.get_session.assert_not_called()
+
+    def test_ssh_public_key_is_cached_until_rotated(self, mock_client, tmp_path, monkeypatch):
+        """Test the public key is read once and re-read after it changes on disk."""
+        import os
+
+        ssh_dir = tmp_path / ".ssh"
+        ssh_dir.mkdir()
+        pub_key = ssh_dir / "id_rsa.pub"
+        pub_key.write_text("ssh-rsa FIRST\n")
+        monkeypatch.setattr("src.oci_client.client.Path.home", lambda: tmp_path)
+        _read_public_key.cache_clear()
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            assert mock_client._get_or_generate_ssh_key() == "ssh-rsa FIRST"
+            assert mock_client._get_or_generate_ssh_key() == "ssh-rsa FIRST"
+            assert mock_open.call_count == 1
+
+        pub_key.write_text("ssh-rsa SECOND\n")
+        os.utime(pub_key, ns=(0, pub_key.stat().st_mtime_ns + 1_000_000))
+        assert mock_client._get_or_generate_ssh_key() == "ssh-rsa SECOND"
+        _read_public_key.cache_clear()
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_bastion_and_session_models_use_slots(self):
+        """Test list-heavy models do not carry a per-instance __dict__."""
+        bastion = BastionInfo(bastion_id="b", target_subnet_id="s")
+        session = SessionInfo(
+            session_id="s", bastion_id="b", target_resource_id="i", target_resource_private_ip="ip"
+        )
+
+        assert not hasattr(bastion, "__dict__")
+        assert not hasattr(session, "__dict__")
+
     def test_refresh_auth_session_token(self, mock_client):
         """Test refreshing authentication for session token."""
         mock_client.config.auth_type = AuthType.SESSION_TOKEN
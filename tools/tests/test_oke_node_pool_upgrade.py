@@ -7,6 +7,7 @@ import pytest
 from oci_client.models import OKEClusterInfo, OKENodePoolInfo
 from oke_node_pool_upgrade import (
     NodePoolUpgradeResult,
+    _build_filters,
     _control_plane_ready,
     perform_node_pool_upgrades,
 )
@@ -256,3 +257,276 @@ def test_perform_node_pool_upgrades_handles_missing_get_cluster(monkeypatch: pyt
     assert len(results) == 1
     assert results[0].success is True
     assert results[0].work_request_id == "wr-456"
+
+
+def test_perform_node_pool_upgrades_keeps_report_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    entries = []
+    for index in range(4):
+        entry = _sample_entry()
+        entry.cluster_name = f"cluster-{index}"
+        entry.cluster_ocid = f"ocid1.cluster.oc1..cluster{index}"
+        entry.region = "us-ashburn-1" if index == 2 else "us-phoenix-1"
+        entries.append(entry)
+
+    class FakeClient:
+        def get_oke_cluster(self, cluster_id: str) -> OKEClusterInfo:
+            return OKEClusterInfo(
+                cluster_id=cluster_id,
+                name=cluster_id,
+                kubernetes_version="1.34.1",
+                lifecycle_state="ACTIVE",
+                compartment_id="ocid1.compartment.oc1..example",
+                available_upgrades=[],
+            )
+
+        def list_node_pools(self, cluster_id: str, compartment_id: str) -> List[OKENodePoolInfo]:
+            return [
+                OKENodePoolInfo(
+                    node_pool_id=f"{cluster_id}-np{index}",
+                    name=f"pool-{index}",
+                    kubernetes_version="1.32.1",
+                    lifecycle_state="ACTIVE",
+                )
+                for index in range(2)
+            ]
+
+    clients_created: List[str] = []
+
+    def fake_create_client(region: str, profile: str) -> Any:
+        clients_created.append(region)
+        return None if region == "us-ashburn-1" else FakeClient()
+
+    monkeypatch.setattr(
+        "oke_node_pool_upgrade.setup_session_token",
+        lambda *args, **kwargs: "profile-name",
+    )
+    monkeypatch.setattr("oke_node_pool_upgrade.create_oci_client", fake_create_client)
+
+    results = perform_node_pool_upgrades(
+        entries,
+        requested_version=None,
+        filters={},
+        dry_run=True,
+    )
+
+    assert clients_created == ["us-phoenix-1", "us-ashburn-1"]
+    assert [(result.entry.cluster_name, result.success) for result in results] == [
+        ("cluster-0", True),
+        ("cluster-0", True),
+        ("cluster-1", True),
+        ("cluster-1", True),
+        ("cluster-2", False),
+        ("cluster-3", True),
+        ("cluster-3", True),
+    ]
+    assert results[1].node_pool is not None
+    assert results[1].node_pool.node_pool_id == "ocid1.cluster.oc1..cluster0-np1"
+
+
+def test_perform_node_pool_upgrades_keeps_node_pool_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    entry = _sample_entry()
+    cluster_info = OKEClusterInfo(
+        cluster_id=entry.cluster_ocid,
+        name=entry.cluster_name,
+        kubernetes_version="1.34.1",
+        lifecycle_state="ACTIVE",
+        compartment_id=entry.compartment_ocid,
+        available_upgrades=[],
+    )
+    versions = ["1.32.1", "1.34.1", "1.33.0", "1.32.1"]
+    node_pools = [
+        OKENodePoolInfo(
+            node_pool_id=f"ocid1.nodepool.oc1..np{index}",
+            name=f"pool-{index}",
+            kubernetes_version=version,
+            lifecycle_state="ACTIVE",
+        )
+        for index, version in enumerate(versions)
+    ]
+
+    class FakeClient:
+        def get_oke_cluster(self, cluster_id: str) -> OKEClusterInfo:
+            return cluster_info
+
+        def list_node_pools(self, cluster_id: str, compartment_id: str) -> List[OKENodePoolInfo]:
+            return node_pools
+
+        def upgrade_oke_node_pool(self, node_pool_id: str, target_version: str) -> str:
+            if node_pool_id.endswith("np2"):
+                raise RuntimeError("conflict")
+            return f"wr-{node_pool_id[-1]}"
+
+    monkeypatch.setattr(
+        "oke_node_pool_upgrade.setup_session_token",
+        lambda *args, **kwargs: "profile-name",
+    )
+    monkeypatch.setattr(
+        "oke_node_pool_upgrade.create_oci_client",
+        lambda region, profile: FakeClient(),
+    )
+
+    results = perform_node_pool_upgrades(
+        [entry],
+        requested_version=None,
+        filters={},
+        dry_run=False,
+    )
+
+    assert [
+        (result.node_pool.name if result.node_pool else None, result.work_request_id)
+        for result in results
+    ] == [("pool-0", "wr-0"), ("pool-1", None), ("pool-2", None), ("pool-3", "wr-3")]
+    assert [result.skipped for result in results] == [False, True, False, False]
+    assert results[2].success is False
+    assert results[2].error == "conflict"
+
+
+def test_perform_node_pool_upgrades_skips_filtered_entries_before_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    entries = []
+    for region in ("us-phoenix-1", "us-ashburn-1"):
+        entry = _sample_entry()
+        entry.region = region
+        entries.append(entry)
+
+    sessions: List[str] = []
+
+    def fake_setup_session_token(project: str, stage: str, region: str) -> str:
+        sessions.append(region)
+        return "profile-name"
+
+    monkeypatch.setattr("oke_node_pool_upgrade.setup_session_token", fake_setup_session_token)
+    monkeypatch.setattr("oke_node_pool_upgrade.create_oci_client", lambda *args: None)
+
+    results = perform_node_pool_upgrades(
+        entries,
+        requested_version=None,
+        filters={"region": frozenset({"us-ashburn-1"})},
+        dry_run=True,
+    )
+
+    assert sessions == ["us-ashburn-1"]
+    assert [result.entry.region for result in results] == ["us-ashburn-1"]
+
+
+def test_build_filters_uses_sets() -> None:
+    args = SimpleNamespace(
+        project="remote-observer",
+        stage=None,
+        region=None,
+        cluster=None,
+        node_pool=["pool-a", "ocid1.nodepool.oc1..b", "pool-a"],
+    )
+
+    filters = _build_filters(args)  # type: ignore[arg-type]
+
+    assert filters == {
+        "project": frozenset({"remote-observer"}),
+        "node_pool": frozenset({"pool-a", "ocid1.nodepool.oc1..b"}),
+    }
+
+
+def test_perform_node_pool_upgrades_prints_once_per_cluster(monkeypatch: pytest.MonkeyPatch) -> None:
+    entries = []
+    for index in range(2):
+        entry = _sample_entry()
+        entry.cluster_name = f"cluster-{index}"
+        entry.cluster_ocid = f"ocid1.cluster.oc1..cluster{index}"
+        entries.append(entry)
+
+    class FakeClient:
+        def get_oke_cluster(self, cluster_id: str) -> OKEClusterInfo:
+            return OKEClusterInfo(
+                cluster_id=cluster_id,
+                name=cluster_id,
+                kubernetes_version="1.34.1",
+                lifecycle_state="ACTIVE",
+                compartment_id="ocid1.compartment.oc1..example",
+                available_upgrades=[],
+            )
+
+        def list_node_pools(self, cluster_id: str, compartment_id: str) -> List[OKENodePoolInfo]:
+            return [
+                OKENodePoolInfo(
+                    node_pool_id=f"{cluster_id}-np{index}",
+                    name=f"pool-{index}",
+                    kubernetes_version="1.32.1",
+                    lifecycle_state="ACTIVE",
+                )
+                for index in range(3)
+            ]
+
+    printed: List[Any] = []
+    monkeypatch.setattr("oke_node_pool_upgrade.console.print", printed.append)
+    monkeypatch.setattr(
+        "oke_node_pool_upgrade.setup_session_token",
+        lambda *args, **kwargs: "profile-name",
+    )
+    monkeypatch.setattr(
+        "oke_node_pool_upgrade.create_oci_client",
+        lambda region, profile: FakeClient(),
+    )
+
+    results = perform_node_pool_upgrades(
+        entries,
+        requested_version=None,
+        filters={},
+        dry_run=True,
+    )
+
+    assert len(results) == 6
+    assert len(printed) == 2
+
+
+def test_perform_node_pool_upgrades_prints_failures_with_cluster_output(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    entry = _sample_entry()
+
+    class FakeClient:
+        def get_oke_cluster(self, cluster_id: str) -> OKEClusterInfo:
+            return OKEClusterInfo(
+                cluster_id=cluster_id,
+                name=entry.cluster_name,
+                kubernetes_version="1.34.1",
+                lifecycle_state="ACTIVE",
+                compartment_id=entry.compartment_ocid,
+                available_upgrades=[],
+            )
+
+        def list_node_pools(self, cluster_id: str, compartment_id: str) -> List[OKENodePoolInfo]:
+            return [
+                OKENodePoolInfo(
+                    node_pool_id="ocid1.nodepool.oc1..np1",
+                    name="pool-a",
+                    kubernetes_version="1.32.1",
+                    lifecycle_state="ACTIVE",
+                )
+            ]
+
+        def upgrade_oke_node_pool(self, node_pool_id: str, target_version: str) -> str:
+            raise RuntimeError("conflict")
+
+    printed: List[Any] = []
+    monkeypatch.setattr("oke_node_pool_upgrade.console.print", printed.append)
+    monkeypatch.setattr(
+        "oke_node_pool_upgrade.setup_session_token",
+        lambda *args, **kwargs: "profile-name",
+    )
+    monkeypatch.setattr(
+        "oke_node_pool_upgrade.create_oci_client",
+        lambda region, profile: FakeClient(),
+    )
+
+    results = perform_node_pool_upgrades(
+        [entry],
+        requested_version=None,
+        filters={},
+        dry_run=False,
+    )
+
+    assert results[0].success is False
+    assert len(printed) == 1
+    lines = [renderable.plain for renderable in printed[0].renderables]
+    assert any("Failed to trigger upgrade for node pool pool-a" in line for line in lines)
@@ -1,12 +1,15 @@
 from pathlib import Path
 from types import SimpleNamespace
-from typing import List, Tuple
+from typing import Any, List, Tuple
 
 import pytest
 
+import oke_upgrade
 from oci_client.models import OKEClusterInfo
 from oke_upgrade import (
     ReportCluster,
+    _build_filters,
+    _extract_report_rows,
     choose_target_version,
     load_clusters_from_report,
     perform_cluster_upgrades,
@@ -57,6 +60,45 @@ def test_load_clusters_from_report_parses_rows(tmp_path: Path) -> None:
     assert cluster.available_upgrades == ["1.33.1", "1.34.1"]
 
 
+def test_extract_report_rows_matches_html_parser(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("lxml.html")
+    html = (
+        "<table><thead><tr><th>Project</th></tr></thead><tbody>"
+        "<tr><td> demo </td><td><ul><li><strong>pool-a</strong><br>Version: 1.33 &bull; "
+        "State: ACTIVE</li></ul></td></tr>"
+        "<tr></tr>"
+        "<tr><td colspan='9'><em>No OKE clusters</em></td></tr>"
+        "</tbody></table>"
+    )
+
+    lxml_rows = _extract_report_rows(html)
+    monkeypatch.setattr(oke_upgrade, "lxml_html", None)
+
+    assert lxml_rows == _extract_report_rows(html)
+    assert lxml_rows == [["demo", "pool-aVersion: 1.33 \u2022 State: ACTIVE"], ["No OKE clusters"]]
+
+
+def test_load_clusters_from_report_applies_filters(tmp_path: Path) -> None:
+    rows = [
+        "<tr>"
+        f"<td>remote-observer</td><td>dev</td><td>{region}</td><td>{name}</td><td>1.32.1</td>"
+        "<td>1.33.1</td><td>Node pools</td><td>ocid1.compartment.oc1..example</td>"
+        f"<td>ocid1.cluster.oc1..{name}</td>"
+        "</tr>"
+        for region, name in (("us-phoenix-1", "a"), ("us-ashburn-1", "b"), ("us-phoenix-1", "c"))
+    ]
+    report_path = _write_temp_report(tmp_path, rows)
+
+    by_region = load_clusters_from_report(report_path, {"region": frozenset({"us-phoenix-1"})})
+    by_ocid = load_clusters_from_report(
+        report_path, {"cluster": frozenset({"ocid1.cluster.oc1..b"})}
+    )
+
+    assert [cluster.cluster_name for cluster in by_region] == ["a", "c"]
+    assert [cluster.cluster_name for cluster in by_ocid] == ["b"]
+    assert len(load_clusters_from_report(report_path)) == 3
+
+
 def test_choose_target_version_prefers_requested() -> None:
     available = ["1.33.1", "1.34.1"]
 
@@ -76,6 +118,28 @@ def test_choose_target_version_handles_prefixed_request() -> None:
     assert choose_target_version(available, requested_version="v1.34.1") == "1.34.1"
 
 
+def test_choose_target_version_returns_first_matching_spelling() -> None:
+    available = ["v1.34.1", "1.33.1", "1.34.1 (control plane)"]
+
+    assert choose_target_version(available, requested_version="1.34.1") == "v1.34.1"
+    assert choose_target_version(available, requested_version="1.35.0") is None
+
+
+@pytest.mark.parametrize(
+    "version, expected",
+    [
+        ("1.34.1", (1, 34, 1)),
+        ("v1.34.1", (1, 34, 1)),
+        ("1.34.1-oke.2", (1, 34, 1, 2)),
+        ("1..2", (1, 2)),
+        ("latest", (0,)),
+        ("", (0,)),
+    ],
+)
+def test_version_key(version: str, expected: Tuple[int, ...]) -> None:
+    assert oke_upgrade._version_key(version) == expected
+
+
 def test_perform_cluster_upgrades_dry_run(monkeypatch: pytest.MonkeyPatch) -> None:
     entry = ReportCluster(
         project="remote-observer",
@@ -398,3 +462,113 @@ def test_perform_cluster_upgrades_processes_multiple_entries(monkeypatch: pytest
     assert fake_clients[("today-all", "dev", "us-phoenix-1")].calls == [("ocid1.cluster.oc1..phx", "v1.34.1")]
     assert fake_clients[("today-all", "dev", "us-ashburn-1")].calls == [("ocid1.cluster.oc1..iad", "v1.33.1")]
     assert fake_clients[("today-all", "dev", "eu-frankfurt-1")].calls == [("ocid1.cluster.oc1..fra", "v1.33.1")]
+
+
+def test_perform_cluster_upgrades_keeps_report_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    entries = [
+        ReportCluster(
+            project="today-all",
+            stage="dev",
+            region="us-phoenix-1",
+            cluster_name=f"cluster-{index}",
+            cluster_version="1.33.1",
+            available_upgrades=[] if index == 1 else ["1.34.1"],
+            compartment_ocid="ocid1.compartment.oc1..phx",
+            cluster_ocid=f"ocid1.cluster.oc1..c{index}",
+        )
+        for index in range(4)
+    ]
+
+    class FakeClient:
+        def get_oke_cluster(self, cluster_id: str) -> OKEClusterInfo:
+            return OKEClusterInfo(
+                cluster_id=cluster_id,
+                name="cluster",
+                kubernetes_version="1.33.1",
+                compartment_id="ocid1.compartment",
+                lifecycle_state="ACTIVE",
+                available_upgrades=["1.34.1"],
+            )
+
+        def upgrade_oke_cluster(self, cluster_id: str, target_version: str) -> str:
+            if cluster_id.endswith("c0"):
+                raise RuntimeError("conflict")
+            return f"wr-{cluster_id[-2:]}"
+
+    sessions: List[str] = []
+
+    def fake_setup_session_token(project: str, stage: str, region: str) -> str:
+        sessions.append(region)
+        return "profile-name"
+
+    monkeypatch.setattr("oke_upgrade.setup_session_token", fake_setup_session_token)  # type: ignore
+    monkeypatch.setattr("oke_upgrade.create_oci_client", lambda region, profile: FakeClient())  # type: ignore
+
+    results = perform_cluster_upgrades(entries, requested_version=None, dry_run=False, filters={})
+
+    assert sessions == ["us-phoenix-1"]
+    assert [(r.entry.cluster_name, r.success, r.skipped, r.work_request_id) for r in results] == [
+        ("cluster-0", False, False, None),
+        ("cluster-1", True, True, None),
+        ("cluster-2", True, False, "wr-c2"),
+        ("cluster-3", True, False, "wr-c3"),
+    ]
+
+
+def test_perform_cluster_upgrades_prints_failures_with_cluster_output(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    entry = ReportCluster(
+        project="today-all",
+        stage="dev",
+        region="us-phoenix-1",
+        cluster_name="cluster-a",
+        cluster_version="1.33.1",
+        available_upgrades=["1.34.1"],
+        compartment_ocid="ocid1.compartment.oc1..phx",
+        cluster_ocid="ocid1.cluster.oc1..a",
+    )
+
+    class FakeClient:
+        def get_oke_cluster(self, cluster_id: str) -> OKEClusterInfo:
+            raise RuntimeError("not authorized")
+
+    printed: List[Any] = []
+    monkeypatch.setattr("oke_upgrade.console.print", printed.append)
+    monkeypatch.setattr("oke_upgrade.setup_session_token", lambda *args, **kwargs: "profile-name")  # type: ignore
+    monkeypatch.setattr("oke_upgrade.create_oci_client", lambda region, profile: FakeClient())  # type: ignore
+
+    results = perform_cluster_upgrades([entry], requested_version=None, dry_run=False)
+
+    assert results[0].success is False
+    groups = [renderable for renderable in printed if hasattr(renderable, "renderables")]
+    assert len(groups) == 1
+    lines = [text.plain for text in groups[0].renderables]
+    assert any("Failed to fetch cluster details for cluster-a" in line for line in lines)
+
+
+def test_build_filters_matches_cluster_by_name_or_ocid() -> None:
+    entry = ReportCluster(
+        project="today-all",
+        stage="dev",
+        region="us-phoenix-1",
+        cluster_name="cluster-a",
+        cluster_version="1.33.1",
+        available_upgrades=["1.34.1"],
+        compartment_ocid="ocid1.compartment.oc1..phx",
+        cluster_ocid="ocid1.cluster.oc1..a",
+    )
+
+    def build(**values: str) -> dict:
+        args = SimpleNamespace(project=None, stage=None, region=None, cluster=None)
+        args.__dict__.update(values)
+        return _build_filters(args)  # type: ignore[arg-type]
+
+    assert build(project="today-all", cluster="cluster-a") == {
+        "project": frozenset({"today-all"}),
+        "cluster": frozenset({"cluster-a"}),
+    }
+    assert oke_upgrade._entry_matches_filters(entry, build(cluster="ocid1.cluster.oc1..a"))
+    assert oke_upgrade._entry_matches_filters(entry, build(cluster="cluster-a", stage="dev"))
+    assert not oke_upgrade._entry_matches_filters(entry, build(cluster="cluster-a", stage="prod"))
+    assert not oke_upgrade._entry_matches_filters(entry, build(region="us-ashburn-1"))
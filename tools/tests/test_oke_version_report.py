@@ -1,8 +1,17 @@
 from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
 
-from oci_client.models import OKEClusterInfo, OKENodePoolInfo
+import pytest
 
-from oke_version_report import ClusterReportEntry, generate_html_report
+import oke_version_report
+from oci_client.models import OKEClusterInfo, OKENodePoolInfo
+from oke_version_report import (
+    ClusterReportEntry,
+    collect_cluster_entries,
+    generate_html_report,
+    write_html_report,
+)
 
 
 def test_generate_html_report_includes_cluster_and_node_pool_data() -> None:
@@ -61,3 +70,135 @@ def test_generate_html_report_handles_no_entries() -> None:
     )
 
     assert "No OKE clusters were discovered" in html
+
+
+def test_write_html_report_matches_generated_report(tmp_path: Path) -> None:
+    cluster = OKEClusterInfo(
+        cluster_id="ocid1.cluster.oc1..example",
+        name="example-cluster",
+        kubernetes_version="v1.27.2",
+        lifecycle_state="ACTIVE",
+        compartment_id="ocid1.compartment.oc1..example",
+    )
+    entries = [
+        ClusterReportEntry(
+            project="remote-observer",
+            stage="dev",
+            region=region,
+            compartment_id="ocid1.compartment.oc1..example",
+            cluster=cluster,
+        )
+        for region in ("us-phoenix-1", "us-ashburn-1")
+    ]
+    generated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    output_path = tmp_path / "reports" / "report.html"
+
+    write_html_report(
+        output_path,
+        entries=entries,
+        project_name="remote-observer",
+        stage="dev",
+        generated_at=generated_at,
+    )
+
+    assert output_path.read_text(encoding="utf-8") == generate_html_report(
+        entries=entries, project_name="remote-observer", stage="dev", generated_at=generated_at
+    )
+
+
+def test_write_html_report_keeps_previous_report_when_render_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    output_path = tmp_path / "report.html"
+    output_path.write_text("previous report", encoding="utf-8")
+
+    def failing_render(handle, **kwargs) -> None:
+        handle.write("<html>")
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(oke_version_report, "_render_html_report", failing_render)
+
+    with pytest.raises(RuntimeError):
+        write_html_report(
+            output_path,
+            entries=[],
+            project_name="today-all",
+            stage="prod",
+            generated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+    assert output_path.read_text(encoding="utf-8") == "previous report"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["report.html"]
+
+
+def test_collect_cluster_entries_keeps_region_and_cluster_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    region_compartments = {
+        "us-phoenix-1": "ocid1.compartment.oc1..phx",
+        "us-ashburn-1": "ocid1.compartment.oc1..iad",
+    }
+
+    class FakeClient:
+        def __init__(self, region: str) -> None:
+            self.region = region
+
+        def list_oke_clusters(self, compartment_id: str) -> List[OKEClusterInfo]:
+            return [
+                OKEClusterInfo(
+                    cluster_id=f"ocid1.cluster.oc1..{self.region}-{index}",
+                    name=f"{self.region}-{index}",
+                    kubernetes_version="v1.33.1",
+                    lifecycle_state="ACTIVE",
+                    compartment_id=compartment_id,
+                )
+                for index in range(3)
+            ]
+
+        def list_node_pools(self, cluster_id: str, compartment_id: str) -> List[OKENodePoolInfo]:
+            if cluster_id.endswith("-1"):
+                raise RuntimeError("denied")
+            return [
+                OKENodePoolInfo(
+                    node_pool_id=f"{cluster_id}-np",
+                    name="pool",
+                    kubernetes_version="v1.33.1",
+                    lifecycle_state="ACTIVE",
+                )
+            ]
+
+    sessions: List[str] = []
+
+    def fake_setup_session_token(project: str, stage: str, region: str) -> str:
+        sessions.append(region)
+        return f"profile-{region}"
+
+    profiles: Dict[str, str] = {}
+
+    def fake_create_oci_client(region: str, profile: str) -> FakeClient:
+        profiles[region] = profile
+        return FakeClient(region)
+
+    monkeypatch.setattr(
+        "oke_version_report.load_region_compartments", lambda *args: region_compartments
+    )
+    monkeypatch.setattr("oke_version_report.display_configuration_info", lambda *args: None)
+    monkeypatch.setattr("oke_version_report.setup_session_token", fake_setup_session_token)
+    monkeypatch.setattr("oke_version_report.create_oci_client", fake_create_oci_client)
+
+    entries = collect_cluster_entries(project_name="demo", stage="dev", config_file="meta.yaml")
+
+    assert sessions == ["us-phoenix-1", "us-ashburn-1"]
+    assert profiles == {
+        "us-phoenix-1": "profile-us-phoenix-1",
+        "us-ashburn-1": "profile-us-ashburn-1",
+    }
+    assert [(entry.region, entry.cluster.name) for entry in entries] == [
+        ("us-phoenix-1", "us-phoenix-1-0"),
+        ("us-phoenix-1", "us-phoenix-1-1"),
+        ("us-phoenix-1", "us-phoenix-1-2"),
+        ("us-ashburn-1", "us-ashburn-1-0"),
+        ("us-ashburn-1", "us-ashburn-1-1"),
+        ("us-ashburn-1", "us-ashburn-1-2"),
+    ]
+    assert [len(entry.cluster.node_pools) for entry in entries] == [1, 0, 1, 1, 0, 1]
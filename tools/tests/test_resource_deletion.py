@@ -1,3 +1,6 @@
+import threading
+import time
+import weakref
 from types import SimpleNamespace
 from unittest.mock import Mock
 
@@ -5,10 +8,13 @@ import pytest
 from oci.exceptions import ServiceError
 from rich.console import Console
 
+from src.oci_client import resource_deletion
 from src.oci_client.resource_deletion import (
     BucketDeletionCommand,
     OKEDeletionCommand,
     ResourceDeletionError,
+    _interleave_by_prefix,
+    _run_bounded,
 )
 
 
@@ -18,9 +24,22 @@ class FakeCollection:
         self.next_start_with = next_start_with
 
 
+class FakeVersionCollection:
+    def __init__(self, items=None):
+        self.items = items or []
+
+
 class FakeResponse:
-    def __init__(self, data):
+    def __init__(self, data, next_page=None):
         self.data = data
+        self.next_page = next_page
+
+
+def make_object_storage_client(object_storage):
+    return SimpleNamespace(
+        object_storage_client=object_storage,
+        get_object_storage_namespace=lambda: "namespace",
+    )
 
 
 def make_console() -> Console:
@@ -31,35 +50,64 @@ def test_bucket_deletion_removes_versions_and_bucket():
     command = BucketDeletionCommand()
     command._max_delete_workers = 1
     object_storage = Mock()
-    object_storage.get_namespace.return_value = SimpleNamespace(data="namespace")
     object_storage.get_bucket.return_value = SimpleNamespace(data=SimpleNamespace(versioning="Enabled"))
 
     versions_page1 = FakeResponse(
-        FakeCollection(
-            objects=[
-                SimpleNamespace(name="file1.txt", version_id="v1"),
-                SimpleNamespace(name="file2.txt", version_id="v2"),
+        FakeVersionCollection(
+            items=[
+                SimpleNamespace(name="file1.txt", version_id="v1", is_delete_marker=False),
+                SimpleNamespace(name="file2.txt", version_id="v2", is_delete_marker=False),
             ],
-            next_start_with="next",
-        )
+        ),
+        next_page="page-2",
     )
     versions_page2 = FakeResponse(
-        FakeCollection(
-            objects=[SimpleNamespace(name="file3.txt", version_id="v3")],
+        FakeVersionCollection(
+            items=[SimpleNamespace(name="file3.txt", version_id="v3", is_delete_marker=False)],
         )
     )
-    empty_versions = FakeResponse(FakeCollection(objects=[]))
-    object_storage.list_object_versions.side_effect = [versions_page1, versions_page2, empty_versions]
+    object_storage.list_object_versions.side_effect = [versions_page1, versions_page2]
 
     empty_objects = FakeResponse(FakeCollection(objects=[]))
     object_storage.list_objects.return_value = empty_objects
 
-    client = SimpleNamespace(object_storage_client=object_storage)
+    client = make_object_storage_client(object_storage)
     args = SimpleNamespace(bucket_name="bucket", namespace=None)
 
     command.execute(client, args, make_console())
 
     assert object_storage.delete_object.call_count == 3
+    object_storage.delete_object.assert_any_call(
+        namespace_name="namespace",
+        bucket_name="bucket",
+        object_name="file3.txt",
+        version_id="v3",
+        retry_strategy=resource_deletion._NO_RETRY_STRATEGY,
+    )
+    assert object_storage.list_object_versions.call_args.kwargs["page"] == "page-2"
+    object_storage.list_objects.assert_called_once()
+    object_storage.delete_bucket.assert_called_once_with("namespace", "bucket")
+
+
+def test_bucket_deletion_skips_current_object_sweep_for_delete_markers_only():
+    command = BucketDeletionCommand()
+    object_storage = Mock()
+    object_storage.get_bucket.return_value = SimpleNamespace(data=SimpleNamespace(versioning="Enabled"))
+    object_storage.list_object_versions.side_effect = [
+        FakeResponse(
+            FakeVersionCollection(
+                items=[SimpleNamespace(name="gone.txt", version_id="v1", is_delete_marker=True)]
+            )
+        ),
+    ]
+
+    client = make_object_storage_client(object_storage)
+    args = SimpleNamespace(bucket_name="bucket", namespace=None)
+
+    command.execute(client, args, make_console())
+
+    object_storage.delete_object.assert_called_once()
+    object_storage.list_objects.assert_not_called()
     object_storage.delete_bucket.assert_called_once_with("namespace", "bucket")
 
 
@@ -67,7 +115,6 @@ def test_bucket_deletion_handles_standard_bucket_objects():
     command = BucketDeletionCommand()
     command._max_delete_workers = 1
     object_storage = Mock()
-    object_storage.get_namespace.return_value = SimpleNamespace(data="namespace")
     object_storage.get_bucket.return_value = SimpleNamespace(data=SimpleNamespace(versioning="Disabled"))
 
     page1_objects = FakeResponse(
@@ -82,21 +129,321 @@ def test_bucket_deletion_handles_standard_bucket_objects():
     page2_objects = FakeResponse(FakeCollection(objects=[SimpleNamespace(name="file3.txt")]))
     empty_objects = FakeResponse(FakeCollection(objects=[]))
     object_storage.list_objects.side_effect = [page1_objects, page2_objects, empty_objects, empty_objects]
+    object_storage.batch_delete_objects.return_value = FakeResponse(SimpleNamespace(failed=[]))
 
-    client = SimpleNamespace(object_storage_client=object_storage)
+    client = make_object_storage_client(object_storage)
     args = SimpleNamespace(bucket_name="bucket", namespace=None)
 
     command.execute(client, args, make_console())
 
     assert object_storage.list_object_versions.call_count == 0
+    assert object_storage.list_objects.call_count == 2
+    assert object_storage.list_objects.call_args.kwargs["fields"] == "name"
+    object_storage.delete_object.assert_not_called()
+    object_storage.batch_delete_objects.assert_called_once()
+    details = object_storage.batch_delete_objects.call_args.kwargs["batch_delete_objects_details"]
+    assert [obj.object_name for obj in details.objects] == ["file1.txt", "file2.txt", "file3.txt"]
+    object_storage.delete_bucket.assert_called_once_with("namespace", "bucket")
+
+
+def test_bucket_deletion_skips_listing_for_empty_bucket():
+    command = BucketDeletionCommand()
+    object_storage = Mock()
+    object_storage.get_bucket.return_value = SimpleNamespace(
+        data=SimpleNamespace(versioning="Disabled", approximate_count=0)
+    )
+
+    client = make_object_storage_client(object_storage)
+    args = SimpleNamespace(bucket_name="bucket", namespace=None)
+
+    command.execute(client, args, make_console())
+
+    object_storage.list_objects.assert_not_called()
+    object_storage.delete_bucket.assert_called_once_with("namespace", "bucket")
+
+
+def test_bucket_deletion_drains_when_approximate_count_is_stale():
+    command = BucketDeletionCommand()
+    object_storage = Mock()
+    object_storage.get_bucket.return_value = SimpleNamespace(
+        data=SimpleNamespace(versioning="Disabled", approximate_count=0)
+    )
+    object_storage.list_objects.side_effect = [
+        FakeResponse(FakeCollection(objects=[SimpleNamespace(name="late.txt")])),
+    ]
+    object_storage.batch_delete_objects.return_value = FakeResponse(SimpleNamespace(failed=[]))
+    object_storage.delete_bucket.side_effect = [
+        ServiceError(status=409, code="BucketNotEmpty", headers={}, message="not empty"),
+        None,
+    ]
+
+    client = make_object_storage_client(object_storage)
+    args = SimpleNamespace(bucket_name="bucket", namespace=None)
+
+    command.execute(client, args, make_console())
+
+    object_storage.batch_delete_objects.assert_called_once()
+    assert object_storage.delete_bucket.call_count == 2
+
+
+def test_bucket_deletion_lists_key_ranges_concurrently_with_list_shards():
+    command = BucketDeletionCommand()
+    object_storage = Mock()
+    object_storage.get_bucket.return_value = SimpleNamespace(data=SimpleNamespace(versioning="Disabled"))
+    names = ["0001.log", "Archive/a", "logs/b", "media/c", "zeta"]
+
+    def list_objects(namespace, bucket_name, *, start=None, end=None, limit, fields):
+        selected = [
+            SimpleNamespace(name=name)
+            for name in names
+            if (start is None or name >= start) and (end is None or name < end)
+        ]
+        return FakeResponse(FakeCollection(objects=selected))
+
+    object_storage.list_objects.side_effect = list_objects
+    object_storage.batch_delete_objects.return_value = FakeResponse(SimpleNamespace(failed=[]))
+
+    client = make_object_storage_client(object_storage)
+    args = SimpleNamespace(bucket_name="bucket", namespace=None, list_shards=3)
+
+    command.execute(client, args, make_console())
+
+    assert object_storage.list_objects.call_count == 3
+    details = object_storage.batch_delete_objects.call_args.kwargs["batch_delete_objects_details"]
+    assert sorted(obj.object_name for obj in details.objects) == names
+    object_storage.delete_bucket.assert_called_once_with("namespace", "bucket")
+
+
+def test_list_shard_bounds_cover_the_key_space_without_overlap():
+    bounds = BucketDeletionCommand()._list_shard_bounds(4)
+
+    assert len(bounds) == 4
+    assert bounds[0][0] is None and bounds[-1][1] is None
+    assert all(previous[1] == current[0] for previous, current in zip(bounds, bounds[1:]))
+
+
+def test_bucket_deletion_surfaces_batch_delete_failures():
+    command = BucketDeletionCommand()
+    object_storage = Mock()
+    object_storage.get_bucket.return_value = SimpleNamespace(data=SimpleNamespace(versioning="Disabled"))
+    object_storage.list_objects.side_effect = [
+        FakeResponse(FakeCollection(objects=[SimpleNamespace(name="locked.txt")])),
+    ]
+    object_storage.batch_delete_objects.return_value = FakeResponse(
+        SimpleNamespace(
+            failed=[
+                SimpleNamespace(object_name="locked.txt", status_code=409, error_message="retention rule")
+            ]
+        )
+    )
+
+    client = make_object_storage_client(object_storage)
+    args = SimpleNamespace(bucket_name="bucket", namespace=None)
+
+    with pytest.raises(ResourceDeletionError, match="locked.txt"):
+        command.execute(client, args, make_console())
+
+    object_storage.delete_bucket.assert_not_called()
+
+
+def test_bucket_deletion_retries_throttled_deletes(monkeypatch):
+    monkeypatch.setattr(resource_deletion.time, "sleep", lambda seconds: None)
+    command = BucketDeletionCommand()
+    object_storage = Mock()
+    object_storage.get_bucket.return_value = SimpleNamespace(data=SimpleNamespace(versioning="Enabled"))
+    object_storage.list_object_versions.side_effect = [
+        FakeResponse(
+            FakeVersionCollection(
+                items=[SimpleNamespace(name="hot.txt", version_id="v1", is_delete_marker=False)]
+            )
+        ),
+    ]
+    object_storage.list_objects.return_value = FakeResponse(FakeCollection(objects=[]))
+    object_storage.delete_object.side_effect = [
+        ServiceError(status=429, code="TooManyRequests", headers={}, message="slow down"),
+        ServiceError(status=503, code="ServiceUnavailable", headers={}, message="busy"),
+        None,
+    ]
+
+    client = make_object_storage_client(object_storage)
+    args = SimpleNamespace(bucket_name="bucket", namespace=None, delete_rate=1000.0)
+
+    command.execute(client, args, make_console())
+
     assert object_storage.delete_object.call_count == 3
     object_storage.delete_bucket.assert_called_once_with("namespace", "bucket")
 
 
+def test_bucket_deletion_shrinks_workers_when_retries_absorb_throttling(monkeypatch):
+    monkeypatch.setattr(resource_deletion.time, "sleep", lambda seconds: None)
+    command = BucketDeletionCommand()
+    object_storage = Mock()
+    object_storage.get_bucket.return_value = SimpleNamespace(data=SimpleNamespace(versioning="Enabled"))
+    object_storage.list_object_versions.side_effect = [
+        FakeResponse(
+            FakeVersionCollection(
+                items=[
+                    SimpleNamespace(name=name, version_id="v1", is_delete_marker=False)
+                    for name in ("a.txt", "b.txt", "c.txt", "d.txt")
+                ]
+            )
+        ),
+    ]
+    object_storage.list_objects.return_value = FakeResponse(FakeCollection(objects=[]))
+    throttled_once = set()
+
+    def delete_object(**kwargs):
+        if kwargs["object_name"] not in throttled_once:
+            throttled_once.add(kwargs["object_name"])
+            raise ServiceError(status=429, code="TooManyRequests", headers={}, message="slow down")
+
+    object_storage.delete_object.side_effect = delete_object
+
+    client = make_object_storage_client(object_storage)
+    args = SimpleNamespace(bucket_name="bucket", namespace=None, delete_rate=1000.0)
+
+    command.execute(client, args, make_console())
+
+    # Every delete eventually succeeds, but each throttled attempt still counts against the pool.
+    assert object_storage.delete_object.call_count == 8
+    assert command._object_delete_workers < command._max_object_delete_workers
+    object_storage.delete_bucket.assert_called_once_with("namespace", "bucket")
+
+
+def test_bucket_deletion_tunes_object_delete_workers_between_batches():
+    command = BucketDeletionCommand()
+    assert command._object_delete_workers == 32
+
+    for _ in range(90):
+        command._record_request(0.05, throttled=False)
+    for _ in range(10):
+        command._record_request(0.05, throttled=True)
+    command._tune_object_delete_workers()
+    assert command._object_delete_workers == 16
+
+    for _ in range(100):
+        command._record_request(0.05, throttled=False)
+    command._tune_object_delete_workers()
+    assert command._object_delete_workers == 32
+
+    # A clean batch whose latency jumped well above the running average does not grow.
+    for _ in range(100):
+        command._record_request(0.5, throttled=False)
+    command._tune_object_delete_workers()
+    assert command._object_delete_workers == 32
+
+
+def test_run_bounded_limits_in_flight_calls_and_labels_errors():
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def work(item):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        if item == 3:
+            raise ServiceError(status=500, code="InternalError", headers={}, message="boom")
+
+    errors, error_count = _run_bounded(
+        range(10), work, max_workers=2, label=lambda item: f"item-{item}"
+    )
+
+    assert peak <= 2
+    assert errors == ["item-3: InternalError - boom"]
+    assert error_count == 1
+
+
+def test_run_bounded_stops_dispatching_after_max_errors():
+    started = []
+
+    def work(item):
+        started.append(item)
+        raise ServiceError(status=403, code="NotAuthorized", headers={}, message="denied")
+
+    errors, error_count = _run_bounded(
+        range(1000), work, max_workers=2, label=lambda item: f"item-{item}", max_errors=5
+    )
+
+    assert len(errors) == 5
+    assert 5 <= error_count <= 7
+    assert len(started) == error_count
+
+
+def test_run_bounded_releases_completed_items():
+    class Item:
+        pass
+
+    alive = weakref.WeakSet()
+    lock = threading.Lock()
+    peak = 0
+
+    def items():
+        for _ in range(500):
+            item = Item()
+            alive.add(item)
+            yield item
+
+    def work(item):
+        nonlocal peak
+        with lock:
+            peak = max(peak, len(alive))
+
+    _run_bounded(items(), work, max_workers=4, label=lambda item: "item")
+
+    # Only in-flight items, the batch being drained and the one being submitted may
+    # still be referenced; completed work must not accumulate across the 500 items.
+    assert peak <= 2 * 4 + 2
+
+
+def test_interleave_by_prefix_round_robins_across_prefixes():
+    items = [
+        ("logs/a", "v1"),
+        ("logs/b", "v2"),
+        ("logs/c", "v3"),
+        ("media/x", "v4"),
+        ("media/y", "v5"),
+        ("root.txt", None),
+    ]
+
+    assert list(_interleave_by_prefix(items)) == [
+        ("logs/a", "v1"),
+        ("media/x", "v4"),
+        ("root.txt", None),
+        ("logs/b", "v2"),
+        ("media/y", "v5"),
+        ("logs/c", "v3"),
+    ]
+
+
+def test_bucket_listing_shrinks_page_size_when_throttled(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(resource_deletion.time, "sleep", sleeps.append)
+    command = BucketDeletionCommand()
+    object_storage = Mock()
+    object_storage.list_objects.side_effect = [
+        ServiceError(status=429, code="TooManyRequests", headers={}, message="slow down"),
+        FakeResponse(FakeCollection(objects=[SimpleNamespace(name="a")], next_start_with="b")),
+        FakeResponse(FakeCollection(objects=[SimpleNamespace(name="b")])),
+    ]
+
+    pages = list(command._iter_object_pages(object_storage.list_objects, "namespace", "bucket"))
+
+    assert [[obj.name for obj in page] for page in pages] == [["a"], ["b"]]
+    limits = [call.kwargs["limit"] for call in object_storage.list_objects.call_args_list]
+    starts = [call.kwargs["start"] for call in object_storage.list_objects.call_args_list]
+    assert limits == [500, 250, 500]
+    assert starts == [None, None, "b"]
+    assert len(sleeps) == 1 and sleeps[0] >= 2
+
+
 def test_bucket_deletion_ignores_missing_bucket():
     command = BucketDeletionCommand()
     object_storage = Mock()
-    object_storage.get_namespace.return_value = SimpleNamespace(data="namespace")
     object_storage.get_bucket.side_effect = ServiceError(
         status=404,
         code="BucketNotFound",
@@ -104,7 +451,7 @@ def test_bucket_deletion_ignores_missing_bucket():
         message="Bucket missing",
     )
 
-    client = SimpleNamespace(object_storage_client=object_storage)
+    client = make_object_storage_client(object_storage)
     args = SimpleNamespace(bucket_name="bucket", namespace=None)
 
     command.execute(client, args, make_console())
@@ -115,7 +462,6 @@ def test_bucket_deletion_ignores_missing_bucket():
 def test_bucket_deletion_surfaces_remaining_objects_error():
     command = BucketDeletionCommand()
     object_storage = Mock()
-    object_storage.get_namespace.return_value = SimpleNamespace(data="namespace")
     object_storage.get_bucket.return_value = SimpleNamespace(data=SimpleNamespace(versioning="Disabled"))
     object_storage.list_objects.return_value = FakeResponse(FakeCollection(objects=[]))
     object_storage.delete_bucket.side_effect = ServiceError(
@@ -125,7 +471,7 @@ def test_bucket_deletion_surfaces_remaining_objects_error():
         message="bucket contains objects",
     )
 
-    client = SimpleNamespace(object_storage_client=object_storage)
+    client = make_object_storage_client(object_storage)
     args = SimpleNamespace(bucket_name="bucket", namespace=None)
 
     with pytest.raises(ResourceDeletionError):
@@ -135,7 +481,7 @@ def test_bucket_deletion_surfaces_remaining_objects_error():
 def test_oke_cluster_deletion_with_node_pools():
     command = OKEDeletionCommand()
     command._work_request_poll_seconds = 0
-    command._work_request_max_attempts = 3
+    command._work_request_timeout_seconds = 5
 
     ce_client = Mock()
     ce_client.get_cluster.return_value = SimpleNamespace(
@@ -171,6 +517,41 @@ def test_oke_cluster_deletion_with_node_pools():
     ce_client.delete_cluster.assert_called_once_with("ocid1.cluster.oc1..example")
 
 
+def test_oke_cluster_deletion_stops_when_node_pool_work_request_fails():
+    command = OKEDeletionCommand()
+    command._work_request_poll_seconds = 0
+
+    ce_client = Mock()
+    ce_client.get_cluster.return_value = SimpleNamespace(
+        data=SimpleNamespace(name="cluster-name", compartment_id="compartment-id")
+    )
+    ce_client.list_node_pools.return_value = SimpleNamespace(
+        data=[
+            SimpleNamespace(id="nodepool1", name="np1"),
+            SimpleNamespace(id="nodepool2", name="np2"),
+        ],
+        next_page=None,
+    )
+    ce_client.delete_node_pool.side_effect = lambda node_pool_id: SimpleNamespace(
+        headers={"opc-work-request-id": f"wr-{node_pool_id}"}
+    )
+    ce_client.get_work_request.side_effect = lambda work_request_id: SimpleNamespace(
+        data=SimpleNamespace(status="FAILED" if work_request_id == "wr-nodepool2" else "SUCCEEDED")
+    )
+    ce_client.list_work_request_errors.return_value = SimpleNamespace(
+        data=[SimpleNamespace(message="boom")]
+    )
+
+    client = SimpleNamespace(container_engine_client=ce_client)
+    args = SimpleNamespace(cluster_id="ocid1.cluster.oc1..example", skip_node_pools=False)
+
+    with pytest.raises(ResourceDeletionError, match="np2"):
+        command.execute(client, args, make_console())
+
+    assert ce_client.delete_node_pool.call_count == 2
+    ce_client.delete_cluster.assert_not_called()
+
+
 def test_oke_cluster_deletion_skips_node_pools():
     command = OKEDeletionCommand()
     command._work_request_poll_seconds = 0
@@ -240,3 +621,35 @@ def test_oke_cluster_deletion_work_request_failure():
 
     with pytest.raises(ResourceDeletionError):
         command.execute(client, args, make_console())
+
+
+def test_wait_for_work_request_backs_off_and_times_out(monkeypatch):
+    command = OKEDeletionCommand()
+    command._work_request_timeout_seconds = 10
+
+    clock = {"now": 0.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(resource_deletion.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(resource_deletion.time, "sleep", fake_sleep)
+    monkeypatch.setattr(resource_deletion.random, "uniform", lambda low, high: 0.0)
+
+    ce_client = Mock()
+    ce_client.get_work_request.return_value = SimpleNamespace(
+        data=SimpleNamespace(status="IN_PROGRESS")
+    )
+
+    with pytest.raises(ResourceDeletionError, match="Timed out"):
+        command._wait_for_work_request(
+            ce_client=ce_client,
+            work_request_id="wr-slow",
+            console=make_console(),
+            resource_label="Cluster 'slow'",
+        )
+
+    assert sleeps[:3] == pytest.approx([1.0, 1.7, 2.89])
+    assert sum(sleeps) == pytest.approx(10.0)
@@ -0,0 +1,83 @@
+"""Tests for session utilities."""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.oci_client.utils import session
+
+
+@pytest.fixture
+def session_profile(tmp_path):
+    """Write an OCI config with one session-token profile and return its path."""
+    token_file = tmp_path / "token"
+    token_file.write_text("token")
+    config_file = tmp_path / "config"
+    config_file.write_text(
+        "[demo]\n"
+        "tenancy=ocid1.tenancy.oc1..xxxxx\n"
+        "region=us-phoenix-1\n"
+        f"security_token_file={token_file}\n"
+    )
+    session._read_profile_config.cache_clear()
+    session._token_validity_cache.clear()
+    yield str(config_file)
+    session._read_profile_config.cache_clear()
+    session._token_validity_cache.clear()
+
+
+def age_token(config_file, minutes):
+    """Backdate the profile's token file by the given number of minutes."""
+    token_file = os.path.join(os.path.dirname(config_file), "token")
+    backdated = time.time() - minutes * 60
+    os.utime(token_file, (backdated, backdated))
+
+
+def test_profile_config_is_parsed_once(session_profile):
+    """Test repeated token lookups reuse the parsed profile."""
+    with patch.object(
+        session.oci.config, "from_file", wraps=session.oci.config.from_file
+    ) as mock_from_file:
+        first = session.get_session_token_info("demo", session_profile)
+        second = session.get_session_token_info("demo", session_profile)
+
+    assert first["region"] == second["region"] == "us-phoenix-1"
+    assert first["age_minutes"] < 1
+    mock_from_file.assert_called_once()
+
+
+def test_missing_config_file_has_no_token_info(tmp_path):
+    """Test a missing OCI config reports no session token."""
+    assert session.get_session_token_info("demo", str(tmp_path / "missing")) is None
+    assert session.check_session_token_validity("demo", str(tmp_path / "missing")) is False
+
+
+def test_fresh_token_skips_live_probe(session_profile):
+    """Test a just-issued token is trusted without calling the API."""
+    with patch.object(session.oci.identity, "IdentityClient") as mock_identity:
+        assert session.check_session_token_validity("demo", session_profile) is True
+
+    mock_identity.assert_not_called()
+
+
+def test_live_probe_is_shared_for_same_token(session_profile):
+    """Test regions sharing a profile reuse one validity probe."""
+    age_token(session_profile, 20)
+
+    with patch.object(session.oci.identity, "IdentityClient") as mock_identity:
+        assert session.check_session_token_validity("demo", session_profile) is True
+        assert session.check_session_token_validity("demo", session_profile) is True
+
+    mock_identity.return_value.get_tenancy.assert_called_once()
+
+
+def test_expired_token_is_invalid(session_profile):
+    """Test tokens past the age limit are rejected without a probe."""
+    age_token(session_profile, 55)
+
+    with patch.object(session.oci.identity, "IdentityClient") as mock_identity:
+        assert session.check_session_token_validity("demo", session_profile) is False
+
+    mock_identity.assert_not_called()
@@ -0,0 +1,158 @@
+"""Tests for SSH config generation utilities."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.oci_client.models import BastionInfo, InstanceInfo, SSHConfigEntry
+from src.oci_client.utils import ssh_config_generator
+from src.oci_client.utils.ssh_config_generator import (
+    generate_ssh_config_entries,
+    write_ssh_config_file,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_region_caches():
+    """Start every test without cached region keys or internal domains."""
+    ssh_config_generator._region_key_cache.clear()
+    ssh_config_generator._internal_domain_cache.clear()
+    yield
+    ssh_config_generator._region_key_cache.clear()
+    ssh_config_generator._internal_domain_cache.clear()
+
+
+def make_entry(host="demo-dev-phx-oc1-1", entry_type="oke", **extra):
+    """Build a config entry as generate_ssh_config_entries returns it."""
+    return SSHConfigEntry(
+        host=host,
+        hostname="ocid1.bastion.oc1..b1-10.0.0.1",
+        proxy_command="ossh proxy -u %r",
+        type=entry_type,
+        instance_id="ocid1.instance.oc1..i1",
+        private_ip="10.0.0.1",
+        region="us-phoenix-1",
+        **extra,
+    )
+
+
+def test_write_ssh_config_file_replaces_existing_file(tmp_path):
+    """Test the config is rewritten in full and no temporary file is left behind."""
+    output_file = tmp_path / "configs" / "demo_dev.txt"
+    output_file.parent.mkdir()
+    output_file.write_text("stale\n")
+
+    write_ssh_config_file(
+        [make_entry(cluster="oke-a"), make_entry(host="odo-demo-dev-phx-oc1-1", entry_type="odo")],
+        str(output_file),
+        "demo",
+        "dev",
+    )
+
+    content = output_file.read_text()
+    assert content.startswith("# SSH Config for demo (dev)\n")
+    assert "# Total entries: 2\n\n" in content
+    assert "Host demo-dev-phx-oc1-1\n  HostName ocid1.bastion.oc1..b1-10.0.0.1\n" in content
+    assert "  # Cluster: oke-a\n" in content
+    assert "  # Type: ODO\n" in content
+    assert "stale" not in content
+    assert [path.name for path in output_file.parent.iterdir()] == ["demo_dev.txt"]
+
+
+def test_write_ssh_config_file_removes_temporary_file_on_failure(tmp_path, monkeypatch):
+    """Test a failed swap keeps the previous config and cleans up the temporary file."""
+    output_file = tmp_path / "demo_dev.txt"
+    output_file.write_text("previous\n")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ssh_config_generator.os, "replace", failing_replace)
+
+    with pytest.raises(OSError):
+        write_ssh_config_file([make_entry()], str(output_file), "demo", "dev")
+
+    assert output_file.read_text() == "previous\n"
+    assert [path.name for path in tmp_path.iterdir()] == ["demo_dev.txt"]
+
+
+def test_generate_ssh_config_entries_numbers_hosts_per_cluster():
+    """Test OKE hosts are numbered independently within each cluster."""
+    client = Mock()
+    client.get_region_info.return_value = Mock(key="phx")
+    client.get_internal_domain.return_value = "oraclecloud.com"
+    bastion = BastionInfo(
+        bastion_id="ocid1.bastion.oc1..b1",
+        bastion_name="bastion",
+        target_subnet_id="ocid1.subnet.oc1..s1",
+    )
+    client.find_bastion_for_subnet.return_value = bastion
+    oke_instances = [
+        InstanceInfo(
+            instance_id=f"ocid1.instance.oc1..{index}",
+            private_ip=f"10.0.0.{index}",
+            subnet_id="ocid1.subnet.oc1..s1",
+            cluster_name=cluster,
+        )
+        for index, cluster in enumerate(["a", "b", "a", None], 1)
+    ]
+
+    entries = generate_ssh_config_entries(
+        client,
+        oke_instances,
+        [],
+        [bastion],
+        "ocid1.compartment.oc1..c1",
+        "demo",
+        "dev",
+        "us-phoenix-1",
+    )
+
+    assert [(entry.cluster, entry.host) for entry in entries] == [
+        ("a", "demo-dev-phx-oc1-1"),
+        ("b", "demo-dev-phx-oc1-1"),
+        ("a", "demo-dev-phx-oc1-2"),
+        ("default", "demo-dev-phx-oc1-1"),
+    ]
+    assert entries[0].proxy_command == (
+        "ossh proxy -u %r --overlay-bastion --region us-phoenix-1 "
+        "--compartment ocid1.compartment.oc1..c1 -- ssh -A -p 22 "
+        "ztb-internal.bastion.us-phoenix-1.oci.oraclecloud.com -s proxy:%h:%p"
+    )
+    assert all(entry.proxy_command is entries[0].proxy_command for entry in entries)
+
+
+def test_region_lookups_are_reused_across_clients():
+    """Test a region's key and internal domain are fetched once for all its clients."""
+    first_client = Mock()
+    first_client.get_region_info.return_value = Mock(key="phx")
+    first_client.get_internal_domain.return_value = "oraclecloud.com"
+    second_client = Mock()
+
+    for client in (first_client, second_client):
+        generate_ssh_config_entries(
+            client, [], [], [], "ocid1.compartment.oc1..c1", "demo", "dev", "xx-newregion-1"
+        )
+
+    first_client.get_region_info.assert_called_once()
+    first_client.get_internal_domain.assert_called_once()
+    second_client.get_region_info.assert_not_called()
+    second_client.get_internal_domain.assert_not_called()
+
+
+def test_region_key_falls_back_to_region_name_without_caching():
+    """Test a failed region lookup uses the name-derived key and is retried next time."""
+    client = Mock()
+    client.get_region_info.side_effect = RuntimeError("boom")
+
+    assert ssh_config_generator._region_key(client, "xx-newregion-1") == "new"
+    assert ssh_config_generator._region_key(client, "xx-newregion-1") == "new"
+    assert client.get_region_info.call_count == 2
+
+
+def test_known_region_key_skips_region_lookup():
+    """Test public regions resolve their key from the built-in table."""
+    client = Mock()
+
+    assert ssh_config_generator._region_key(client, "us-phoenix-1") == "phx"
+    client.get_region_info.assert_not_called()
@@ -213,7 +213,15 @@ class TestSSHSync:
         # Verify
         assert result == 0  # Main returns 0 on success
         assert mock_process_region.call_count == 2  # Called for each region
+        mock_process_region.assert_any_call(
+            "test-project",
+            "dev",
+            "us-phoenix-1",
+            "ocid1.compartment.oc1..comp2",
+            profile_name="test_profile",
+        )
         assert mock_generate_ssh.call_count == 2  # Called for each region with instances
+        assert mock_setup_token.call_count == 2  # One session token setup per region
         mock_write_ssh.assert_called_once()
 
     @patch("src.ssh_sync.sys.exit")
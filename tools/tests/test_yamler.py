@@ -0,0 +1,53 @@
+"""Tests for yamler module."""
+
+import os
+
+import pytest
+
+from src.oci_client.utils import yamler
+from src.oci_client.utils.yamler import get_region_compartment_pairs
+
+CONFIG = """
+projects:
+  demo:
+    dev:
+      oc1:
+        us-phoenix-1:
+          compartment_id: {compartment_id}
+"""
+
+
+@pytest.fixture
+def meta_yaml(tmp_path):
+    """Write a minimal meta.yaml and return its path."""
+    path = tmp_path / "meta.yaml"
+    path.write_text(CONFIG.format(compartment_id="ocid1.compartment.oc1..first"))
+    yamler._parse_yaml.cache_clear()
+    return path
+
+
+def test_region_compartment_pairs_parse_file_once(meta_yaml):
+    """Test repeated lookups reuse the parsed document."""
+    for _ in range(3):
+        pairs = get_region_compartment_pairs(str(meta_yaml), "demo", "dev")
+
+    assert pairs == {"us-phoenix-1": "ocid1.compartment.oc1..first"}
+    assert yamler._parse_yaml.cache_info().misses == 1
+
+
+def test_region_compartment_pairs_reload_after_change(meta_yaml):
+    """Test an edited file is parsed again."""
+    get_region_compartment_pairs(str(meta_yaml), "demo", "dev")
+
+    meta_yaml.write_text(CONFIG.format(compartment_id="ocid1.compartment.oc1..second"))
+    mtime_ns = meta_yaml.stat().st_mtime_ns + 1_000_000
+    os.utime(meta_yaml, ns=(mtime_ns, mtime_ns))
+
+    pairs = get_region_compartment_pairs(str(meta_yaml), "demo", "dev")
+    assert pairs == {"us-phoenix-1": "ocid1.compartment.oc1..second"}
+
+
+def test_missing_file_raises_file_not_found(tmp_path):
+    """Test a missing config still raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        get_region_compartment_pairs(str(tmp_path / "missing.yaml"), "demo", "dev")